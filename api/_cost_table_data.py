@@ -0,0 +1,89 @@
+# 자동 생성 파일 - 직접 수정하지 마세요.
+# 원본: AracneCostTable.txt, AuthenticCostTable.txt, arcane_boss_list.txt, authentic_boss_list.txt
+# 재생성: python -m api.cost_table
+
+SOURCE_DIGEST = '21336f1006972c66fc6856acc744ef91ce679bfecae2b9140af3b2ec20bf3b7b'
+
+COST_TABLES = {
+    'Arcane': (
+        ('Yuro', 'ChewChew', 'Lecheln', 'Arcana', 'Morass', 'Esfera'),
+        (
+            (0, 0, 0, 0, 0, 0),
+            (970000, 1210000, 1450000, 1690000, 1930000, 2170000),
+            (1230000, 1530000, 1830000, 2130000, 2430000, 2730000),
+            (1660000, 2060000, 2460000, 2860000, 3260000, 3660000),
+            (2260000, 2800000, 3340000, 3880000, 4420000, 4960000),
+            (3060000, 3780000, 4500000, 5220000, 5940000, 6660000),
+            (4040000, 4980000, 5920000, 6860000, 7800000, 8740000),
+            (5220000, 6420000, 7620000, 8820000, 10020000, 11220000),
+            (6600000, 8100000, 9600000, 11100000, 12600000, 14100000),
+            (8180000, 10020000, 11860000, 13700000, 15540000, 17380000),
+            (9990000, 12210000, 14430000, 16650000, 18870000, 21090000),
+            (12010000, 14650000, 17290000, 19930000, 22570000, 25210000),
+            (14260000, 17360000, 20460000, 23560000, 26660000, 29760000),
+            (16740000, 20340000, 23940000, 27540000, 31140000, 34740000),
+            (19450000, 23590000, 27730000, 31870000, 36010000, 40150000),
+            (22420000, 27140000, 31860000, 36580000, 41300000, 46020000),
+            (25630000, 30970000, 36310000, 41650000, 46990000, 52330000),
+            (29100000, 35100000, 41100000, 47100000, 53100000, 59100000),
+            (32830000, 39530000, 46230000, 52930000, 59630000, 66330000),
+            (36820000, 44260000, 51700000, 59140000, 66580000, 74020000),
+        )
+    ),
+    'Authentic': (
+        ('Cernium', 'Arcs', 'Odium', 'Dowonkyung', 'Arteria', 'Carcion', 'Tallahart'),
+        (
+            (0, 0, 0, 0, 0, 0, 0),
+            (36500000, 41700000, 46900000, 52200000, 57400000, 62600000, 113600000),
+            (91200000, 104800000, 118500000, 132200000, 145900000, 159600000, 293300000),
+            (160700000, 186100000, 211500000, 236800000, 262200000, 287600000, 535800000),
+            (241900000, 282200000, 322500000, 362800000, 403200000, 443500000, 837700000),
+            (331500000, 390000000, 448500000, 507000000, 565500000, 624000000, 1196000000),
+            (426200000, 506100000, 586000000, 666000000, 745900000, 825800000, 1607200000),
+            (522900000, 627400000, 732000000, 836600000, 941200000, 1045800000, 2068300000),
+            (618200000, 750700000, 883200000, 1015600000, 1148100000, 1280600000, 2576000000),
+            (709000000, 872600000, 1036200000, 1199800000, 1363500000, 1527100000, 3126900000),
+            (792000000, 990000000, 1188000000, 1386000000, 1584000000, 1782000000, 3718000000),
+        )
+    ),
+}
+
+BOSS_FORCES = {
+    'Arcane': {
+        'EASY 루시드': 360,
+        'NORMAL 루시드': 360,
+        'HARD 루시드': 360,
+        'EASY 윌': 560,
+        'NORMAL 윌': 760,
+        'HARD 윌': 760,
+        'NORMAL 더스크': 730,
+        'CHAOS 더스크': 730,
+        'NORMAL 진 힐라': 820,
+        'HARD 진 힐라': 900,
+        'NORMAL 듄켈': 850,
+        'HARD 듄켈': 1380,
+        'HARD 검은 마법사': 1320,
+        'EXTREME 검은 마법사': 1320,
+    },
+    'Authentic': {
+        'NORMAL 세렌': 200,
+        'HARD 세렌': 200,
+        'EXTREME 세렌': 200,
+        'EASY 칼로스': 200,
+        'NORMAL 칼로스': 300,
+        'CHAOS 칼로스': 330,
+        'EXTREME 칼로스': 440,
+        'EASY 최초의 대적자': 220,
+        'NORMAL 최초의 대적자': 320,
+        'HARD 최초의 대적자': 320,
+        'EXTREME 최초의 대적자': 460,
+        'EASY 카링': 230,
+        'NORMAL 카링': 330,
+        'HARD 카링': 350,
+        'EXTREME 카링': 480,
+        'NORMAL 림보': 500,
+        'HARD 림보': 500,
+        'NORMAL 발드릭스': 700,
+        'HARD 발드릭스': 700,
+    },
+}
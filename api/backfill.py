@@ -0,0 +1,243 @@
+"""
+캐릭터 이력 백필 모듈
+
+Nexon Open API의 date 파라미터로 지난 날짜의 스냅샷을 일괄 조회해 저장소에 기록합니다.
+이미 저장된 (ocid, 기준일)은 건너뛰므로, 중단된 작업은 같은 인자로 다시 실행하면 이어서 진행합니다.
+
+    python -m api.backfill 캐릭터1 캐릭터2 --start 2024-01-01 --end 2024-01-31
+"""
+import argparse
+import asyncio
+import json
+import time
+import uuid
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+from .config import env_int
+from .logger import logger
+from .maple import AsyncMapleStoryAPI, CharacterBasic, CharacterBasicData, CharacterStatData, SymbolEquipmentData
+from .ratelimit import PRIORITY_BACKGROUND
+from .store import KST, CharacterStore, create_store_from_env
+
+BACKFILL_CONCURRENCY = env_int("BACKFILL_CONCURRENCY", 8)
+BACKFILL_BATCH_SIZE = env_int("BACKFILL_BATCH_SIZE", 50)
+BACKFILL_MAX_SNAPSHOTS = env_int("BACKFILL_MAX_SNAPSHOTS", 20000)
+
+# Nexon Open API가 date 파라미터로 제공하는 가장 이른 기준일
+EARLIEST_DATE = date(2023, 12, 21)
+
+# 작업별로 보관하는 오류 메시지 최대 수
+MAX_ERRORS = 100
+
+
+def latest_backfill_date() -> date:
+    """date 파라미터로 조회 가능한 마지막 기준일 (KST 기준 어제)"""
+    return datetime.now(KST).date() - timedelta(days=1)
+
+
+def date_range(start: date, end: date) -> List[date]:
+    """start부터 end까지(양 끝 포함) 날짜 목록"""
+    return [start + timedelta(days=offset) for offset in range((end - start).days + 1)]
+
+
+class BackfillJob:
+    """백필 작업 하나의 진행 상황"""
+
+    def __init__(self, names: Sequence[str], start: date, end: Optional[date] = None):
+        """
+        Args:
+            names: 캐릭터 이름 목록
+            start: 시작일 (포함)
+            end: 종료일 (포함, 기본값: 어제)
+
+        Raises:
+            ValueError: 기간이 잘못되었거나 조회 수가 너무 많은 경우
+        """
+        end = end or latest_backfill_date()
+        if start > end:
+            raise ValueError("시작일은 종료일보다 늦을 수 없습니다")
+        if start < EARLIEST_DATE:
+            raise ValueError(f"{EARLIEST_DATE.isoformat()} 이전 데이터는 조회할 수 없습니다")
+        if end > latest_backfill_date():
+            raise ValueError("종료일은 어제(KST) 이전이어야 합니다")
+
+        self.names = list(dict.fromkeys(names))
+        self.days = date_range(start, end)
+        if len(self.names) * len(self.days) > BACKFILL_MAX_SNAPSHOTS:
+            raise ValueError(f"한 번에 백필할 수 있는 스냅샷은 최대 {BACKFILL_MAX_SNAPSHOTS}개입니다")
+
+        self.job_id = uuid.uuid4().hex[:12]
+        self.start = start
+        self.end = end
+        self.state = "pending"
+        self.total = len(self.names) * len(self.days)
+        self.fetched = 0
+        self.skipped = 0
+        self.failed = 0
+        self.errors: List[Dict[str, Optional[str]]] = []
+        self.started_at: Optional[float] = None
+        self.finished_at: Optional[float] = None
+
+    def record_error(self, character_name: str, day: Optional[date], error: BaseException, count: int = 1) -> None:
+        self.failed += count
+        if len(self.errors) < MAX_ERRORS:
+            self.errors.append({
+                "character_name": character_name,
+                "date": day.isoformat() if day else None,
+                "error": str(error)
+            })
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "job_id": self.job_id,
+            "state": self.state,
+            "names": self.names,
+            "start": self.start.isoformat(),
+            "end": self.end.isoformat(),
+            "total": self.total,
+            "fetched": self.fetched,
+            "skipped": self.skipped,
+            "failed": self.failed,
+            "errors": self.errors,
+            "started_at": self.started_at,
+            "finished_at": self.finished_at
+        }
+
+
+async def run_backfill(api: AsyncMapleStoryAPI, store: CharacterStore, job: BackfillJob,
+                       concurrency: int = BACKFILL_CONCURRENCY, batch_size: int = BACKFILL_BATCH_SIZE) -> BackfillJob:
+    """
+    백필 작업 실행
+
+    조회는 concurrency개의 작업자가 대기열에서 하나씩 꺼내 속도 제한기의 백그라운드 우선순위로
+    수행하므로 기간이 길어도 동시에 만들어지는 태스크 수가 늘지 않고 대화형 요청을 밀어내지 않으며,
+    결과는 batch_size개씩 모아 한 트랜잭션으로 저장합니다.
+
+    Args:
+        api: 비동기 API 클라이언트
+        store: 스냅샷 저장소
+        job: 실행할 작업
+        concurrency: 동시에 조회할 (캐릭터, 기준일) 수
+        batch_size: 한 번에 저장할 스냅샷 수
+
+    Returns:
+        BackfillJob: 완료된 작업 (진행 상황은 실행 중에도 job에서 확인 가능)
+    """
+    job.state = "running"
+    job.started_at = time.time()
+    pending: List[Tuple[str, CharacterBasicData, SymbolEquipmentData, CharacterStatData]] = []
+
+    async def flush() -> None:
+        if pending:
+            batch = pending[:]
+            pending.clear()
+            await asyncio.to_thread(store.upsert_many, batch)
+            logger.info(f"💽 백필 저장 ({job.job_id}): {job.fetched + job.skipped + job.failed}/{job.total}")
+
+    async def fetch_day(ocid: str, character_name: str, day: date) -> None:
+        try:
+            basic, symbol, stat = await asyncio.gather(
+                api.get_character_basic(ocid, PRIORITY_BACKGROUND, day),
+                api.get_character_symbol_equipment(ocid, PRIORITY_BACKGROUND, day),
+                api.get_character_stat(ocid, PRIORITY_BACKGROUND, day)
+            )
+        except Exception as e:
+            job.record_error(character_name, day, e)
+            return
+
+        # 기준일이 비어 있는 응답은 요청한 기준일로 저장
+        if basic.date is None and symbol.date is None and stat.date is None:
+            day_start = datetime.combine(day, datetime.min.time(), KST)
+            if isinstance(basic, CharacterBasic):
+                basic = basic.model_copy(update={"date": day_start})
+            else:
+                basic = basic._replace(date=day_start.isoformat())
+        pending.append((ocid, basic, symbol, stat))
+        job.fetched += 1
+        if len(pending) >= batch_size:
+            await flush()
+
+    todo: List[Tuple[str, str, date]] = []
+
+    async def resolve(character_name: str) -> None:
+        """캐릭터의 OCID를 조회하고 아직 저장되지 않은 기준일을 todo에 추가"""
+        try:
+            ocid = (await api.get_character_ocid(character_name, PRIORITY_BACKGROUND)).ocid
+        except Exception as e:
+            job.record_error(character_name, None, e, count=len(job.days))
+            return
+        existing = await asyncio.to_thread(store.existing_dates, ocid, job.start, job.end)
+        days = [day for day in job.days if day.isoformat() not in existing]
+        todo.extend((ocid, character_name, day) for day in days)
+        job.skipped += len(job.days) - len(days)
+
+    try:
+        await _run_workers(concurrency, resolve, ((name,) for name in job.names))
+        await _run_workers(concurrency, fetch_day, todo)
+        await flush()
+        job.state = "done"
+    except asyncio.CancelledError:
+        # 이미 받은 결과는 저장해 두어 다음 실행에서 이어서 진행
+        await asyncio.shield(flush())
+        job.state = "cancelled"
+        raise
+    except Exception as e:
+        job.state = "failed"
+        logger.error(f"❌ 백필 실패 ({job.job_id}): {e}")
+    finally:
+        job.finished_at = time.time()
+
+    logger.info(f"✅ 백필 완료 ({job.job_id}): 조회 {job.fetched}, 건너뜀 {job.skipped}, 실패 {job.failed}")
+    return job
+
+
+async def _run_workers(concurrency: int, handler: Callable[..., Awaitable[None]],
+                       items: Iterable[Tuple]) -> None:
+    """concurrency개의 작업자가 items를 하나씩 꺼내 handler로 처리 (작업자 하나가 실패하면 나머지 취소)"""
+    queue = iter(items)
+
+    async def worker() -> None:
+        for item in queue:
+            await handler(*item)
+
+    workers = [asyncio.ensure_future(worker()) for _ in range(max(1, concurrency))]
+    try:
+        await asyncio.gather(*workers)
+    finally:
+        for task in workers:
+            task.cancel()
+
+
+async def _main(args: argparse.Namespace) -> int:
+    store = create_store_from_env()
+    if store is None:
+        raise SystemExit("백필하려면 CHARACTER_STORE_PATH에 저장 파일 경로를 지정하세요")
+
+    job = BackfillJob(args.names, args.start, args.end)
+    api = AsyncMapleStoryAPI()
+    try:
+        await run_backfill(api, store, job, concurrency=args.concurrency, batch_size=args.batch_size)
+    finally:
+        await api.aclose()
+
+    print(json.dumps(job.to_dict(), ensure_ascii=False, indent=2))
+    return 0 if job.state == "done" and job.failed == 0 else 1
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="캐릭터 일별 스냅샷 백필")
+    parser.add_argument("names", nargs="+", help="캐릭터 이름")
+    parser.add_argument("--start", type=date.fromisoformat, required=True, help="시작일 (YYYY-MM-DD)")
+    parser.add_argument("--end", type=date.fromisoformat, default=None, help="종료일 (YYYY-MM-DD, 기본값: 어제)")
+    parser.add_argument("--concurrency", type=int, default=BACKFILL_CONCURRENCY, help="동시 조회 수")
+    parser.add_argument("--batch-size", type=int, default=BACKFILL_BATCH_SIZE, help="한 번에 저장할 스냅샷 수")
+    args = parser.parse_args(argv)
+
+    try:
+        return asyncio.run(_main(args))
+    except ValueError as e:
+        parser.error(str(e))
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
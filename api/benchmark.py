@@ -0,0 +1,356 @@
+"""
+최적화 / API 벤치마크 모듈
+
+MapleService.optimize_force를 포스 타입 × 시작 상태 × solver 조합으로,
+/api/optimize/force와 /api/character/{name}/init을 ASGI 앱을 통해 끝까지 측정합니다.
+Nexon Open API 호출은 기록된 응답(benchmark_responses.json)을 돌려주는 httpx.MockTransport로 대체하므로
+API 키나 네트워크 없이 실행할 수 있습니다.
+
+처리량, p50/p99 지연, 요청당 최대 할당 메모리(tracemalloc)를 출력하고 저장된 기준값과 비교해
+허용 배수를 넘으면 종료 코드 1로 실패합니다. 라운드마다 새 프로세스에서 모든 항목을 측정해 지연은 가장 빠른 라운드,
+할당은 라운드별 중앙값을 사용하고, 지연 허용치는 고정 작업(calibration)으로 잰 실행 환경이 느린 만큼 늘리므로
+다른 작업이 CPU를 쓰거나 다른 기기에서 실행해도 회귀가 없으면 통과합니다.
+
+할당은 호출 횟수가 아닌 최대 할당 바이트로 측정합니다. CPython은 호출 하나가 할당한 블록 수를 세는 방법을
+제공하지 않으며 (sys.getallocatedblocks / tracemalloc 스냅샷은 해제되지 않고 남은 블록만 셈),
+최대 할당 바이트는 같은 의존성 버전에서 실행마다 같게 나옵니다. 의존성 버전이 바뀌면 값도 바뀌므로
+기준값은 uv.lock 버전으로 --update-baseline을 실행해 갱신합니다.
+
+    python -m api.benchmark                    # 측정 후 기준값과 비교
+    python -m api.benchmark --update-baseline  # 현재 결과를 기준값으로 저장
+"""
+import argparse
+import asyncio
+import json
+import itertools
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+import httpx
+from .cache import CacheManager, OcidCache
+from .logger import set_debug_level
+from .maple import AsyncMapleStoryAPI
+from .ratelimit import RateLimiter
+from .service import MapleService, get_maple_service
+from .standin import API_PREFIX, RECORDED_RESPONSES, load_recorded_responses, recorded_response
+
+BASELINE_PATH = Path(__file__).parent / "benchmark_baseline.json"
+
+# 기준값 대비 허용 배수와, 이보다 작은 차이는 측정 오차로 보는 절대 여유
+DEFAULT_TOLERANCE = 1.5
+MIN_LATENCY_SLACK_MS = 0.05
+MIN_ALLOC_SLACK_KIB = 4.0
+
+# 할당 측정은 tracemalloc 오버헤드가 커서 별도로 적은 횟수만 실행
+ALLOC_SAMPLES = 20
+
+# 측정 라운드 수 (라운드마다 새 프로세스에서 실행)
+DEFAULT_ROUNDS = 7
+
+# 실행 환경의 속도를 재는 고정 작업 항목 (기준값보다 이 항목이 느린 만큼 지연 허용치를 늘림)
+CALIBRATION_CASE = "calibration"
+
+# 포스 타입별 시작 심볼 레벨과 목표 포스 (캐릭터 레벨 300: 모든 지역 해금)
+OPTIMIZER_STATES = {
+    "Arcane": {
+        "fresh": [1, 1, 1, 1, 1, 1],
+        "mid": [20, 20, 17, 12, 8, 3],
+        "near_max": [20, 20, 20, 20, 20, 18]
+    },
+    "Authentic": {
+        "fresh": [1, 1, 1, 1, 1, 1, 1],
+        "mid": [11, 9, 6, 3, 1, 1, 0],
+        "near_max": [11, 11, 11, 11, 11, 10, 8]
+    }
+}
+OPTIMIZER_GOALS = {
+    "Arcane": [360, 660, 960, 1320],
+    "Authentic": [100, 330, 550, 770]
+}
+CHAR_LEVEL = 300
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """정렬된 표본의 백분위 (nearest-rank)"""
+    index = min(len(samples) - 1, max(0, int(round(q * len(samples))) - 1))
+    return samples[index]
+
+
+def summarize(durations: List[float], peaks: List[int]) -> Dict[str, float]:
+    """한 라운드의 측정값(초, 바이트)을 처리량 / 지연(ms) / 할당 중앙값(KiB)으로 요약"""
+    durations = sorted(durations)
+    return {
+        "ops_per_sec": round(len(durations) / sum(durations), 1),
+        "p50_ms": round(percentile(durations, 0.50) * 1000, 4),
+        "p99_ms": round(percentile(durations, 0.99) * 1000, 4),
+        "peak_kib": round(statistics.median(peaks) / 1024, 2)
+    }
+
+
+def combine_rounds(rounds: List[Dict[str, float]]) -> Dict[str, float]:
+    """
+    라운드별 요약 합치기
+
+    지연 / 처리량은 p50이 가장 짧은 라운드 값을 사용하고 (CPU를 나눠 쓰는 잡음이나 프로세스별 메모리 배치 차이는
+    시간을 늘리기만 하므로), 할당은 라운드별 값의 중앙값을 사용합니다.
+    """
+    fastest = min(rounds, key=lambda r: r["p50_ms"])
+    return {**fastest, "peak_kib": round(statistics.median(r["peak_kib"] for r in rounds), 2)}
+
+
+def measure(fn: Callable[[int], Any], iterations: int, warmup: int) -> Dict[str, float]:
+    """fn(i)를 반복 실행하며 지연과 요청당 최대 할당 측정"""
+    for i in range(warmup):
+        fn(i)
+
+    durations = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        fn(i)
+        durations.append(time.perf_counter() - start)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(min(iterations, ALLOC_SAMPLES)):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            fn(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return summarize(durations, peaks)
+
+
+async def ameasure(fn: Callable[[int], Awaitable[Any]], iterations: int, warmup: int) -> Dict[str, float]:
+    """비동기 버전 measure"""
+    for i in range(warmup):
+        await fn(i)
+
+    durations = []
+    for i in range(iterations):
+        start = time.perf_counter()
+        await fn(i)
+        durations.append(time.perf_counter() - start)
+
+    peaks = []
+    tracemalloc.start()
+    try:
+        for i in range(min(iterations, ALLOC_SAMPLES)):
+            tracemalloc.reset_peak()
+            baseline, _ = tracemalloc.get_traced_memory()
+            await fn(i)
+            peaks.append(tracemalloc.get_traced_memory()[1] - baseline)
+    finally:
+        tracemalloc.stop()
+    return summarize(durations, peaks)
+
+
+def calibration_workload(i: int) -> int:
+    """서비스 코드와 무관한 고정 순수 파이썬 작업 (실행 환경 속도 측정용)"""
+    table = {}
+    for n in range(2000):
+        table[n % 97] = table.get(n % 97, 0) + n * n
+    return sorted(table.values())[-1]
+
+
+def recorded_transport(path: Path = RECORDED_RESPONSES) -> httpx.MockTransport:
+    """기록된 Nexon Open API 응답을 돌려주는 httpx 전송 계층 (대역 서버와 같은 응답)"""
+    responses = load_recorded_responses(path)
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        endpoint = request.url.path.split(API_PREFIX, 1)[-1]
+        status, body = recorded_response(responses, endpoint, request.url.params)
+        return httpx.Response(status, json=body)
+
+    return httpx.MockTransport(handler)
+
+
+def create_benchmark_service() -> MapleService:
+    """기록된 응답 / 무제한 속도 제한 / 캐시·저장소 없이 동작하는 서비스"""
+    service = MapleService(api_key="benchmark")
+    service.store = None
+    api = AsyncMapleStoryAPI(
+        api_key="benchmark",
+        ocid_cache=OcidCache(),
+        cache=CacheManager(cache_dir=None, enabled=False),
+        rate_limiter=RateLimiter(rate=1_000_000)
+    )
+    api.client = httpx.AsyncClient(transport=recorded_transport(), headers=api._headers())
+    service._async_api = api
+    return service
+
+
+def optimizer_cases(service: MapleService) -> Dict[str, Callable[[int], Any]]:
+    """optimize_force 측정 대상 (cold: 결과/프론티어 캐시 없이 계산, cached: 결과 캐시 적중)"""
+    cases = {}
+    for force_type, states in OPTIMIZER_STATES.items():
+        goals = OPTIMIZER_GOALS[force_type]
+        for state, levels in states.items():
+            for solver in ("greedy", "exact"):
+                def cold(i: int, force_type=force_type, levels=levels, goals=goals, solver=solver) -> Dict:
+                    service._frontier_cache.clear()
+                    return service._optimize_force(force_type, goals[i % len(goals)], CHAR_LEVEL, 0, levels, solver)
+
+                cases[f"optimize/{force_type}/{state}/{solver}"] = cold
+
+            def frontier(i: int, force_type=force_type, levels=levels) -> Dict:
+                service._frontier_cache.clear()
+                return service.get_force_frontier_points(force_type, CHAR_LEVEL, 0, levels)
+
+            cases[f"frontier/{force_type}/{state}"] = frontier
+
+    def cached(i: int) -> Dict:
+        return service.optimize_force("Arcane", 1320, CHAR_LEVEL, 0, OPTIMIZER_STATES["Arcane"]["mid"], "exact")
+
+    cases["optimize/cached"] = cached
+    return cases
+
+
+async def run_api_cases(service: MapleService, iterations: int, warmup: int) -> Dict[str, Dict[str, float]]:
+    """ASGI 앱을 통한 엔드포인트 측정 (업스트림 API는 기록된 응답)"""
+    from .main import app
+
+    app.dependency_overrides[get_maple_service] = lambda: service
+    results = {}
+    try:
+        async with httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench") as client:
+            async def optimize(i: int) -> None:
+                response = await client.post("/api/optimize/force", json={
+                    "force_type": "Arcane",
+                    "char_level": CHAR_LEVEL,
+                    "current_force": 0,
+                    "symbol_levels": OPTIMIZER_STATES["Arcane"]["mid"],
+                    "force_goal": OPTIMIZER_GOALS["Arcane"][i % 4],
+                    "solver": "exact"
+                })
+                response.raise_for_status()
+
+            names = itertools.count()
+
+            async def init(i: int) -> None:
+                # 캐릭터마다 새로 조회하도록 이름을 매번 바꿈 (스냅샷 캐시 미적중 경로)
+                response = await client.get(f"/api/character/벤치{next(names)}/init")
+                response.raise_for_status()
+
+            results["api/optimize_force"] = await ameasure(optimize, iterations, warmup)
+            results["api/init"] = await ameasure(init, iterations, warmup)
+    finally:
+        app.dependency_overrides.pop(get_maple_service, None)
+        await service.aclose()
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            tolerance: float) -> List[str]:
+    """
+    기준값 대비 p50 지연 / 할당이 허용 배수를 넘은 항목 목록
+
+    지연 허용치는 calibration 항목이 기준값보다 느린 비율만큼 늘려 실행 환경 자체가 느린 것을 회귀로 보지 않습니다.
+    (calibration 측정도 잡음이 있으므로 더 빠르게 나왔다고 허용치를 줄이지는 않음)
+    """
+    calibration, base_calibration = results.get(CALIBRATION_CASE), baseline.get(CALIBRATION_CASE)
+    speed = calibration["p50_ms"] / base_calibration["p50_ms"] if calibration and base_calibration else 1.0
+    speed = max(1.0, speed)
+
+    regressions = []
+    for name, result in results.items():
+        base = baseline.get(name)
+        if base is None or name == CALIBRATION_CASE:
+            continue
+        for metric, slack, scale in (("p50_ms", MIN_LATENCY_SLACK_MS, speed), ("peak_kib", MIN_ALLOC_SLACK_KIB, 1.0)):
+            limit = max(base[metric] * tolerance, base[metric] + slack) * scale
+            if result[metric] > limit:
+                regressions.append(f"{name} {metric}: {result[metric]} > {limit:.4g} (기준 {base[metric]})")
+    return regressions
+
+
+def print_table(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]]) -> None:
+    print(f"{'case':<40} {'ops/s':>10} {'p50 ms':>10} {'p99 ms':>10} {'KiB':>9} {'p50 vs base':>12}")
+    for name, result in results.items():
+        base = baseline.get(name)
+        ratio = f"{result['p50_ms'] / base['p50_ms']:.2f}x" if base and base["p50_ms"] else "-"
+        print(f"{name:<40} {result['ops_per_sec']:>10} {result['p50_ms']:>10} {result['p99_ms']:>10} "
+              f"{result['peak_kib']:>9} {ratio:>12}")
+
+
+def run_round(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """현재 프로세스에서 모든 항목을 한 번씩 측정"""
+    set_debug_level("WARNING")
+    service = create_benchmark_service()
+    results = {CALIBRATION_CASE: measure(calibration_workload, args.iterations, args.warmup)}
+
+    if args.only in (None, "optimizer"):
+        for name, fn in optimizer_cases(service).items():
+            results[name] = measure(fn, args.iterations, args.warmup)
+    if args.only in (None, "api"):
+        results.update(asyncio.run(run_api_cases(service, args.api_iterations, args.warmup)))
+    return results
+
+
+def run_rounds(args: argparse.Namespace) -> Dict[str, Dict[str, float]]:
+    """라운드마다 새 프로세스에서 run_round를 실행하고 항목별로 합침"""
+    command = [sys.executable, "-m", __spec__.name, "--worker",
+               "--iterations", str(args.iterations), "--api-iterations", str(args.api_iterations),
+               "--warmup", str(args.warmup)]
+    if args.only:
+        command += ["--only", args.only]
+
+    rounds = []
+    for _ in range(max(1, args.rounds)):
+        output = subprocess.run(command, check=True, stdout=subprocess.PIPE, text=True).stdout
+        rounds.append(json.loads(output))
+    return {name: combine_rounds([r[name] for r in rounds]) for name in rounds[0]}
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="최적화 / API 벤치마크")
+    parser.add_argument("--iterations", type=int, default=200, help="최적화 항목별 반복 횟수")
+    parser.add_argument("--api-iterations", type=int, default=100, help="엔드포인트 항목별 반복 횟수")
+    parser.add_argument("--warmup", type=int, default=10, help="측정 전 예열 횟수")
+    parser.add_argument("--rounds", type=int, default=DEFAULT_ROUNDS, help="측정 라운드(프로세스) 수")
+    parser.add_argument("--only", choices=["optimizer", "api"], default=None, help="한 종류만 측정")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE, help="기준값 대비 허용 배수")
+    parser.add_argument("--baseline", type=Path, default=BASELINE_PATH, help="기준값 파일")
+    parser.add_argument("--update-baseline", action="store_true", help="현재 결과를 기준값으로 저장")
+    parser.add_argument("--worker", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        print(json.dumps(run_round(args)))
+        return 0
+
+    results = run_rounds(args)
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8")) if args.baseline.exists() else {}
+    print_table(results, baseline)
+
+    if args.update_baseline:
+        args.baseline.write_text(json.dumps({**baseline, **results}, indent=2, sort_keys=True) + "\n",
+                                 encoding="utf-8")
+        print(f"✅ 기준값 저장: {args.baseline}")
+        return 0
+
+    if not baseline:
+        print("⚠️ 기준값이 없습니다. --update-baseline으로 먼저 저장하세요.")
+        return 0
+
+    regressions = compare(results, baseline, args.tolerance)
+    if CALIBRATION_CASE in baseline:
+        speed = results[CALIBRATION_CASE]["p50_ms"] / baseline[CALIBRATION_CASE]["p50_ms"]
+        print(f"\n⏱️ 실행 환경 속도: 기준값 대비 {speed:.2f}배 시간 (느린 만큼 지연 허용치에 반영)")
+    if regressions:
+        print(f"\n❌ 성능 회귀 {len(regressions)}건 (허용 배수 {args.tolerance}):")
+        for line in regressions:
+            print(f"  - {line}")
+        return 1
+
+    print(f"\n✅ 기준값 대비 회귀 없음 (허용 배수 {args.tolerance})")
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
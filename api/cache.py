@@ -1,22 +1,234 @@
 """
 캐시 관리 모듈
 """
+import hashlib
 import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Hashable, Tuple
+from .config import env_bool, env_float, env_int, env_str
 from .logger import logger, log_cache_usage
 
+
+class LRUCache:
+    """크기 제한과 항목별 TTL을 지원하는 스레드 안전 메모리 LRU 캐시"""
+
+    def __init__(self, maxsize: int = 1024, ttl: Optional[float] = None, max_bytes: Optional[int] = None):
+        """
+        Args:
+            maxsize: 최대 항목 수
+            ttl: 기본 만료 시간(초), None이면 만료 없음
+            max_bytes: 항목 크기 합계 상한 (set의 size 기준), None이면 제한 없음
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self._bytes = 0
+        self._data: "OrderedDict[Hashable, Tuple[Any, Optional[float], int]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        캐시된 값 조회 (조회된 항목은 가장 최근 사용으로 갱신)
+
+        Args:
+            key: 캐시 키
+            default: 캐시에 없거나 만료되었을 때 반환할 값
+
+        Returns:
+            캐시된 값 또는 default
+        """
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                value, expires_at, _ = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return value
+                self._remove(key)
+            self.misses += 1
+            return default
+
+    def set(self, key: Hashable, value: Any, ttl: Optional[float] = None, size: int = 0) -> None:
+        """
+        값 저장 (용량 초과 시 가장 오래 사용되지 않은 항목 제거)
+
+        Args:
+            key: 캐시 키
+            value: 저장할 값
+            ttl: 이 항목의 만료 시간(초), None이면 기본 TTL 사용
+            size: 항목 크기 (max_bytes 계산용)
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = None if ttl is None else time.monotonic() + ttl
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                self._remove(key)
+                return
+            self._remove(key)
+            self._data[key] = (value, expires_at, size)
+            self._bytes += size
+            while len(self._data) > self.maxsize or (self.max_bytes is not None and self._bytes > self.max_bytes):
+                _, (_, _, evicted_size) = self._data.popitem(last=False)
+                self._bytes -= evicted_size
+
+    def _remove(self, key: Hashable) -> None:
+        entry = self._data.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry[2]
+
+    def delete(self, key: Hashable) -> None:
+        """항목 삭제"""
+        with self._lock:
+            self._remove(key)
+
+    def clear(self) -> None:
+        """모든 항목 및 통계 초기화"""
+        with self._lock:
+            self._data.clear()
+            self._bytes = 0
+            self.hits = 0
+            self.misses = 0
+
+    def stats(self) -> Dict[str, int]:
+        """캐시 크기 및 적중 통계"""
+        with self._lock:
+            return {
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "bytes": self._bytes,
+                "hits": self.hits,
+                "misses": self.misses
+            }
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class OcidCache:
+    """
+    캐릭터 이름 → OCID 조회 응답 캐시
+
+    OCID는 거의 바뀌지 않으므로 긴 TTL로 보관하고, '캐릭터 없음' 응답은
+    짧은 TTL로 보관해 오타 반복 조회가 업스트림 API로 가지 않게 합니다.
+    persist_path를 지정하면 정상 응답을 JSON Lines 파일에 추가 기록해 재시작 후에도 유지합니다.
+    """
+
+    def __init__(self, maxsize: int = 10000, ttl: float = 7 * 24 * 3600, negative_ttl: float = 300,
+                 persist_path: Optional[str] = None):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.persist_path = Path(persist_path) if persist_path else None
+        self._cache = LRUCache(maxsize=maxsize, ttl=ttl)
+        self._file_lock = threading.Lock()
+        if self.persist_path:
+            self._load()
+
+    def get(self, character_name: str) -> Optional[Dict[str, Any]]:
+        """캐시된 OCID 응답 ({"ocid": ...} 또는 {"error": ...}) 조회, 없으면 None"""
+        return self._cache.get(character_name)
+
+    def set(self, character_name: str, response_data: Dict[str, Any]) -> None:
+        """정상 OCID 응답 저장"""
+        self._cache.set(character_name, response_data)
+        if self.persist_path:
+            self._append(character_name, response_data["ocid"], time.time() + self.ttl)
+
+    def set_missing(self, character_name: str, response_data: Dict[str, Any]) -> None:
+        """'캐릭터 없음' 응답을 짧은 TTL로 저장 (디스크에는 기록하지 않음)"""
+        self._cache.set(character_name, response_data, ttl=self.negative_ttl)
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
+
+    def _append(self, character_name: str, ocid: str, expires_at: float) -> None:
+        line = json.dumps({"name": character_name, "ocid": ocid, "expires_at": expires_at},
+                          ensure_ascii=False, separators=(",", ":"))
+        try:
+            with self._file_lock, open(self.persist_path, 'a', encoding='utf-8') as f:
+                f.write(line + "\n")
+        except IOError as e:
+            logger.error(f"OCID 캐시 저장 실패: {e}")
+
+    def _load(self) -> None:
+        """파일에서 만료되지 않은 항목을 읽고, 중복/만료 항목을 제거해 다시 기록"""
+        if not self.persist_path.exists():
+            return
+
+        now = time.time()
+        entries: Dict[str, Tuple[str, float]] = {}
+        try:
+            with open(self.persist_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        entry = json.loads(line)
+                    except json.JSONDecodeError:
+                        continue
+                    if entry["expires_at"] > now:
+                        entries[entry["name"]] = (entry["ocid"], entry["expires_at"])
+        except IOError as e:
+            logger.error(f"OCID 캐시 로드 실패: {e}")
+            return
+
+        for name, (ocid, expires_at) in entries.items():
+            self._cache.set(name, {"ocid": ocid}, ttl=expires_at - now)
+
+        # 압축된 내용을 임시 파일에 쓴 뒤 교체
+        tmp_path = self.persist_path.with_suffix(self.persist_path.suffix + ".tmp")
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                for name, (ocid, expires_at) in entries.items():
+                    f.write(json.dumps({"name": name, "ocid": ocid, "expires_at": expires_at},
+                                       ensure_ascii=False, separators=(",", ":")) + "\n")
+            os.replace(tmp_path, self.persist_path)
+        except IOError as e:
+            logger.error(f"OCID 캐시 정리 실패: {e}")
+        logger.info(f"📋 OCID 캐시 로드: {len(entries)}개")
+
+
 class CacheManager:
-    """API 응답 캐시 관리자"""
+    """
+    API 응답 2단계 캐시 관리자
 
-    def __init__(self, cache_dir: str = "result"):
-        self.cache_dir = Path(cache_dir)
-        self.cache_enabled = False
-        self._ensure_cache_dir()
+    1단계는 바이트 크기 제한이 있는 프로세스 내 LRU, 2단계는 항목별 TTL을 가진
+    디스크 저장소입니다. 디스크 항목은 키의 해시를 파일명으로 하는 압축 JSON이며,
+    임시 파일에 쓴 뒤 교체하는 방식으로 원자적으로 기록하고, 전체 크기가 상한을
+    넘으면 가장 오래 사용되지 않은 파일부터 삭제합니다.
+    """
+
+    ENTRY_SUFFIX = ".json"
+    TEMP_SUFFIX = ".tmp"
+
+    def __init__(self, cache_dir: Optional[str] = "result", ttl: float = 300,
+                 memory_max_bytes: int = 32 * 1024 * 1024, memory_max_items: int = 10000,
+                 disk_max_bytes: int = 256 * 1024 * 1024, enabled: bool = False):
+        """
+        Args:
+            cache_dir: 디스크 캐시 디렉토리 (None이면 메모리 캐시만 사용)
+            ttl: 기본 항목 만료 시간(초)
+            memory_max_bytes: 메모리 캐시 크기 상한
+            memory_max_items: 메모리 캐시 항목 수 상한
+            disk_max_bytes: 디스크 캐시 크기 상한
+            enabled: 캐시 활성화 여부
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.cache_enabled = enabled
+        self.ttl = ttl
+        self.disk_max_bytes = disk_max_bytes
+        self._memory = LRUCache(maxsize=memory_max_items, ttl=ttl, max_bytes=memory_max_bytes)
+        self._disk_lock = threading.Lock()
+        self._disk_bytes: Optional[int] = None
 
     def _ensure_cache_dir(self) -> None:
         """캐시 디렉토리 생성"""
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
 
     def enable(self) -> None:
         """캐시 활성화"""
@@ -28,12 +240,22 @@ class CacheManager:
         self.cache_enabled = False
         logger.info("🔧 캐시 기능 비활성화")
 
+    @staticmethod
+    def make_key(endpoint: str, params: Optional[Dict[str, Any]] = None) -> str:
+        """엔드포인트와 파라미터로 캐시 키 생성 (파라미터 순서 무관)"""
+        if not params:
+            return endpoint
+        return endpoint + "?" + "&".join(f"{key}={params[key]}" for key in sorted(params))
+
+    def _entry_path(self, key: str) -> Path:
+        return self.cache_dir / (hashlib.sha256(key.encode('utf-8')).hexdigest() + self.ENTRY_SUFFIX)
+
     def get(self, key: str) -> Optional[Dict[str, Any]]:
         """
-        캐시된 데이터 조회
+        캐시된 데이터 조회 (메모리 → 디스크 순, 디스크 적중 시 메모리로 승격)
 
         Args:
-            key: 캐시 키 (파일명)
+            key: 캐시 키
 
         Returns:
             캐시된 데이터 또는 None
@@ -41,46 +263,159 @@ class CacheManager:
         if not self.cache_enabled:
             return None
 
-        filepath = self.cache_dir / key
-        if filepath.exists():
-            try:
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    log_cache_usage(key, True)
-                    return data
-            except (json.JSONDecodeError, IOError):
-                return None
-        return None
-
-    def set(self, key: str, data: Dict[str, Any]) -> None:
+        data = self._memory.get(key)
+        if data is not None:
+            log_cache_usage(key, True)
+            return data
+
+        if self.cache_dir is None:
+            return None
+
+        filepath = self._entry_path(key)
+        try:
+            with open(filepath, 'rb') as f:
+                raw = f.read()
+            entry = json.loads(raw)
+        except FileNotFoundError:
+            return None
+        except (json.JSONDecodeError, IOError):
+            self._remove_file(filepath)
+            return None
+
+        remaining = entry.get("expires_at", 0) - time.time()
+        if remaining <= 0 or entry.get("key") != key:
+            self._remove_file(filepath)
+            return None
+
+        # 디스크 LRU 순서를 위해 접근 시각 갱신
+        try:
+            os.utime(filepath)
+        except OSError:
+            pass
+
+        data = entry["data"]
+        self._memory.set(key, data, ttl=remaining, size=len(raw))
+        log_cache_usage(key, True)
+        return data
+
+    def set(self, key: str, data: Dict[str, Any], ttl: Optional[float] = None) -> None:
         """
         데이터 캐시 저장
 
         Args:
-            key: 캐시 키 (파일명)
+            key: 캐시 키
             data: 저장할 데이터
+            ttl: 만료 시간(초), None이면 기본 TTL 사용
         """
         if not self.cache_enabled:
             return
 
-        filepath = self.cache_dir / key
+        ttl = self.ttl if ttl is None else ttl
+        raw = json.dumps(
+            {"key": key, "expires_at": time.time() + ttl, "data": data},
+            ensure_ascii=False, separators=(",", ":"), default=str
+        ).encode('utf-8')
+        self._memory.set(key, data, ttl=ttl, size=len(raw))
+
+        if self.cache_dir is None:
+            return
+
+        filepath = self._entry_path(key)
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, ensure_ascii=False, indent=2, default=str)
+            self._ensure_cache_dir()
+            fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=self.TEMP_SUFFIX)
+            with os.fdopen(fd, 'wb') as f:
+                f.write(raw)
+            with self._disk_lock:
+                # 첫 스캔이 방금 쓴 파일을 다시 세지 않도록 교체 전에 현재 크기를 구함
+                total = self._current_disk_bytes()
+                previous = filepath.stat().st_size if filepath.exists() else 0
+                os.replace(tmp_path, filepath)
+                self._disk_bytes = total + len(raw) - previous
             log_cache_usage(key, False)
-        except IOError as e:
+        except (IOError, OSError) as e:
             logger.error(f"캐시 저장 실패 ({key}): {e}")
+            return
 
-    def clear(self) -> None:
-        """모든 캐시 삭제"""
-        if self.cache_dir.exists():
-            for cache_file in self.cache_dir.glob("*.json"):
+        if self._disk_bytes > self.disk_max_bytes:
+            self._evict_disk()
+
+    def _current_disk_bytes(self) -> int:
+        """디스크 캐시 크기 (최초 1회만 디렉토리를 스캔)"""
+        if self._disk_bytes is None:
+            self._disk_bytes = sum(path.stat().st_size for path in self.cache_dir.glob("*" + self.ENTRY_SUFFIX))
+        return self._disk_bytes
+
+    def _evict_disk(self) -> None:
+        """디스크 캐시가 상한의 90% 이하가 될 때까지 오래 사용되지 않은 파일부터 삭제"""
+        with self._disk_lock:
+            entries = []
+            for path in self.cache_dir.glob("*" + self.ENTRY_SUFFIX):
                 try:
-                    cache_file.unlink()
-                except IOError as e:
-                    logger.error(f"캐시 파일 삭제 실패 ({cache_file.name}): {e}")
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, path))
+            entries.sort()
+
+            total = sum(size for _, size, _ in entries)
+            target = self.disk_max_bytes * 0.9
+            for _, size, path in entries:
+                if total <= target:
+                    break
+                try:
+                    path.unlink()
+                    total -= size
+                except OSError:
+                    pass
+            self._disk_bytes = total
+
+    def _remove_file(self, filepath: Path) -> None:
+        try:
+            size = filepath.stat().st_size
+            filepath.unlink()
+            with self._disk_lock:
+                if self._disk_bytes is not None:
+                    self._disk_bytes -= size
+        except OSError:
+            pass
+
+    def stats(self) -> Dict[str, Any]:
+        """메모리/디스크 캐시 통계"""
+        return {
+            "enabled": self.cache_enabled,
+            "memory": self._memory.stats(),
+            "disk_bytes": self._current_disk_bytes() if self.cache_dir is not None and self.cache_dir.exists() else 0
+        }
+
+    def clear(self) -> None:
+        """모든 캐시 삭제 (메모리 항목, 디스크 항목 및 남은 임시 파일)"""
+        self._memory.clear()
+        if self.cache_dir is not None and self.cache_dir.exists():
+            with self._disk_lock:
+                for pattern in ("*" + self.ENTRY_SUFFIX, "*" + self.TEMP_SUFFIX):
+                    for cache_file in self.cache_dir.glob(pattern):
+                        try:
+                            cache_file.unlink()
+                        except IOError as e:
+                            logger.error(f"캐시 파일 삭제 실패 ({cache_file.name}): {e}")
+                self._disk_bytes = 0
         logger.info("🧹 모든 캐시 삭제 완료")
 
 
 # 전역 캐시 매니저 인스턴스
-cache_manager = CacheManager()
+cache_manager = CacheManager(
+    cache_dir=env_str("API_CACHE_DIR"),
+    ttl=env_float("API_CACHE_TTL", 300),
+    memory_max_bytes=env_int("API_CACHE_MEMORY_BYTES", 32 * 1024 * 1024),
+    disk_max_bytes=env_int("API_CACHE_DISK_BYTES", 256 * 1024 * 1024),
+    enabled=env_bool("API_CACHE_ENABLED", True)
+)
+
+# 전역 OCID 캐시 인스턴스
+ocid_cache = OcidCache(
+    maxsize=env_int("OCID_CACHE_SIZE", 10000),
+    ttl=env_float("OCID_CACHE_TTL", 7 * 24 * 3600),
+    negative_ttl=env_float("OCID_CACHE_NEGATIVE_TTL", 300),
+    persist_path=env_str("OCID_CACHE_PATH")
+)
@@ -0,0 +1,37 @@
+"""
+환경 설정 모듈
+
+.env 파일 탐색과 로드는 이 모듈을 처음 import할 때 한 번만 수행합니다.
+환경변수를 읽는 모듈은 os.getenv 대신 이 모듈의 헬퍼를 사용해,
+어떤 순서로 import되더라도 .env 값이 먼저 반영되도록 합니다.
+"""
+import os
+from typing import Optional
+from dotenv import load_dotenv, find_dotenv
+
+load_dotenv(find_dotenv())
+
+
+def env_str(name: str, default: Optional[str] = None) -> Optional[str]:
+    """문자열 환경변수 (빈 문자열은 미설정으로 취급)"""
+    return os.getenv(name) or default
+
+
+def env_int(name: str, default: int) -> int:
+    return int(os.getenv(name) or default)
+
+
+def env_float(name: str, default: float) -> float:
+    return float(os.getenv(name) or default)
+
+
+def env_bool(name: str, default: bool) -> bool:
+    value = os.getenv(name)
+    if not value:
+        return default
+    return value.lower() == "true"
+
+
+def get_api_key() -> Optional[str]:
+    """Nexon Open API 키"""
+    return env_str("MAPLE_API_KEY")
@@ -0,0 +1,172 @@
+"""
+심볼 레벨업 비용 테이블 모듈
+
+원본 비용 테이블과 보스 요구 포스 목록(TXT)은 미리 파이썬 모듈(_cost_table_data.py)로 변환해 두고,
+서버는 import만으로 테이블을 읽어 시작 시 파일 파싱을 하지 않습니다.
+TXT 파일을 수정했다면 다음 명령으로 다시 생성하세요.
+
+    python -m api.cost_table
+"""
+import hashlib
+import importlib
+from array import array
+from itertools import accumulate
+from pathlib import Path
+from typing import Dict, List, Sequence, Tuple
+
+TABLE_DIR = Path(__file__).parent
+GENERATED_MODULE = TABLE_DIR / "_cost_table_data.py"
+
+# 포스 타입별 원본 파일과 지역(열) 순서
+COST_TABLE_SOURCES: Dict[str, Tuple[str, Tuple[str, ...]]] = {
+    "Arcane": ("AracneCostTable.txt", ('Yuro', 'ChewChew', 'Lecheln', 'Arcana', 'Morass', 'Esfera')),
+    "Authentic": ("AuthenticCostTable.txt",
+                  ('Cernium', 'Arcs', 'Odium', 'Dowonkyung', 'Arteria', 'Carcion', 'Tallahart'))
+}
+
+# 포스 타입별 보스 요구 포스 목록 (저장소 루트, 프론트엔드와 공유)
+BOSS_LIST_SOURCES: Dict[str, Path] = {
+    "Arcane": TABLE_DIR.parent / "arcane_boss_list.txt",
+    "Authentic": TABLE_DIR.parent / "authentic_boss_list.txt"
+}
+
+
+class ForceCostTable:
+    """
+    포스 타입 하나의 심볼 레벨업 비용 테이블
+
+    비용은 (지역 × 레벨) 2차원 배열을 지역 우선으로 펼친 int64 배열에 보관하고,
+    지역별 누적합을 미리 계산해 두어 임의 구간(a → b) 비용을 O(1)로 조회합니다.
+    생성 후에는 변경하지 않으므로 모든 최적화 경로에서 공유해도 안전합니다.
+    """
+
+    __slots__ = ("regions", "max_level", "_steps", "_cumulative")
+
+    def __init__(self, regions: Sequence[str], step_costs: Sequence[Sequence[int]]):
+        """
+        Args:
+            regions: 지역 이름 목록 (열 순서)
+            step_costs: 레벨별 행 목록, step_costs[level][region]은 level → level+1 비용
+        """
+        self.regions: Tuple[str, ...] = tuple(regions)
+        self.max_level = len(step_costs)
+        self._steps = array('q')
+        self._cumulative = array('q')
+
+        for i in range(len(self.regions)):
+            column = [row[i] for row in step_costs]
+            self._steps.extend(column)
+            self._cumulative.extend(accumulate(column, initial=0))
+
+    @classmethod
+    def from_file(cls, path: Path, regions: Sequence[str]) -> "ForceCostTable":
+        """탭 구분 비용 테이블 파일(첫 열은 레벨, 'Lev' 헤더 행 제외) 로드"""
+        return cls(regions, parse_cost_file(path, len(regions)))
+
+    def step_cost(self, region_index: int, level: int) -> int:
+        """지역 심볼을 level에서 level+1로 올리는 비용"""
+        return self._steps[region_index * self.max_level + level]
+
+    def range_cost(self, region_index: int, from_level: int, to_level: int) -> int:
+        """지역 심볼을 from_level에서 to_level로 올리는 누적 비용"""
+        base = region_index * (self.max_level + 1)
+        return self._cumulative[base + to_level] - self._cumulative[base + from_level]
+
+
+def parse_cost_file(path: Path, region_count: int) -> List[List[int]]:
+    """탭 구분 비용 테이블 파일을 레벨별 비용 행 목록으로 파싱"""
+    rows: List[List[int]] = []
+    with open(path, 'r') as f:
+        for line in f:
+            if line.startswith('Lev') or not line.strip():
+                continue
+            costs = line.strip().split('\t')
+            rows.append([int(cost) for cost in costs[1:region_count + 1]])
+    return rows
+
+
+def parse_boss_file(path: Path) -> Dict[str, int]:
+    """탭 구분 보스 목록 파일('보스이름' 헤더 행 제외)을 {보스 이름: 요구 포스}로 파싱"""
+    bosses: Dict[str, int] = {}
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.startswith('보스이름') or not line.strip():
+                continue
+            name, force = line.strip().split('\t')
+            bosses[name] = int(force)
+    return bosses
+
+
+def source_digest() -> str:
+    """원본 비용 테이블 / 보스 목록 파일 전체의 SHA-256 (생성 모듈이 최신인지 확인용)"""
+    digest = hashlib.sha256()
+    for filename, _ in COST_TABLE_SOURCES.values():
+        digest.update((TABLE_DIR / filename).read_bytes())
+    for path in BOSS_LIST_SOURCES.values():
+        digest.update(path.read_bytes())
+    return digest.hexdigest()
+
+
+def load_cost_tables() -> Dict[str, ForceCostTable]:
+    """생성된 모듈에서 포스 타입별 비용 테이블 로드"""
+    from ._cost_table_data import COST_TABLES
+
+    return {force_type: ForceCostTable(regions, rows) for force_type, (regions, rows) in COST_TABLES.items()}
+
+
+def load_boss_forces() -> Dict[str, Dict[str, int]]:
+    """생성된 모듈에서 포스 타입별 {보스 이름: 요구 포스} 로드"""
+    from ._cost_table_data import BOSS_FORCES
+
+    return {force_type: dict(bosses) for force_type, bosses in BOSS_FORCES.items()}
+
+
+def loaded_digest() -> str:
+    """현재 import된 생성 모듈의 원본 다이제스트"""
+    from ._cost_table_data import SOURCE_DIGEST
+
+    return SOURCE_DIGEST
+
+
+def reload_generated_module() -> str:
+    """서버 재시작 없이 생성 모듈을 다시 읽고 새 다이제스트 반환"""
+    from . import _cost_table_data
+
+    return importlib.reload(_cost_table_data).SOURCE_DIGEST
+
+
+def generate_module(path: Path = GENERATED_MODULE) -> None:
+    """원본 TXT 비용 테이블을 파이썬 모듈로 변환"""
+    lines = [
+        "# 자동 생성 파일 - 직접 수정하지 마세요.",
+        "# 원본: " + ", ".join([filename for filename, _ in COST_TABLE_SOURCES.values()]
+                              + [path.name for path in BOSS_LIST_SOURCES.values()]),
+        "# 재생성: python -m api.cost_table",
+        "",
+        f"SOURCE_DIGEST = {source_digest()!r}",
+        "",
+        "COST_TABLES = {",
+    ]
+    for force_type, (filename, regions) in COST_TABLE_SOURCES.items():
+        lines.append(f"    {force_type!r}: (")
+        lines.append(f"        {regions!r},")
+        lines.append("        (")
+        for row in parse_cost_file(TABLE_DIR / filename, len(regions)):
+            lines.append(f"            {tuple(row)!r},")
+        lines.append("        )")
+        lines.append("    ),")
+    lines.append("}")
+    lines.append("")
+    lines.append("BOSS_FORCES = {")
+    for force_type, boss_path in BOSS_LIST_SOURCES.items():
+        lines.append(f"    {force_type!r}: {{")
+        for name, force in parse_boss_file(boss_path).items():
+            lines.append(f"        {name!r}: {force},")
+        lines.append("    },")
+    lines.append("}")
+    path.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+
+if __name__ == "__main__":
+    generate_module()
+    print(f"✅ 비용 테이블 모듈 생성 완료: {GENERATED_MODULE}")
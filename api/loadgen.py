@@ -0,0 +1,158 @@
+"""
+부하 생성기
+
+실행 중인 FastAPI 앱에 목표 RPS로 요청을 보내고 엔드포인트별 지연 / 상태 코드를 집계합니다.
+응답 시간과 무관하게 정해진 간격으로 요청을 보내는 개방형(open-loop) 방식이므로,
+서버가 느려지면 대기 시간이 결과에 그대로 드러납니다.
+
+    python -m api.standin --port 9000 --latency lognormal:40:0.5 --throttle-rate 0.01
+    MAPLE_API_BASE_URL=http://127.0.0.1:9000/maplestory/v1 MAPLE_API_KEY=local MAPLE_API_RATE_LIMIT=1000 \
+        uvicorn api.main:app --port 8000
+    python -m api.loadgen --target http://127.0.0.1:8000 --rps 50 --duration 30
+"""
+import argparse
+import asyncio
+import json
+import random
+import time
+from collections import Counter, defaultdict
+from typing import Dict, List, Optional, Sequence, Tuple
+import httpx
+from .benchmark import percentile
+
+# 요청 종류별 기본 비율
+DEFAULT_MIX = "init=0.7,optimize=0.3"
+
+OPTIMIZE_PAYLOAD = {
+    "force_type": "Arcane",
+    "char_level": 280,
+    "current_force": 1010,
+    "symbol_levels": [20, 20, 17, 12, 8, 3]
+}
+OPTIMIZE_GOALS = [1100, 1200, 1320]
+
+
+def parse_mix(spec: str) -> List[Tuple[str, float]]:
+    """'init=0.7,optimize=0.3' 형식의 요청 비율 파싱"""
+    mix = []
+    for part in spec.split(","):
+        name, _, weight = part.partition("=")
+        if name not in ("init", "optimize") or not weight:
+            raise ValueError(f"요청 비율 형식이 잘못되었습니다: {spec} (예: {DEFAULT_MIX})")
+        mix.append((name, float(weight)))
+    return mix
+
+
+async def run_load(target: str, rps: float, duration: float, mix: List[Tuple[str, float]],
+                   names: int = 500, max_inflight: int = 1000, timeout: float = 30.0,
+                   seed: Optional[int] = None) -> Dict:
+    """
+    목표 RPS로 부하 생성
+
+    Args:
+        target: 앱 주소 (예: http://127.0.0.1:8000)
+        rps: 초당 요청 수
+        duration: 실행 시간(초)
+        mix: (요청 종류, 비율) 목록
+        names: /init 요청에 쓰는 캐릭터 이름 수 (작을수록 캐시 적중이 늘어남)
+        max_inflight: 동시에 진행 중인 요청 상한 (초과 시 요청을 보내지 않고 dropped로 집계)
+        timeout: 요청 타임아웃(초)
+        seed: 난수 시드
+
+    Returns:
+        Dict: {"requested", "completed", "dropped", "elapsed", "achieved_rps",
+               "endpoints": {종류: {"count", "status", "p50_ms", "p95_ms", "p99_ms", "max_ms"}}}
+    """
+    rng = random.Random(seed)
+    kinds = [name for name, _ in mix]
+    weights = [weight for _, weight in mix]
+    latencies: Dict[str, List[float]] = defaultdict(list)
+    statuses: Dict[str, Counter] = defaultdict(Counter)
+    inflight = set()
+    dropped = 0
+    total = int(rps * duration)
+
+    limits = httpx.Limits(max_connections=max_inflight, max_keepalive_connections=max_inflight)
+    async with httpx.AsyncClient(base_url=target, timeout=timeout, limits=limits) as client:
+        async def send(kind: str) -> None:
+            start = time.perf_counter()
+            try:
+                if kind == "init":
+                    response = await client.get(f"/api/character/부하{rng.randrange(names)}/init")
+                else:
+                    response = await client.post("/api/optimize/force", json={
+                        **OPTIMIZE_PAYLOAD, "force_goal": rng.choice(OPTIMIZE_GOALS)
+                    })
+                status = str(response.status_code)
+            except httpx.HTTPError as e:
+                status = type(e).__name__
+            latencies[kind].append(time.perf_counter() - start)
+            statuses[kind][status] += 1
+
+        started = time.perf_counter()
+        for i in range(total):
+            # 응답을 기다리지 않고 예정 시각마다 요청 전송
+            delay = started + i / rps - time.perf_counter()
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if len(inflight) >= max_inflight:
+                dropped += 1
+                continue
+            task = asyncio.create_task(send(rng.choices(kinds, weights)[0]))
+            inflight.add(task)
+            task.add_done_callback(inflight.discard)
+
+        if inflight:
+            await asyncio.wait(inflight)
+        elapsed = time.perf_counter() - started
+
+    endpoints = {}
+    for kind, samples in latencies.items():
+        samples.sort()
+        endpoints[kind] = {
+            "count": len(samples),
+            "status": dict(statuses[kind]),
+            "p50_ms": round(percentile(samples, 0.50) * 1000, 2),
+            "p95_ms": round(percentile(samples, 0.95) * 1000, 2),
+            "p99_ms": round(percentile(samples, 0.99) * 1000, 2),
+            "max_ms": round(samples[-1] * 1000, 2)
+        }
+
+    completed = sum(len(samples) for samples in latencies.values())
+    return {
+        "requested": total,
+        "completed": completed,
+        "dropped": dropped,
+        "elapsed": round(elapsed, 2),
+        "achieved_rps": round(completed / elapsed, 1) if elapsed else 0.0,
+        "endpoints": endpoints
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description="FastAPI 앱 부하 생성기")
+    parser.add_argument("--target", default="http://127.0.0.1:8000", help="앱 주소")
+    parser.add_argument("--rps", type=float, default=20.0, help="초당 요청 수")
+    parser.add_argument("--duration", type=float, default=10.0, help="실행 시간(초)")
+    parser.add_argument("--mix", default=DEFAULT_MIX, help=f"요청 종류별 비율 (기본값: {DEFAULT_MIX})")
+    parser.add_argument("--names", type=int, default=500, help="/init 요청에 쓰는 캐릭터 이름 수")
+    parser.add_argument("--max-inflight", type=int, default=1000, help="동시 진행 요청 상한")
+    parser.add_argument("--timeout", type=float, default=30.0, help="요청 타임아웃(초)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    args = parser.parse_args(argv)
+
+    try:
+        mix = parse_mix(args.mix)
+    except ValueError as e:
+        parser.error(str(e))
+    if args.rps <= 0 or args.duration <= 0:
+        parser.error("--rps와 --duration은 0보다 커야 합니다")
+
+    result = asyncio.run(run_load(args.target, args.rps, args.duration, mix, args.names,
+                                  args.max_inflight, args.timeout, args.seed))
+    print(json.dumps(result, ensure_ascii=False, indent=2))
+    return 0 if result["completed"] else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -1,9 +1,22 @@
+import atexit
+import json
 import logging
-import os
-from typing import Any, Dict
+import queue
+import random
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import Any, Dict, Optional
+from .config import env_bool, env_str
 
 # 환경변수로 디버그 레벨 설정 (기본값: INFO)
-DEBUG_LEVEL = os.getenv("DEBUG_LEVEL", "INFO").upper()
+DEBUG_LEVEL = env_str("DEBUG_LEVEL", "INFO").upper()
+
+# 출력 형식 ("text" 또는 "json")과 큐 모드 (요청 경로에서는 큐에 넣기만 하고 별도 스레드가 출력)
+LOG_FORMAT = env_str("LOG_FORMAT", "text").lower()
+LOG_QUEUE = env_bool("LOG_QUEUE", False)
+
+# 카테고리별 샘플링 비율 (예: "api_data=0.01,api_call=0.1", 지정하지 않은 카테고리는 모두 기록)
+LOG_SAMPLE_RATES = env_str("LOG_SAMPLE_RATES", "")
 
 # 로그 레벨 매핑
 LOG_LEVELS = {
@@ -14,74 +27,178 @@ LOG_LEVELS = {
     "CRITICAL": logging.CRITICAL
 }
 
+# 로그 카테고리 (샘플링 / JSON 출력의 category 필드)
+CATEGORY_API_CALL = "api_call"
+CATEGORY_API_DATA = "api_data"
+CATEGORY_CACHE = "cache"
+CATEGORY_VALIDATION = "validation"
+
+
+class JsonFormatter(logging.Formatter):
+    """한 줄에 하나의 JSON 객체로 출력하는 포매터"""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": datetime.fromtimestamp(record.created).isoformat(timespec="milliseconds"),
+            "level": record.levelname,
+            "logger": record.name,
+            "category": getattr(record, "category", None),
+            "message": record.getMessage()
+        }
+        if record.exc_info:
+            entry["exc_info"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False, default=str)
+
+
+class SamplingFilter(logging.Filter):
+    """카테고리별 비율만큼만 기록 (카테고리가 없거나 비율이 없는 로그는 모두 통과)"""
+
+    def __init__(self, rates: Dict[str, float]):
+        super().__init__()
+        self.rates = rates
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        rate = self.rates.get(getattr(record, "category", None))
+        return rate is None or rate >= 1.0 or random.random() < rate
+
+
+class DeferredQueueHandler(QueueHandler):
+    """
+    메시지 포맷을 출력 스레드로 미루는 QueueHandler
+
+    기본 QueueHandler는 큐에 넣기 전에 호출 스레드에서 메시지를 포맷하지만,
+    같은 프로세스 안의 큐에서는 레코드를 그대로 넘겨도 되므로 포맷 비용을 요청 경로에서 뺍니다.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        return record
+
+
+def parse_sample_rates(spec: str) -> Dict[str, float]:
+    """'api_data=0.01,api_call=0.1' 형식의 샘플링 비율 파싱"""
+    rates = {}
+    for part in filter(None, (part.strip() for part in spec.split(","))):
+        category, _, rate = part.partition("=")
+        try:
+            rates[category.strip()] = float(rate)
+        except ValueError:
+            continue
+    return rates
+
+
+_listener: Optional[QueueListener] = None
+
+
+def _stop_listener() -> None:
+    """남은 로그를 모두 출력하고 출력 스레드 종료"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+
 # 로거 설정
 def setup_logger(name: str = "maple_calculator") -> logging.Logger:
     """로거 설정"""
+    global _listener
     logger = logging.getLogger(name)
-    
+
     # 이미 핸들러가 있으면 제거
     for handler in logger.handlers[:]:
         logger.removeHandler(handler)
-    
+    for log_filter in logger.filters[:]:
+        logger.removeFilter(log_filter)
+    _stop_listener()
+
     # 로그 레벨 설정
     log_level = LOG_LEVELS.get(DEBUG_LEVEL, logging.INFO)
     logger.setLevel(log_level)
-    
-    # 콘솔 핸들러 생성
+
+    # 콘솔 핸들러 생성 (레벨은 로거에서만 판단해 set_debug_level 변경이 그대로 반영되도록 함)
     console_handler = logging.StreamHandler()
-    console_handler.setLevel(log_level)
-    
+
     # 포매터 설정
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        datefmt='%Y-%m-%d %H:%M:%S'
-    )
+    if LOG_FORMAT == "json":
+        formatter = JsonFormatter()
+    else:
+        formatter = logging.Formatter(
+            '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
+            datefmt='%Y-%m-%d %H:%M:%S'
+        )
     console_handler.setFormatter(formatter)
-    
-    logger.addHandler(console_handler)
-    
+
+    # 샘플링은 큐에 넣기 전에 적용
+    sample_rates = parse_sample_rates(LOG_SAMPLE_RATES)
+    if sample_rates:
+        logger.addFilter(SamplingFilter(sample_rates))
+
+    if LOG_QUEUE:
+        log_queue: queue.SimpleQueue = queue.SimpleQueue()
+        logger.addHandler(DeferredQueueHandler(log_queue))
+        _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+        _listener.start()
+    else:
+        logger.addHandler(console_handler)
+
     return logger
 
 # 전역 로거 인스턴스
 logger = setup_logger()
+atexit.register(_stop_listener)
+
+
+class _FieldDump:
+    """원본 데이터의 필드별 값 / 타입 요약 (출력될 때만 계산)"""
+
+    __slots__ = ("data",)
+
+    def __init__(self, data: Any):
+        self.data = data
+
+    def __str__(self) -> str:
+        if not isinstance(self.data, dict):
+            return f"  데이터: {self.data}"
+        lines = []
+        for key, value in self.data.items():
+            value_str = str(value)
+            if len(value_str) > 100:
+                value_str = value_str[:100] + "..."
+            lines.append(f"  {key}: {value_str} (type: {type(value).__name__})")
+        return "\n".join(lines)
+
 
 def log_api_data(data: Any, context: str = "API Data") -> None:
-    """API 데이터 로깅"""
-    if logger.level <= logging.DEBUG:
-        logger.debug(f"{context}: {data}")
+    """API 데이터 로깅 (DEBUG가 꺼져 있으면 아무것도 하지 않고, 켜져 있어도 포맷은 출력 시점에 수행)"""
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("%s: %s", context, data, extra={"category": CATEGORY_API_DATA})
 
 def log_pydantic_error(error: Exception, data: Dict, model_name: str) -> None:
     """Pydantic 검증 오류 상세 로깅"""
-    logger.error(f"❌ {model_name} 검증 오류: {error}")
-    
-    if logger.level <= logging.DEBUG:
-        logger.debug(f"📊 원본 데이터 ({model_name}):")
-        if isinstance(data, dict):
-            for key, value in data.items():
-                value_type = type(value).__name__
-                value_str = str(value)[:100] + "..." if len(str(value)) > 100 else str(value)
-                logger.debug(f"  {key}: {value_str} (type: {value_type})")
-        else:
-            logger.debug(f"  데이터: {data}")
+    logger.error("❌ %s 검증 오류: %s", model_name, error, extra={"category": CATEGORY_VALIDATION})
+
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📊 원본 데이터 (%s):\n%s", model_name, _FieldDump(data),
+                     extra={"category": CATEGORY_VALIDATION})
 
 def log_field_validation(field_name: str, value: Any, expected_type: str) -> None:
     """필드 검증 로깅"""
-    if logger.level <= logging.DEBUG:
-        actual_type = type(value).__name__
-        logger.debug(f"🔍 필드 검증 - {field_name}: {value} (실제타입: {actual_type}, 예상타입: {expected_type})")
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("🔍 필드 검증 - %s: %s (실제타입: %s, 예상타입: %s)", field_name, value,
+                     type(value).__name__, expected_type, extra={"category": CATEGORY_VALIDATION})
 
 def log_api_call(endpoint: str, params: Dict = None) -> None:
     """API 호출 로깅"""
-    logger.info(f"🌐 API 호출: {endpoint}")
-    if params and logger.level <= logging.DEBUG:
-        logger.debug(f"📝 파라미터: {params}")
+    logger.info("🌐 API 호출: %s", endpoint, extra={"category": CATEGORY_API_CALL})
+    if params and logger.isEnabledFor(logging.DEBUG):
+        logger.debug("📝 파라미터: %s", params, extra={"category": CATEGORY_API_CALL})
 
 def log_cache_usage(filename: str, is_cached: bool) -> None:
-    """캐시 사용 로깅"""
+    """캐시 사용 로깅 (적중은 요청마다 발생하므로 DEBUG, 저장은 업스트림 호출 때만 발생하므로 INFO)"""
     if is_cached:
-        logger.info(f"📋 캐시 사용: {filename}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("📋 캐시 사용: %s", filename, extra={"category": CATEGORY_CACHE})
     else:
-        logger.info(f"💾 새로운 데이터 저장: {filename}")
+        logger.info("💾 새로운 데이터 저장: %s", filename, extra={"category": CATEGORY_CACHE})
 
 def set_debug_level(level: str) -> None:
     """디버그 레벨 동적 변경"""
@@ -91,4 +208,3 @@ def set_debug_level(level: str) -> None:
         logger.info(f"🔧 디버그 레벨 변경: {level.upper()}")
     else:
         logger.warning(f"⚠️ 잘못된 디버그 레벨: {level}. 가능한 값: {list(LOG_LEVELS.keys())}")
-
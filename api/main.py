@@ -1,18 +1,50 @@
-from fastapi import FastAPI, HTTPException
+from contextlib import asynccontextmanager
+from fastapi import Depends, FastAPI, Header, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
+from pydantic import ValidationError
 import datetime
-from dotenv import load_dotenv, find_dotenv
-from .service import maple_service
-from .models import ForceOptimizeRequest, ForceOptimizeResponse
+import hmac
+import json
+from typing import Optional
+from .service import MapleService, get_maple_service, close_maple_service
+from .models import (
+    ForceOptimizeRequest, ForceOptimizeResponse,
+    ForceFrontierRequest, ForceFrontierResponse,
+    ForceBudgetRequest, ForceBudgetResponse,
+    ForceOptimizeBatchRequest, ForceOptimizeBatchResponse,
+    BackfillRequest, BackfillJobResponse,
+    RosterRequest,
+    ForceJointRequest, ForceJointResponse,
+    ForceSimulateRequest, ForceSimulateResponse
+)
+from .config import env_str
 from .logger import logger, set_debug_level
+from .metrics import CONTENT_TYPE, MetricsMiddleware, render_metrics
+
+# 관리용 엔드포인트(POST /api/cost-tables/reload) 키 (지정하지 않으면 관리용 엔드포인트 비활성화)
+ADMIN_API_KEY = env_str("ADMIN_API_KEY")
+
+
+def require_admin_key(x_admin_key: Optional[str] = Header(None)) -> None:
+    """X-Admin-Key 헤더가 ADMIN_API_KEY와 같을 때만 통과"""
+    if not ADMIN_API_KEY:
+        raise HTTPException(status_code=404, detail="Not Found")
+    if not x_admin_key or not hmac.compare_digest(x_admin_key, ADMIN_API_KEY):
+        raise HTTPException(status_code=403, detail="관리자 키가 올바르지 않습니다")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """앱 종료 시 API 클라이언트 연결 풀 정리 (서비스는 첫 요청 시 생성)"""
+    yield
+    await close_maple_service()
 
-load_dotenv(find_dotenv())
 
 app = FastAPI(
     title="메이플스토리 계산기 API",
     description="메이플스토리 캐릭터 정보 조회 및 계산 API",
-    version="1.0.0"
+    version="1.0.0",
+    lifespan=lifespan
 )
 
 # CORS 설정
@@ -23,6 +55,14 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# 라우트별 요청 지연 기록 (GET /metrics)
+app.add_middleware(MetricsMiddleware)
+
+@app.get("/metrics")
+def get_metrics():
+    """Prometheus 텍스트 형식 지표 (요청 / 단계별 지연, 업스트림 상태 코드, 캐시 적중, 호출 대기)"""
+    return PlainTextResponse(render_metrics(), media_type=CONTENT_TYPE)
+
 @app.get("/api/ping")
 def hello_world():
     """API 상태 확인"""
@@ -34,8 +74,35 @@ def get_current_time():
     now = datetime.datetime.now()
     return {"time": now.strftime("%Y-%m-%d %H:%M:%S")}
 
+@app.get("/api/status/ratelimit")
+def get_rate_limit_status(maple_service: MapleService = Depends(get_maple_service)):
+    """Nexon API 호출 속도 제한기 상태 (대기열 깊이, 대기 시간) 조회"""
+    try:
+        return maple_service.api.rate_limiter.stats()
+    except ValueError as e:
+        raise HTTPException(
+            status_code=503,
+            detail=str(e)
+        )
+
+@app.get("/api/status/optimize-cache")
+def get_optimize_cache_status(maple_service: MapleService = Depends(get_maple_service)):
+    """포스 최적화 결과 / 프론티어 캐시 적중 통계 조회"""
+    return maple_service.optimize_cache_stats()
+
+@app.post("/api/cost-tables/reload", dependencies=[Depends(require_admin_key)])
+def reload_cost_tables(maple_service: MapleService = Depends(get_maple_service)):
+    """다시 생성한 비용 테이블 모듈을 읽고, 바뀌었으면 최적화 캐시를 비웁니다. (X-Admin-Key 필요)"""
+    try:
+        return maple_service.reload_cost_tables()
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
 @app.get("/api/character/{character_name}/init")
-async def get_character_symbols(character_name: str):
+async def get_character_symbols(character_name: str, maple_service: MapleService = Depends(get_maple_service)):
     """
     캐릭터의 심볼 정보를 조회합니다.
 
@@ -50,12 +117,16 @@ async def get_character_symbols(character_name: str):
             },
             "arcane_force": 아케인포스,
             "authentic_force": 어센틱포스,
-            "character_class": 직업명
+            "character_class": 직업명,
+            "snapshot": {
+                "fetched_at": 조회 시각,
+                "age_seconds": 스냅샷 나이(초),
+                "stale": 백그라운드 갱신 대상 여부
+            }
         }
     """
     try:
-        result = maple_service.get_character_symbol_info(character_name)
-        print(result)
+        result = await maple_service.aget_character_symbol_info(character_name)
         return JSONResponse(
             content=result,
             status_code=200
@@ -73,8 +144,111 @@ async def get_character_symbols(character_name: str):
 
 
 
+@app.post("/api/characters/init")
+async def get_roster_symbols(request: RosterRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    여러 캐릭터의 심볼 정보를 동시에 조회해 NDJSON으로 스트리밍합니다.
+
+    각 캐릭터의 결과는 준비되는 즉시 한 줄씩 전송되므로 입력 순서와 다를 수 있습니다.
+    잘못된 이름 등 캐릭터별 오류는 해당 줄의 error로만 보고됩니다.
+
+    Args:
+        request: 일괄 조회 요청 정보
+            - names: 캐릭터 이름 목록 (최대 200개)
+
+    Returns:
+        NDJSON: 한 줄에 하나씩 {
+            "index": 입력 순서,
+            "character_name": 캐릭터 이름,
+            "result": /api/character/{name}/init 응답 (실패 시 null),
+            "error": 오류 메시지 (성공 시 null)
+        }
+    """
+    async def stream():
+        async for item in maple_service.aiter_character_symbol_info(request.names):
+            yield json.dumps(item, ensure_ascii=False) + "\n"
+
+    return StreamingResponse(stream(), media_type="application/x-ndjson")
+
+
+@app.get("/api/character/{character_name}/history")
+def get_character_history(character_name: str, start: Optional[datetime.date] = None,
+                          end: Optional[datetime.date] = None,
+                          maple_service: MapleService = Depends(get_maple_service)):
+    """
+    저장된 캐릭터 스냅샷의 기준일별 이력을 조회합니다.
+
+    Args:
+        character_name: 캐릭터 이름
+        start: 시작일 (YYYY-MM-DD, 포함)
+        end: 종료일 (YYYY-MM-DD, 포함)
+
+    Returns:
+        JSON: [{"date", "character_level", "arcane_force", "authentic_force", "symbols": {심볼 이름: 레벨}}]
+    """
+    try:
+        return maple_service.get_character_history(character_name, start, end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
+
+@app.post("/api/backfill", response_model=BackfillJobResponse, status_code=202)
+async def start_backfill(request: BackfillRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    지난 날짜의 캐릭터 스냅샷 백필을 시작합니다.
+
+    작업은 백그라운드에서 속도 제한 안에서 동시에 수행되며, 이미 저장된 기준일은 건너뜁니다.
+    진행 상황은 GET /api/backfill/{job_id}로 조회합니다.
+
+    Args:
+        request: 백필 요청 정보
+            - names: 캐릭터 이름 목록
+            - start: 시작일 (YYYY-MM-DD)
+            - end: 종료일 (YYYY-MM-DD, 기본값: 어제)
+
+    Returns:
+        BackfillJobResponse: 작업 진행 상황
+
+    Raises:
+        HTTPException(400): 잘못된 기간, 저장소 비활성화 등
+        HTTPException(500): 서버 오류
+    """
+    try:
+        return maple_service.start_backfill(request.names, request.start, request.end)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
+
+@app.get("/api/backfill/{job_id}", response_model=BackfillJobResponse)
+def get_backfill_job(job_id: str, maple_service: MapleService = Depends(get_maple_service)):
+    """백필 작업 진행 상황을 조회합니다."""
+    try:
+        return maple_service.get_backfill_job(job_id)
+    except ValueError as e:
+        raise HTTPException(
+            status_code=404,
+            detail=str(e)
+        )
+
+
 @app.post("/api/optimize/force", response_model=ForceOptimizeResponse)
-async def optimize_force(request: ForceOptimizeRequest):
+def optimize_force(request: ForceOptimizeRequest, maple_service: MapleService = Depends(get_maple_service)):
     """
     심볼 포스 최적화 계산을 수행합니다.
 
@@ -85,6 +259,7 @@ async def optimize_force(request: ForceOptimizeRequest):
             - char_level: 캐릭터 레벨
             - current_force: 현재 총합 포스 수치
             - symbol_levels: 현재 심볼 레벨 리스트
+            - solver: 최적화 방식 ("greedy" 또는 "exact", 기본값 "greedy")
 
     Returns:
         ForceOptimizeResponse: 최적화 결과
@@ -107,7 +282,8 @@ async def optimize_force(request: ForceOptimizeRequest):
             force_goal=request.force_goal,
             char_level=request.char_level,
             current_force=request.current_force,
-            symbol_levels=request.symbol_levels
+            symbol_levels=request.symbol_levels,
+            solver=request.solver.value
         )
 
         return ForceOptimizeResponse(**result)
@@ -122,3 +298,262 @@ async def optimize_force(request: ForceOptimizeRequest):
             status_code=500,
             detail=f"서버 오류: {str(e)}"
         )
+
+
+@app.post("/api/optimize/force/batch", response_model=ForceOptimizeBatchResponse)
+def optimize_force_batch(request: ForceOptimizeBatchRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    여러 심볼 포스 최적화 요청을 한 번에 계산합니다.
+
+    각 항목은 /api/optimize/force 요청과 같은 형식이며 항목별로 검증됩니다.
+    잘못된 항목은 전체 요청을 실패시키지 않고 해당 항목의 error로 보고됩니다.
+
+    Args:
+        request: 일괄 요청 정보
+            - requests: ForceOptimizeRequest 형식의 요청 목록
+
+    Returns:
+        ForceOptimizeBatchResponse: 입력 순서대로 정렬된 항목별 결과
+            - index: 요청 목록에서의 위치
+            - result: 최적화 결과 (실패 시 null)
+            - error: 오류 메시지 (성공 시 null)
+
+    Raises:
+        HTTPException(500): 서버 오류
+    """
+    try:
+        errors = {}
+        valid_requests = []
+        valid_indices = []
+
+        for index, item in enumerate(request.requests):
+            try:
+                item_request = ForceOptimizeRequest.model_validate(item)
+                item_request.validate_symbol_levels()
+            except (ValidationError, ValueError) as e:
+                errors[index] = str(e)
+                continue
+
+            valid_indices.append(index)
+            valid_requests.append({
+                "force_type": item_request.force_type.value,
+                "force_goal": item_request.force_goal,
+                "char_level": item_request.char_level,
+                "current_force": item_request.current_force,
+                "symbol_levels": item_request.symbol_levels,
+                "solver": item_request.solver.value
+            })
+
+        results = [{"index": index, "result": None, "error": error} for index, error in errors.items()]
+        for index, item_result in zip(valid_indices, maple_service.optimize_force_batch(valid_requests)):
+            results.append({**item_result, "index": index})
+        results.sort(key=lambda item: item["index"])
+
+        return ForceOptimizeBatchResponse(results=results)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
+
+@app.post("/api/optimize/force/frontier", response_model=ForceFrontierResponse)
+def get_force_frontier(request: ForceFrontierRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    시작 상태에서 도달 가능한 모든 포스에 대한 최소 비용 프론티어를 조회합니다.
+
+    같은 시작 상태(포스 타입, 해금 지역, 심볼 레벨)의 프론티어는 서버에 캐시되므로,
+    목표 포스를 바꿔 가며 조회할 때는 이 결과를 받아 클라이언트에서 탐색하거나
+    solver="exact"로 /api/optimize/force를 호출하면 됩니다.
+
+    Args:
+        request: 프론티어 요청 정보
+            - force_type: 포스 타입 ("Arcane" 또는 "Authentic")
+            - char_level: 캐릭터 레벨
+            - current_force: 현재 총합 포스 수치
+            - symbol_levels: 현재 심볼 레벨 리스트
+
+    Returns:
+        ForceFrontierResponse: 프론티어 정보
+            - initial_levels: 초기 심볼 레벨
+            - points: 포스/비용 오름차순 지점 목록 (force, total_cost, levels)
+
+    Raises:
+        HTTPException(400): 잘못된 요청 (심볼 레벨 개수 불일치 등)
+        HTTPException(500): 서버 오류
+    """
+    try:
+        request.validate_symbol_levels()
+
+        result = maple_service.get_force_frontier_points(
+            force_type=request.force_type.value,
+            char_level=request.char_level,
+            current_force=request.current_force,
+            symbol_levels=request.symbol_levels
+        )
+
+        return ForceFrontierResponse(**result)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
+
+@app.post("/api/optimize/force/budget", response_model=ForceBudgetResponse)
+def optimize_force_budget(request: ForceBudgetRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    메소 예산 안에서 얻을 수 있는 최대 포스를 계산합니다.
+
+    Args:
+        request: 예산 최적화 요청 정보
+            - force_type: 포스 타입 ("Arcane" 또는 "Authentic")
+            - budget: 사용 가능한 메소
+            - char_level: 캐릭터 레벨
+            - current_force: 현재 총합 포스 수치
+            - symbol_levels: 현재 심볼 레벨 리스트
+
+    Returns:
+        ForceBudgetResponse: 최적화 결과
+            - initial_levels: 초기 심볼 레벨
+            - optimized_levels: 최적화된 심볼 레벨
+            - total_cost: 총 비용
+            - upgrade_path: 업그레이드 경로
+            - achieved_force: 달성 총 포스
+            - remaining_budget: 남은 메소
+
+    Raises:
+        HTTPException(400): 잘못된 요청 (심볼 레벨 개수 불일치 등)
+        HTTPException(500): 서버 오류
+    """
+    try:
+        request.validate_symbol_levels()
+
+        result = maple_service.optimize_force_budget(
+            force_type=request.force_type.value,
+            budget=request.budget,
+            char_level=request.char_level,
+            current_force=request.current_force,
+            symbol_levels=request.symbol_levels
+        )
+
+        return ForceBudgetResponse(**result)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
+
+@app.post("/api/optimize/force/joint", response_model=ForceJointResponse)
+def optimize_force_joint(request: ForceJointRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    아케인/어센틱 포스를 하나의 메소 예산으로 함께 최적화합니다.
+
+    Args:
+        request: 통합 최적화 요청 정보
+            - char_level: 캐릭터 레벨
+            - arcane / authentic: 타입별 current_force, symbol_levels, force_goal, bosses
+            - budget: 공유 메소 예산
+            - mode: "min_cost" (목표 달성 최소 비용) 또는 "max_force" (예산 안에서 포스 합 최대)
+
+    Returns:
+        ForceJointResponse: 최적화 결과
+            - total_cost / remaining_budget / within_budget
+            - arcane / authentic: 타입별 계획 (업그레이드 경로, 달성 포스, 목표 달성 여부)
+
+    Raises:
+        HTTPException(400): 잘못된 요청 (심볼 레벨 개수 불일치, 알 수 없는 보스 등)
+        HTTPException(500): 서버 오류
+    """
+    try:
+        request.validate_symbol_levels()
+
+        result = maple_service.optimize_force_joint(
+            char_level=request.char_level,
+            arcane=request.arcane.model_dump(),
+            authentic=request.authentic.model_dump(),
+            budget=request.budget,
+            mode=request.mode.value
+        )
+
+        return ForceJointResponse(**result)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
+
+
+@app.post("/api/optimize/force/simulate", response_model=ForceSimulateResponse)
+def simulate_force(request: ForceSimulateRequest, maple_service: MapleService = Depends(get_maple_service)):
+    """
+    일일 심볼 획득량과 메소 수입으로 목표 포스까지 걸리는 일수를 계산합니다.
+
+    Args:
+        request: 시뮬레이션 요청 정보
+            - force_type / char_level / current_force / symbol_levels: 현재 상태
+            - force_goal: 목표 포스 수치
+            - growth_counts: 지역별 현재 성장치 (캐릭터 조회 결과의 growth_count)
+            - daily_symbols: 지역별 일일 심볼 획득량
+            - meso / daily_meso: 보유 메소와 하루 수입 (meso 미지정 시 메소 제한 없음)
+            - horizon_days: 최대 시뮬레이션 일수
+
+    Returns:
+        ForceSimulateResponse: 시뮬레이션 결과
+            - days_to_goal: 목표 도달 일수
+            - upgrade_order: 일차별 업그레이드 순서
+            - timeline: 일차별 포스 변화
+            - policies: 정책별 도달 일수
+
+    Raises:
+        HTTPException(400): 잘못된 요청 (심볼 레벨 / 성장치 개수 불일치 등)
+        HTTPException(500): 서버 오류
+    """
+    try:
+        request.validate_symbol_levels()
+
+        result = maple_service.simulate_force(
+            force_type=request.force_type.value,
+            force_goal=request.force_goal,
+            char_level=request.char_level,
+            current_force=request.current_force,
+            symbol_levels=request.symbol_levels,
+            growth_counts=request.growth_counts,
+            daily_symbols=request.daily_symbols,
+            meso=request.meso,
+            daily_meso=request.daily_meso,
+            horizon_days=request.horizon_days
+        )
+
+        return ForceSimulateResponse(**result)
+
+    except ValueError as e:
+        raise HTTPException(
+            status_code=400,
+            detail=str(e)
+        )
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"서버 오류: {str(e)}"
+        )
@@ -1,14 +1,23 @@
-import os
+import asyncio
+import json
+import logging
+import time
+import httpx
 import requests
+from requests.adapters import HTTPAdapter
 from datetime import datetime, date, timedelta
-from typing import List, Optional, Union
+from typing import Any, Dict, List, NamedTuple, Optional, Tuple, Union
 from pydantic import BaseModel, Field, ValidationError
 from urllib.parse import quote
 
-from dotenv import load_dotenv, find_dotenv
+from .config import env_bool, env_float, env_int, env_str, get_api_key
 from .logger import logger, log_api_data, log_pydantic_error, log_api_call
+from .metrics import CACHE_REQUESTS, RATE_LIMIT_WAIT, UPSTREAM_DURATION, UPSTREAM_RESPONSES
+from .singleflight import SingleFlight, AsyncSingleFlight
+from .ratelimit import RateLimiter, get_rate_limiter, parse_retry_after, PRIORITY_INTERACTIVE
+from .resilience import LatencyTracker, retry_policy_from_env
+from .cache import CacheManager, OcidCache, cache_manager as default_cache_manager, ocid_cache as default_ocid_cache
 
-load_dotenv(find_dotenv())
 
 # Error Response Models
 class ErrorDetail(BaseModel):
@@ -79,6 +88,122 @@ class CharacterStatResponse(BaseModel):
     remain_ap: Optional[int] = Field(0, description="잔여 AP")
 
 
+# 경량 레코드: 서비스 / 저장소가 읽는 필드만 담은 튜플 (기본 파싱 모드)
+# 남긴 필드는 위 모델과 이름이 같지만 모델의 일부만 담습니다.
+# (CharacterStatRecord는 date와 아케인포스 / 어센틱포스 항목만, 모든 필드가 필요하면 strict_validation 사용)
+
+# 능력치 응답에서 남기는 항목
+FORCE_STAT_NAMES = ("아케인포스", "어센틱포스")
+
+
+def _optional_int(value: Any) -> Optional[int]:
+    return None if value is None else int(value)
+
+
+def _optional_str(value: Any) -> Optional[str]:
+    return None if value is None else str(value)
+
+
+class SymbolRecord(NamedTuple):
+    symbol_name: str
+    symbol_level: int
+    symbol_icon: str
+    symbol_description: str
+    symbol_growth_count: int
+    symbol_require_growth_count: int
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SymbolRecord":
+        name = data["symbol_name"]
+        if not isinstance(name, str):
+            raise ValueError(f"symbol_name이 문자열이 아닙니다: {name!r}")
+        return cls(
+            name,
+            int(data.get("symbol_level", 0)),
+            data.get("symbol_icon") or "",
+            data.get("symbol_description") or "",
+            int(data.get("symbol_growth_count", 0)),
+            int(data.get("symbol_require_growth_count", 0))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class SymbolEquipmentRecord(NamedTuple):
+    date: Optional[str]
+    character_class: str
+    symbol: Tuple[SymbolRecord, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SymbolEquipmentRecord":
+        return cls(
+            data.get("date"),
+            data.get("character_class") or "",
+            tuple(SymbolRecord.from_dict(sym) for sym in data.get("symbol") or ())
+        )
+
+
+class CharacterBasicRecord(NamedTuple):
+    date: Optional[str]
+    character_name: Optional[str]
+    world_name: Optional[str]
+    character_class: Optional[str]
+    character_level: Optional[int]
+    character_image: Optional[str]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CharacterBasicRecord":
+        return cls(
+            data.get("date"),
+            _optional_str(data.get("character_name")),
+            _optional_str(data.get("world_name")),
+            _optional_str(data.get("character_class")),
+            _optional_int(data.get("character_level", 0)),
+            _optional_str(data.get("character_image"))
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        return self._asdict()
+
+
+class FinalStatRecord(NamedTuple):
+    stat_name: str
+    stat_value: Optional[str]
+
+
+class CharacterStatRecord(NamedTuple):
+    date: Optional[str]
+    final_stat: Tuple[FinalStatRecord, ...]
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CharacterStatRecord":
+        final_stat = []
+        for stat in data.get("final_stat") or ():
+            if stat["stat_name"] in FORCE_STAT_NAMES:
+                value = stat.get("stat_value", "0")
+                # 저장 / 변환 시 int()로 읽으므로 숫자가 아니면 여기서 실패
+                int(value or 0)
+                final_stat.append(FinalStatRecord(stat["stat_name"], _optional_str(value)))
+        return cls(data.get("date"), tuple(final_stat))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"date": self.date, "final_stat": [stat._asdict() for stat in self.final_stat]}
+
+
+# 파싱 모드에 따른 get_character_* 반환 타입
+CharacterBasicData = Union[CharacterBasic, CharacterBasicRecord]
+SymbolEquipmentData = Union[SymbolEquipmentResponse, SymbolEquipmentRecord]
+CharacterStatData = Union[CharacterStatResponse, CharacterStatRecord]
+
+
+def dump_response_json(value: Union[BaseModel, NamedTuple]) -> str:
+    """모델 / 경량 레코드를 저장용 JSON 문자열로 변환"""
+    if isinstance(value, BaseModel):
+        return value.model_dump_json()
+    return json.dumps(value.to_dict(), ensure_ascii=False)
+
+
 # Union type for all possible responses
 MapleApiResponse = Union[
     OcidResponse,
@@ -89,22 +214,53 @@ MapleApiResponse = Union[
 ]
 
 
-class MapleStoryAPI:
-    """MapleStory Open API Client"""
+# 업스트림 API 주소 (부하 테스트 시 python -m api.standin 등 로컬 대역 서버로 변경)
+MAPLE_API_BASE_URL = env_str("MAPLE_API_BASE_URL", "https://open.api.nexon.com/maplestory/v1").rstrip("/")
+
+# 연결 풀 / 타임아웃 설정
+MAPLE_API_MAX_CONNECTIONS = env_int("MAPLE_API_MAX_CONNECTIONS", 100)
+MAPLE_API_MAX_KEEPALIVE = env_int("MAPLE_API_MAX_KEEPALIVE", 20)
+MAPLE_API_TIMEOUT = env_float("MAPLE_API_TIMEOUT", 10.0)
+MAPLE_API_CONNECT_TIMEOUT = env_float("MAPLE_API_CONNECT_TIMEOUT", 3.0)
 
-    BASE_URL = "https://open.api.nexon.com/maplestory/v1"
+# 헤징: 응답이 최근 지연 백분위를 넘기면 같은 요청을 한 번 더 보내 먼저 온 응답 사용
+MAPLE_API_HEDGE = env_bool("MAPLE_API_HEDGE", False)
+MAPLE_API_HEDGE_PERCENTILE = env_float("MAPLE_API_HEDGE_PERCENTILE", 0.95)
 
-    def __init__(self, api_key: Optional[str] = None):
-        self.api_key = api_key or os.getenv("MAPLE_API_KEY")
+# 기본 정보 / 심볼 / 능력치 응답을 Pydantic 모델로 전체 검증 (기본값: 필요한 필드만 경량 레코드로 추출)
+MAPLE_API_STRICT_VALIDATION = env_bool("MAPLE_API_STRICT_VALIDATION", False)
+
+
+class _BaseMapleStoryAPI:
+    """동기/비동기 클라이언트 공통 로직 (URL 구성, 응답 검증)"""
+
+    BASE_URL = MAPLE_API_BASE_URL
+
+    # 존재하지 않는 캐릭터 이름 등 잘못된 파라미터에 대한 업스트림 에러 코드
+    INVALID_PARAMETER_ERROR = "OPENAPI00004"
+
+    def __init__(self, api_key: Optional[str] = None, ocid_cache: Optional[OcidCache] = None,
+                 cache: Optional[CacheManager] = None, rate_limiter: Optional[RateLimiter] = None):
+        self.api_key = api_key or get_api_key()
         if not self.api_key:
             raise ValueError("API key is required. Set MAPLE_API_KEY environment variable or pass api_key parameter.")
-
-    def _make_request(self, endpoint: str, params: dict = None) -> dict:
-        """Make HTTP request to MapleStory API"""
+        self.ocid_cache = ocid_cache or default_ocid_cache
+        self.cache = cache or default_cache_manager
+        # 같은 API 키를 쓰는 모든 클라이언트가 호출 한도를 공유
+        self.rate_limiter = rate_limiter or get_rate_limiter(self.api_key)
+        self.retry_policy = retry_policy_from_env()
+        self.strict_validation = MAPLE_API_STRICT_VALIDATION
+
+    @staticmethod
+    def _ocid_params(ocid: str, date: Optional[Union[date, str]] = None) -> dict:
+        """ocid 기반 조회 파라미터 (date가 있으면 해당 기준일 데이터, 없으면 최신 데이터)"""
+        if date is None:
+            return {"ocid": ocid}
+        return {"ocid": ocid, "date": date.strftime("%Y-%m-%d") if hasattr(date, "strftime") else date}
+
+    def _build_url(self, endpoint: str, params: dict = None) -> str:
+        """엔드포인트와 쿼리 파라미터로 요청 URL 구성"""
         url = f"{self.BASE_URL}{endpoint}"
-        headers = {
-            "x-nxopen-api-key": self.api_key
-        }
 
         # URL 인코딩된 쿼리 파라미터 구성
         if params:
@@ -120,126 +276,394 @@ class MapleStoryAPI:
             if query_params:
                 url += "?" + "&".join(query_params)
 
+        return url
+
+    def _headers(self) -> dict:
+        return {
+            "x-nxopen-api-key": self.api_key
+        }
+
+    def _error_data(self, endpoint: str, error: Exception, response=None) -> dict:
+        """요청 실패를 에러 응답 형식으로 변환 (업스트림 에러 본문이 있으면 그대로 사용)"""
+        logger.error("❌ API 요청 실패 (%s): %s", endpoint, error)
+        if response is not None:
+            try:
+                body = response.json()
+            except ValueError:
+                body = None
+            if isinstance(body, dict) and isinstance(body.get("error"), dict):
+                return {"error": body["error"], "status": response.status_code}
+
+        return {
+            "error": {
+                "name": type(error).__name__,
+                "message": str(error)
+            }
+        }
+
+    def _retry_delay(self, endpoint: str, attempt: int, reason: Any, status_code: Optional[int] = None,
+                     retry_after: Optional[str] = None) -> float:
+        """재시도 전 대기 시간 (429는 속도 제한기를 멈춰 대기하므로 추가 대기 없음)"""
+        logger.warning("🔁 API 재시도 (%s) %d/%d: %s", endpoint, attempt + 1, self.retry_policy.max_retries, reason)
+        if status_code == 429:
+            self._handle_rate_limited(endpoint, retry_after)
+            return 0.0
+        return self.retry_policy.backoff(attempt)
+
+    def _handle_rate_limited(self, endpoint: str, retry_after: Optional[str]) -> None:
+        """429 응답의 Retry-After 동안 공유 속도 제한기를 멈춤"""
+        wait = parse_retry_after(retry_after)
+        logger.warning("⏳ API 호출 한도 초과 (%s): %.1f초 대기", endpoint, wait)
+        self.rate_limiter.pause(wait)
+
+    def _cache_ocid(self, character_name: str, response_data: dict) -> None:
+        """OCID 조회 결과 캐시 (정상 응답은 긴 TTL, 캐릭터 없음은 짧은 TTL)"""
+        if "ocid" in response_data:
+            self.ocid_cache.set(character_name, response_data)
+        elif response_data.get("error", {}).get("name") == self.INVALID_PARAMETER_ERROR:
+            self.ocid_cache.set_missing(character_name, response_data)
+
+    def _parse_ocid(self, response_data: dict) -> OcidResponse:
+        if "error" in response_data:
+            raise ValueError(f"API Error: {response_data['error']['message']}")
+
+        try:
+            return OcidResponse(**response_data)
+        except ValidationError as e:
+            log_pydantic_error(e, response_data, "OcidResponse")
+            raise ValueError(f"API 응답 데이터 검증 실패: {e}")
+
+    def _parse_record(self, record_type: Any, response_data: dict, label: str) -> Any:
+        """필요한 필드만 경량 레코드로 추출 (누락 / 타입 오류는 검증 실패로 처리)"""
+        try:
+            return record_type.from_dict(response_data)
+        except (KeyError, TypeError, ValueError) as e:
+            log_pydantic_error(e, response_data, record_type.__name__)
+            raise ValueError(f"{label} API 응답 데이터 검증 실패: {e!r}")
+
+    def _parse_symbol_equipment(self, response_data: dict) -> SymbolEquipmentData:
+        if "error" in response_data:
+            raise ValueError(f"API Error: {response_data['error']['message']}")
+        if not self.strict_validation:
+            return self._parse_record(SymbolEquipmentRecord, response_data, "심볼")
+
+        try:
+            return SymbolEquipmentResponse(**response_data)
+        except ValidationError as e:
+            log_pydantic_error(e, response_data, "SymbolEquipmentResponse")
+            raise ValueError(f"심볼 API 응답 데이터 검증 실패: {e}")
+
+    def _parse_basic(self, response_data: dict) -> CharacterBasicData:
+        if "error" in response_data:
+            raise ValueError(f"API Error: {response_data['error']['message']}")
+        if not self.strict_validation:
+            return self._parse_record(CharacterBasicRecord, response_data, "기본 정보")
+
+        try:
+            return CharacterBasic(**response_data)
+        except ValidationError as e:
+            log_pydantic_error(e, response_data, "CharacterBasic")
+            raise ValueError(f"기본 정보 API 응답 데이터 검증 실패: {e}")
+
+    def _parse_stat(self, response_data: dict) -> CharacterStatData:
+        if "error" in response_data:
+            raise ValueError(f"API Error: {response_data['error']['message']}")
+        if not self.strict_validation:
+            return self._parse_record(CharacterStatRecord, response_data, "능력치")
+
+        try:
+            return CharacterStatResponse(**response_data)
+        except ValidationError as e:
+            log_pydantic_error(e, response_data, "CharacterStatResponse")
+            # 상세한 final_stat 필드 검사
+            if logger.isEnabledFor(logging.DEBUG) and isinstance(response_data.get("final_stat"), list):
+                logger.debug("🔍 final_stat 항목별 검사:")
+                for i, stat in enumerate(response_data["final_stat"]):
+                    if isinstance(stat, dict):
+                        logger.debug("  [%d] %s: %s (타입: %s)", i, stat.get("stat_name", "Unknown"),
+                                     stat.get("stat_value", "None"), type(stat.get("stat_value")).__name__)
+            raise ValueError(f"능력치 API 응답 데이터 검증 실패: {e}")
+
+
+class MapleStoryAPI(_BaseMapleStoryAPI):
+    """MapleStory Open API Client"""
+
+    def __init__(self, api_key: Optional[str] = None, ocid_cache: Optional[OcidCache] = None,
+                 cache: Optional[CacheManager] = None, rate_limiter: Optional[RateLimiter] = None):
+        super().__init__(api_key, ocid_cache, cache, rate_limiter)
+        self._inflight = SingleFlight()
+        # keep-alive 연결 재사용
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=MAPLE_API_MAX_KEEPALIVE,
+            pool_maxsize=MAPLE_API_MAX_CONNECTIONS
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def _make_request(self, endpoint: str, params: dict = None, priority: int = PRIORITY_INTERACTIVE) -> dict:
+        """Make HTTP request to MapleStory API"""
+        cache_key = self.cache.make_key(endpoint, params)
+        cached = self.cache.get(cache_key)
+        if self.cache.cache_enabled:
+            CACHE_REQUESTS.inc("response", "miss" if cached is None else "hit")
+        if cached is not None:
+            return cached
+
+        # 같은 요청이 이미 진행 중이면 그 결과를 함께 사용
+        return self._inflight.do(cache_key, self._fetch, endpoint, params, cache_key, priority)
+
+    def _fetch(self, endpoint: str, params: Optional[dict], cache_key: str, priority: int) -> dict:
+        url = self._build_url(endpoint, params)
+
         log_api_call(endpoint, params)
 
+        # 연결 실패 / 타임아웃 / 재시도 대상 상태 코드는 지수 백오프로 재시도 (GET은 멱등)
+        policy = self.retry_policy
+        for attempt in range(policy.attempts):
+            last_attempt = attempt + 1 == policy.attempts
+            RATE_LIMIT_WAIT.observe(self.rate_limiter.acquire(priority), str(priority))
+            start = time.perf_counter()
+            try:
+                response = self.session.get(url, headers=self._headers(),
+                                            timeout=(MAPLE_API_CONNECT_TIMEOUT, MAPLE_API_TIMEOUT))
+            except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+                UPSTREAM_RESPONSES.inc(endpoint, type(e).__name__)
+                if last_attempt:
+                    return self._error_data(endpoint, e)
+                time.sleep(self._retry_delay(endpoint, attempt, e))
+                continue
+            except requests.exceptions.RequestException as e:
+                UPSTREAM_RESPONSES.inc(endpoint, type(e).__name__)
+                return self._error_data(endpoint, e)
+
+            UPSTREAM_DURATION.observe(time.perf_counter() - start, endpoint)
+            UPSTREAM_RESPONSES.inc(endpoint, str(response.status_code))
+            if last_attempt or not policy.is_retryable_status(response.status_code):
+                break
+            time.sleep(self._retry_delay(endpoint, attempt, f"HTTP {response.status_code}",
+                                         response.status_code, response.headers.get("Retry-After")))
+
         try:
-            response = requests.get(url, headers=headers)
             response.raise_for_status()
             response_data = response.json()
-            log_api_data(response_data, f"API 응답 ({endpoint})")
-            return response_data
         except requests.exceptions.RequestException as e:
-            error_data = {
-                "error": {
-                    "name": type(e).__name__,
-                    "message": str(e)
-                }
-            }
-            logger.error(f"❌ API 요청 실패 ({endpoint}): {e}")
-            return error_data
+            return self._error_data(endpoint, e, response)
+
+        log_api_data(response_data, f"API 응답 ({endpoint})")
+        self.cache.set(cache_key, response_data)
+        return response_data
 
+    def close(self) -> None:
+        """연결 풀 정리"""
+        self.session.close()
 
-    def get_character_ocid(self, character_name: str) -> OcidResponse:
+    def get_character_ocid(self, character_name: str, priority: int = PRIORITY_INTERACTIVE) -> OcidResponse:
         """
         캐릭터 식별자(ocid) 조회
 
         Args:
             character_name: 캐릭터 이름
+            priority: 호출 우선순위 (작을수록 먼저 처리)
 
         Returns:
             OcidResponse: 캐릭터 OCID 정보
         """
-        endpoint = "/id"
-        params = {"character_name": character_name}
-
-        response_data = self._make_request(endpoint, params)
-
-        if "error" in response_data:
-            raise ValueError(f"API Error: {response_data['error']['message']}")
-
-        try:
-            return OcidResponse(**response_data)
-        except ValidationError as e:
-            log_pydantic_error(e, response_data, "OcidResponse")
-            raise ValueError(f"API 응답 데이터 검증 실패: {e}")
-
-    def get_character_symbol_equipment(self, ocid: str) -> SymbolEquipmentResponse:
+        response_data = self.ocid_cache.get(character_name)
+        CACHE_REQUESTS.inc("ocid", "miss" if response_data is None else "hit")
+        if response_data is None:
+            response_data = self._make_request("/id", {"character_name": character_name}, priority)
+            self._cache_ocid(character_name, response_data)
+        return self._parse_ocid(response_data)
+
+    def get_character_symbol_equipment(self, ocid: str, priority: int = PRIORITY_INTERACTIVE,
+                                       date: Optional[Union[date, str]] = None) -> SymbolEquipmentData:
         """
         장착 심볼 정보 조회
 
         Args:
             ocid: 캐릭터 식별자
+            priority: 호출 우선순위 (작을수록 먼저 처리)
+            date: 조회 기준일 (기본값: 최신)
 
         Returns:
-            SymbolEquipmentResponse: 심볼 장비 정보
+            SymbolEquipmentData: 심볼 장비 정보 (MAPLE_API_STRICT_VALIDATION이면 SymbolEquipmentResponse)
         """
-        endpoint = "/character/symbol-equipment"
-        params = {"ocid": ocid}
-
-        response_data = self._make_request(endpoint, params)
-
-        if "error" in response_data:
-            raise ValueError(f"API Error: {response_data['error']['message']}")
+        return self._parse_symbol_equipment(self._make_request("/character/symbol-equipment", self._ocid_params(ocid, date), priority))
 
-        try:
-            return SymbolEquipmentResponse(**response_data)
-        except ValidationError as e:
-            log_pydantic_error(e, response_data, "SymbolEquipmentResponse")
-            raise ValueError(f"심볼 API 응답 데이터 검증 실패: {e}")
-
-    def get_character_basic(self, ocid: str) -> CharacterBasic:
+    def get_character_basic(self, ocid: str, priority: int = PRIORITY_INTERACTIVE,
+                            date: Optional[Union[date, str]] = None) -> CharacterBasicData:
         """
         캐릭터 기본 정보 조회
 
         Args:
             ocid: 캐릭터 식별자
+            priority: 호출 우선순위 (작을수록 먼저 처리)
+            date: 조회 기준일 (기본값: 최신)
 
         Returns:
-            CharacterBasic: 캐릭터 기본 정보
+            CharacterBasicData: 캐릭터 기본 정보 (MAPLE_API_STRICT_VALIDATION이면 CharacterBasic)
         """
-        endpoint = "/character/basic"
-        params = {"ocid": ocid}
-
-        response_data = self._make_request(endpoint, params)
-
-        if "error" in response_data:
-            raise ValueError(f"API Error: {response_data['error']['message']}")
-
-        try:
-            return CharacterBasic(**response_data)
-        except ValidationError as e:
-            log_pydantic_error(e, response_data, "CharacterBasic")
-            raise ValueError(f"기본 정보 API 응답 데이터 검증 실패: {e}")
+        return self._parse_basic(self._make_request("/character/basic", self._ocid_params(ocid, date), priority))
 
-    def get_character_stat(self, ocid: str) -> CharacterStatResponse:
+    def get_character_stat(self, ocid: str, priority: int = PRIORITY_INTERACTIVE,
+                           date: Optional[Union[date, str]] = None) -> CharacterStatData:
         """
         종합 능력치 정보 조회
 
         Args:
             ocid: 캐릭터 식별자
+            priority: 호출 우선순위 (작을수록 먼저 처리)
+            date: 조회 기준일 (기본값: 최신)
 
         Returns:
-            CharacterStatResponse: 종합 능력치 정보
+            CharacterStatData: 종합 능력치 정보 (MAPLE_API_STRICT_VALIDATION이면 CharacterStatResponse)
         """
-        endpoint = "/character/stat"
-        params = {"ocid": ocid}
+        return self._parse_stat(self._make_request("/character/stat", self._ocid_params(ocid, date), priority))
+
+
+class AsyncMapleStoryAPI(_BaseMapleStoryAPI):
+    """MapleStory Open API 비동기 클라이언트 (공유 keep-alive 연결 풀)"""
+
+    def __init__(self, api_key: Optional[str] = None, ocid_cache: Optional[OcidCache] = None,
+                 cache: Optional[CacheManager] = None, rate_limiter: Optional[RateLimiter] = None,
+                 max_connections: int = MAPLE_API_MAX_CONNECTIONS,
+                 max_keepalive_connections: int = MAPLE_API_MAX_KEEPALIVE, timeout: float = MAPLE_API_TIMEOUT,
+                 connect_timeout: float = MAPLE_API_CONNECT_TIMEOUT, hedge: bool = MAPLE_API_HEDGE,
+                 hedge_percentile: float = MAPLE_API_HEDGE_PERCENTILE):
+        super().__init__(api_key, ocid_cache, cache, rate_limiter)
+        self._inflight = AsyncSingleFlight()
+        self.hedge = hedge
+        self.hedge_percentile = hedge_percentile
+        self.latency = LatencyTracker()
+        self.client = httpx.AsyncClient(
+            headers=self._headers(),
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections
+            ),
+            timeout=httpx.Timeout(timeout, connect=connect_timeout)
+        )
+
+    async def _make_request(self, endpoint: str, params: dict = None, priority: int = PRIORITY_INTERACTIVE) -> dict:
+        """Make async HTTP request to MapleStory API"""
+        cache_key = self.cache.make_key(endpoint, params)
+        cached = self.cache.get(cache_key)
+        if self.cache.cache_enabled:
+            CACHE_REQUESTS.inc("response", "miss" if cached is None else "hit")
+        if cached is not None:
+            return cached
+
+        # 같은 요청이 이미 진행 중이면 그 결과를 함께 사용
+        return await self._inflight.do(cache_key, self._fetch, endpoint, params, cache_key, priority)
+
+    async def _fetch(self, endpoint: str, params: Optional[dict], cache_key: str, priority: int) -> dict:
+        url = self._build_url(endpoint, params)
 
-        response_data = self._make_request(endpoint, params)
+        log_api_call(endpoint, params)
 
-        if "error" in response_data:
-            raise ValueError(f"API Error: {response_data['error']['message']}")
+        # 연결 실패 / 타임아웃 / 재시도 대상 상태 코드는 지수 백오프로 재시도 (GET은 멱등)
+        policy = self.retry_policy
+        for attempt in range(policy.attempts):
+            last_attempt = attempt + 1 == policy.attempts
+            RATE_LIMIT_WAIT.observe(await self.rate_limiter.acquire_async(priority), str(priority))
+            try:
+                response = await self._send(url, endpoint)
+            except httpx.TransportError as e:
+                UPSTREAM_RESPONSES.inc(endpoint, type(e).__name__)
+                if last_attempt:
+                    return self._error_data(endpoint, e)
+                await asyncio.sleep(self._retry_delay(endpoint, attempt, e))
+                continue
+            except httpx.HTTPError as e:
+                UPSTREAM_RESPONSES.inc(endpoint, type(e).__name__)
+                return self._error_data(endpoint, e)
+
+            UPSTREAM_RESPONSES.inc(endpoint, str(response.status_code))
+            if last_attempt or not policy.is_retryable_status(response.status_code):
+                break
+            await asyncio.sleep(self._retry_delay(endpoint, attempt, f"HTTP {response.status_code}",
+                                                  response.status_code, response.headers.get("Retry-After")))
 
         try:
-            return CharacterStatResponse(**response_data)
-        except ValidationError as e:
-            log_pydantic_error(e, response_data, "CharacterStatResponse")
-            # 상세한 final_stat 필드 검사
-            if "final_stat" in response_data and isinstance(response_data["final_stat"], list):
-                logger.debug("🔍 final_stat 항목별 검사:")
-                for i, stat in enumerate(response_data["final_stat"]):
-                    if isinstance(stat, dict):
-                        logger.debug(f"  [{i}] {stat.get('stat_name', 'Unknown')}: {stat.get('stat_value', 'None')} (타입: {type(stat.get('stat_value', None)).__name__})")
-            raise ValueError(f"능력치 API 응답 데이터 검증 실패: {e}")
+            response.raise_for_status()
+            response_data = response.json()
+        except (httpx.HTTPError, ValueError) as e:
+            return self._error_data(endpoint, e, response)
+
+        log_api_data(response_data, f"API 응답 ({endpoint})")
+        self.cache.set(cache_key, response_data)
+        return response_data
+
+    async def _timed_get(self, url: str, endpoint: str) -> httpx.Response:
+        start = time.perf_counter()
+        response = await self.client.get(url)
+        elapsed = time.perf_counter() - start
+        self.latency.record(endpoint, elapsed)
+        UPSTREAM_DURATION.observe(elapsed, endpoint)
+        return response
+
+    async def _send(self, url: str, endpoint: str) -> httpx.Response:
+        """
+        요청 전송 (헤징 활성화 시 최근 지연 백분위 안에 응답이 없으면 같은 요청을 한 번 더 보냄)
+
+        헤지 요청은 속도 제한기에 남은 토큰이 있을 때만 보내므로 대기열을 밀어내지 않습니다.
+        """
+        threshold = self.latency.percentile(endpoint, self.hedge_percentile) if self.hedge else None
+        if threshold is None:
+            return await self._timed_get(url, endpoint)
+
+        primary = asyncio.ensure_future(self._timed_get(url, endpoint))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=threshold)
+            if done or not self.rate_limiter.try_acquire():
+                return await primary
+
+            logger.debug("🪃 헤지 요청 전송 (%s): %.0fms 초과", endpoint, threshold * 1000)
+            tasks.add(asyncio.ensure_future(self._timed_get(url, endpoint)))
+            pending = set(tasks)
+            error: Optional[BaseException] = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            # 호출자가 취소되어도 진행 중인 업스트림 요청이 남지 않도록 정리
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+
+    async def aclose(self) -> None:
+        """연결 풀 정리"""
+        await self.client.aclose()
+
+    async def get_character_ocid(self, character_name: str, priority: int = PRIORITY_INTERACTIVE) -> OcidResponse:
+        """캐릭터 식별자(ocid) 조회"""
+        response_data = self.ocid_cache.get(character_name)
+        CACHE_REQUESTS.inc("ocid", "miss" if response_data is None else "hit")
+        if response_data is None:
+            response_data = await self._make_request("/id", {"character_name": character_name}, priority)
+            self._cache_ocid(character_name, response_data)
+        return self._parse_ocid(response_data)
+
+    async def get_character_symbol_equipment(self, ocid: str, priority: int = PRIORITY_INTERACTIVE,
+                                             date: Optional[Union[date, str]] = None) -> SymbolEquipmentData:
+        """장착 심볼 정보 조회"""
+        return self._parse_symbol_equipment(await self._make_request("/character/symbol-equipment", self._ocid_params(ocid, date), priority))
+
+    async def get_character_basic(self, ocid: str, priority: int = PRIORITY_INTERACTIVE,
+                                  date: Optional[Union[date, str]] = None) -> CharacterBasicData:
+        """캐릭터 기본 정보 조회"""
+        return self._parse_basic(await self._make_request("/character/basic", self._ocid_params(ocid, date), priority))
+
+    async def get_character_stat(self, ocid: str, priority: int = PRIORITY_INTERACTIVE,
+                                 date: Optional[Union[date, str]] = None) -> CharacterStatData:
+        """종합 능력치 정보 조회"""
+        return self._parse_stat(await self._make_request("/character/stat", self._ocid_params(ocid, date), priority))
 
 
 # Convenience functions for direct usage
@@ -250,14 +674,16 @@ def get_character_ocid(character_name: str, api_key: Optional[str] = None) -> Oc
 
 
 def get_character_symbol_equipment(ocid: str, api_key: Optional[str] = None) -> SymbolEquipmentResponse:
-    """심볼 장비 정보 조회 (편의 함수)"""
+    """심볼 장비 정보 조회 (편의 함수, 항상 전체 모델로 검증)"""
     api = MapleStoryAPI(api_key)
+    api.strict_validation = True
     return api.get_character_symbol_equipment(ocid)
 
 
 def get_character_stat(ocid: str, api_key: Optional[str] = None) -> CharacterStatResponse:
-    """종합 능력치 정보 조회 (편의 함수)"""
+    """종합 능력치 정보 조회 (편의 함수, 항상 전체 모델로 검증)"""
     api = MapleStoryAPI(api_key)
+    api.strict_validation = True
     return api.get_character_stat(ocid)
 
 
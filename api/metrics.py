@@ -0,0 +1,210 @@
+"""
+요청 / 단계별 지표 모듈
+
+외부 의존성 없이 카운터와 히스토그램을 보관하고 Prometheus 텍스트 형식(0.0.4)으로 내보냅니다.
+관측은 잠금 하나와 버킷 이분 탐색만 수행하므로 요청 경로에 두어도 부담이 작습니다.
+
+    GET /metrics
+"""
+import threading
+import time
+from bisect import bisect_left
+from typing import Any, Awaitable, Callable, Dict, List, Sequence, Tuple
+
+# 지연(초) 히스토그램 기본 버킷
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    """레이블별 누적 카운터"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._values: Dict[Tuple[str, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, *labels: str, amount: float = 1.0) -> None:
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def value(self, *labels: str) -> float:
+        return self._values.get(labels, 0.0)
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for labels, value in items:
+            lines.append(f"{self.name}{_format_labels(self.labelnames, labels)} {value:g}")
+        return lines
+
+
+class _Timer:
+    """with 블록 실행 시간을 히스토그램에 기록"""
+
+    __slots__ = ("histogram", "labels", "start")
+
+    def __init__(self, histogram: "Histogram", labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self) -> "_Timer":
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.histogram.observe(time.perf_counter() - self.start, *self.labels)
+
+
+class Histogram:
+    """레이블별 누적 버킷 히스토그램"""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (),
+                 buckets: Sequence[float] = DEFAULT_BUCKETS):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # 레이블 → [버킷별 개수(마지막은 +Inf), 합계]
+        self._values: Dict[Tuple[str, ...], Tuple[List[int], List[float]]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, value: float, *labels: str) -> None:
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            entry = self._values.get(labels)
+            if entry is None:
+                entry = self._values[labels] = ([0] * (len(self.buckets) + 1), [0.0])
+            entry[0][index] += 1
+            entry[1][0] += value
+
+    def time(self, *labels: str) -> _Timer:
+        """with 블록 실행 시간 기록"""
+        return _Timer(self, labels)
+
+    async def time_await(self, awaitable: Awaitable, *labels: str) -> Any:
+        """코루틴 완료까지 걸린 시간 기록 (asyncio.gather 안에서 단계별로 측정할 때 사용)"""
+        with _Timer(self, labels):
+            return await awaitable
+
+    def time_call(self, labels: Tuple[str, ...], fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """함수 실행 시간 기록 (작업 스레드에 넘길 때 사용)"""
+        with _Timer(self, labels):
+            return fn(*args, **kwargs)
+
+    def count(self, *labels: str) -> int:
+        entry = self._values.get(labels)
+        return sum(entry[0]) if entry else 0
+
+    def render(self) -> List[str]:
+        lines = [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((labels, (list(counts), total[0])) for labels, (counts, total) in self._values.items())
+        for labels, (counts, total) in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), counts):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else f"{bound:g}"
+                label_text = _format_labels(self.labelnames, labels, 'le="' + le + '"')
+                lines.append(f"{self.name}_bucket{label_text} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.labelnames, labels)} {total:g}")
+            lines.append(f"{self.name}_count{_format_labels(self.labelnames, labels)} {cumulative}")
+        return lines
+
+
+class Registry:
+    """지표 모음"""
+
+    def __init__(self):
+        self._metrics: List[Any] = []
+
+    def register(self, metric: Any) -> Any:
+        self._metrics.append(metric)
+        return metric
+
+    def render(self) -> str:
+        """Prometheus 텍스트 형식"""
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+HTTP_REQUEST_DURATION = REGISTRY.register(Histogram(
+    "http_request_duration_seconds", "HTTP request latency by route and status",
+    ("method", "route", "status")
+))
+STAGE_DURATION = REGISTRY.register(Histogram(
+    "maple_stage_duration_seconds", "Time spent per processing stage (ocid, basic, symbol, stat, transform, optimize)",
+    ("stage",)
+))
+UPSTREAM_DURATION = REGISTRY.register(Histogram(
+    "maple_upstream_request_duration_seconds", "Nexon Open API round-trip latency per attempt",
+    ("endpoint",)
+))
+UPSTREAM_RESPONSES = REGISTRY.register(Counter(
+    "maple_upstream_responses_total", "Nexon Open API responses by status code or transport error",
+    ("endpoint", "status")
+))
+RATE_LIMIT_WAIT = REGISTRY.register(Histogram(
+    "maple_rate_limit_wait_seconds", "Time spent queued in the API rate limiter",
+    ("priority",)
+))
+CACHE_REQUESTS = REGISTRY.register(Counter(
+    "maple_cache_requests_total", "Cache lookups by cache and result (hit, miss, stale)",
+    ("cache", "result")
+))
+
+
+class MetricsMiddleware:
+    """
+    HTTP 요청 지연 기록 ASGI 미들웨어
+
+    경로 레이블은 실제 URL이 아니라 매칭된 라우트 경로(/api/character/{character_name}/init)를 사용해
+    캐릭터 이름마다 시계열이 늘어나지 않게 합니다.
+    """
+
+    def __init__(self, app: Callable):
+        self.app = app
+
+    async def __call__(self, scope: Dict, receive: Callable, send: Callable) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        start = time.perf_counter()
+        status = "500"
+
+        async def send_wrapper(message: Dict) -> None:
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = str(message["status"])
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            HTTP_REQUEST_DURATION.observe(time.perf_counter() - start, scope["method"],
+                                          getattr(route, "path", "unmatched"), status)
+
+
+def render_metrics() -> str:
+    return REGISTRY.render()
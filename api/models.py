@@ -1,5 +1,6 @@
 from pydantic import BaseModel, Field
-from typing import List, Dict, Literal
+from typing import Annotated, Any, List, Dict, Literal, Optional
+from datetime import date
 from enum import Enum
 
 
@@ -8,15 +9,21 @@ class ForceType(str, Enum):
     AUTHENTIC = "Authentic"
 
 
-class ForceOptimizeRequest(BaseModel):
-    """심볼 최적화 요청 모델"""
+class SolverType(str, Enum):
+    GREEDY = "greedy"
+    EXACT = "exact"
+
+
+class JointMode(str, Enum):
+    MIN_COST = "min_cost"
+    MAX_FORCE = "max_force"
+
+
+class ForceStateRequest(BaseModel):
+    """심볼 시작 상태 공통 요청 모델"""
     force_type: ForceType = Field(
         description="포스 타입 ('Arcane' 또는 'Authentic')"
     )
-    force_goal: int = Field(
-        description="목표 포스 수치",
-        gt=0
-    )
     char_level: int = Field(
         description="캐릭터 레벨",
         ge=200
@@ -43,6 +50,26 @@ class ForceOptimizeRequest(BaseModel):
             raise ValueError(f"심볼 레벨은 0에서 {max_level} 사이여야 합니다")
 
 
+class ForceOptimizeRequest(ForceStateRequest):
+    """심볼 최적화 요청 모델"""
+    force_goal: int = Field(
+        description="목표 포스 수치",
+        gt=0
+    )
+    solver: SolverType = Field(
+        default=SolverType.GREEDY,
+        description="최적화 방식 ('greedy': 단계별 최저 비용, 'exact': 최소 총비용 보장)"
+    )
+
+
+class ForceBudgetRequest(ForceStateRequest):
+    """예산 기반 최대 포스 요청 모델"""
+    budget: int = Field(
+        description="사용 가능한 메소",
+        ge=0
+    )
+
+
 class UpgradeStep(BaseModel):
     """업그레이드 단계 정보"""
     symbol: str = Field(description="업그레이드할 심볼 이름")
@@ -65,3 +92,234 @@ class ForceOptimizeResponse(BaseModel):
     upgrade_path: List[UpgradeStep] = Field(
         description="업그레이드 경로"
     )
+
+
+class ForceOptimizeBatchRequest(BaseModel):
+    """심볼 최적화 일괄 요청 모델"""
+    requests: List[Dict[str, Any]] = Field(
+        description="ForceOptimizeRequest 형식의 요청 목록 (항목별로 검증)",
+        min_items=1,
+        max_items=1000
+    )
+
+
+class ForceOptimizeBatchItem(BaseModel):
+    """일괄 요청 항목별 결과"""
+    index: int = Field(description="요청 목록에서의 위치")
+    result: Optional[ForceOptimizeResponse] = Field(
+        default=None,
+        description="최적화 결과 (실패 시 null)"
+    )
+    error: Optional[str] = Field(
+        default=None,
+        description="오류 메시지 (성공 시 null)"
+    )
+
+
+class ForceOptimizeBatchResponse(BaseModel):
+    """심볼 최적화 일괄 응답 모델"""
+    results: List[ForceOptimizeBatchItem] = Field(
+        description="입력 순서대로 정렬된 항목별 결과"
+    )
+
+
+class ForceBudgetResponse(ForceOptimizeResponse):
+    """예산 기반 최대 포스 응답 모델"""
+    achieved_force: int = Field(
+        description="달성 총 포스"
+    )
+    remaining_budget: int = Field(
+        description="남은 메소"
+    )
+
+
+class FrontierPoint(BaseModel):
+    """비용-포스 프론티어의 한 지점"""
+    force: int = Field(description="도달 가능한 총 포스")
+    total_cost: int = Field(description="해당 포스 이상을 얻는 최소 비용")
+    levels: List[int] = Field(description="해당 지점의 심볼 레벨")
+
+
+class ForceFrontierRequest(ForceStateRequest):
+    """비용-포스 프론티어 요청 모델"""
+
+
+class ForceFrontierResponse(BaseModel):
+    """비용-포스 프론티어 응답 모델"""
+    initial_levels: List[int] = Field(
+        description="초기 심볼 레벨"
+    )
+    points: List[FrontierPoint] = Field(
+        description="포스/비용 오름차순 프론티어 지점 목록"
+    )
+
+
+class ForceTarget(BaseModel):
+    """포스 타입 하나의 현재 상태와 목표 (통합 최적화용)"""
+    current_force: int = Field(
+        description="현재 총합 포스 수치",
+        ge=0
+    )
+    symbol_levels: List[int] = Field(
+        description="현재 심볼 레벨 리스트 (아케인: 6개, 어센틱: 7개)",
+        min_items=6,
+        max_items=7
+    )
+    force_goal: Optional[int] = Field(
+        default=None,
+        description="목표 포스 수치",
+        ge=0
+    )
+    bosses: List[str] = Field(
+        default_factory=list,
+        description="목표 보스 목록 (예: 'HARD 윌'), 요구 포스 중 최댓값을 목표로 사용"
+    )
+
+
+class ForceJointRequest(BaseModel):
+    """아케인/어센틱 통합 최적화 요청 모델"""
+    char_level: int = Field(
+        description="캐릭터 레벨",
+        ge=200
+    )
+    arcane: ForceTarget = Field(description="아케인 상태와 목표")
+    authentic: ForceTarget = Field(description="어센틱 상태와 목표")
+    budget: Optional[int] = Field(
+        default=None,
+        description="두 포스 타입이 함께 쓰는 메소 예산 (max_force 모드에서는 필수)",
+        ge=0
+    )
+    mode: JointMode = Field(
+        default=JointMode.MIN_COST,
+        description="'min_cost': 목표를 만족하는 최소 비용, 'max_force': 예산 안에서 포스 합 최대 (예산으로 목표를 만족할 수 없으면 목표 없이 최대)"
+    )
+
+    def validate_symbol_levels(self):
+        """타입별 심볼 레벨 리스트 검증"""
+        for force_type, target in ((ForceType.ARCANE, self.arcane), (ForceType.AUTHENTIC, self.authentic)):
+            ForceStateRequest(
+                force_type=force_type,
+                char_level=self.char_level,
+                current_force=target.current_force,
+                symbol_levels=target.symbol_levels
+            ).validate_symbol_levels()
+
+
+class ForceJointPlan(ForceOptimizeResponse):
+    """통합 최적화 결과 중 포스 타입 하나의 계획"""
+    achieved_force: int = Field(description="달성 총 포스")
+    target_force: int = Field(description="목표 포스 (목표 포스와 보스 요구 포스 중 최댓값)")
+    goal_reached: bool = Field(description="목표 포스 달성 여부")
+
+
+class ForceJointResponse(BaseModel):
+    """아케인/어센틱 통합 최적화 응답 모델"""
+    mode: JointMode = Field(description="최적화 방식")
+    total_cost: int = Field(description="두 타입 합계 비용")
+    remaining_budget: Optional[int] = Field(None, description="남은 메소 (예산 미지정 시 null)")
+    within_budget: bool = Field(description="예산 안에서 목표를 모두 만족하는 계획인지 여부")
+    arcane: ForceJointPlan = Field(description="아케인 계획")
+    authentic: ForceJointPlan = Field(description="어센틱 계획")
+
+
+class ForceSimulateRequest(ForceStateRequest):
+    """목표 포스 도달 일수 시뮬레이션 요청 모델"""
+    force_goal: int = Field(
+        description="목표 포스 수치",
+        gt=0
+    )
+    growth_counts: Optional[List[Annotated[int, Field(ge=0)]]] = Field(
+        default=None,
+        description="지역별 현재 성장치 (기본값: 모두 0)"
+    )
+    daily_symbols: Optional[List[Annotated[int, Field(gt=0)]]] = Field(
+        default=None,
+        description="지역별 일일 심볼 획득량 (기본값: 아케인 20개, 어센틱 10개)"
+    )
+    meso: Optional[int] = Field(
+        default=None,
+        description="보유 메소 (미지정 시 메소 제한 없이 성장치만 고려)",
+        ge=0
+    )
+    daily_meso: int = Field(
+        default=0,
+        description="하루 메소 수입",
+        ge=0
+    )
+    horizon_days: int = Field(
+        default=365,
+        description="최대 시뮬레이션 일수",
+        ge=1,
+        le=3650
+    )
+
+
+class SimulatedUpgradeStep(UpgradeStep):
+    """시뮬레이션 업그레이드 단계 정보"""
+    day: int = Field(description="업그레이드하는 일차 (0: 오늘)")
+
+
+class ForceTimelineEntry(BaseModel):
+    """일차별 포스 변화"""
+    day: int = Field(description="일차")
+    force: int = Field(description="그날 업그레이드 후 총 포스")
+    meso_spent: int = Field(description="그날까지 사용한 누적 메소")
+
+
+class ForceSimulateResponse(BaseModel):
+    """목표 포스 도달 일수 시뮬레이션 응답 모델"""
+    initial_levels: List[int] = Field(description="초기 심볼 레벨")
+    policy: str = Field(description="가장 빨리 도달한 레벨업 우선순위 정책 (메소 제한이 없으면 'unlimited')")
+    days_to_goal: Optional[int] = Field(None, description="목표 도달 일수 (기간 안에 도달하지 못하면 null)")
+    reached_force: int = Field(description="시뮬레이션 종료 시점의 총 포스")
+    total_cost: int = Field(description="사용한 총 메소")
+    upgrade_order: List[SimulatedUpgradeStep] = Field(description="일차별 업그레이드 순서")
+    timeline: List[ForceTimelineEntry] = Field(description="포스가 바뀐 일차별 변화")
+    policies: Dict[str, Optional[int]] = Field(description="정책별 목표 도달 일수")
+
+
+class RosterRequest(BaseModel):
+    """여러 캐릭터 일괄 조회 요청 모델"""
+    names: List[str] = Field(
+        description="캐릭터 이름 목록",
+        min_items=1,
+        max_items=200
+    )
+
+
+class BackfillRequest(BaseModel):
+    """캐릭터 이력 백필 요청 모델"""
+    names: List[str] = Field(
+        description="캐릭터 이름 목록",
+        min_items=1,
+        max_items=100
+    )
+    start: date = Field(
+        description="시작일 (포함)"
+    )
+    end: Optional[date] = Field(
+        default=None,
+        description="종료일 (포함, 기본값: 어제)"
+    )
+
+
+class BackfillError(BaseModel):
+    character_name: str = Field(description="캐릭터 이름")
+    date: Optional[str] = Field(None, description="기준일 (OCID 조회 실패 시 null)")
+    error: str = Field(description="오류 메시지")
+
+
+class BackfillJobResponse(BaseModel):
+    """백필 작업 진행 상황 응답 모델"""
+    job_id: str = Field(description="작업 ID")
+    state: Literal["pending", "running", "done", "failed", "cancelled"] = Field(description="작업 상태")
+    names: List[str] = Field(description="캐릭터 이름 목록")
+    start: str = Field(description="시작일")
+    end: str = Field(description="종료일")
+    total: int = Field(description="전체 스냅샷 수 (캐릭터 수 × 일 수)")
+    fetched: int = Field(description="새로 조회한 스냅샷 수")
+    skipped: int = Field(description="이미 저장되어 건너뛴 스냅샷 수")
+    failed: int = Field(description="조회에 실패한 스냅샷 수")
+    errors: List[BackfillError] = Field(description="오류 목록 (최대 100개)")
+    started_at: Optional[float] = Field(None, description="시작 시각 (Unix time)")
+    finished_at: Optional[float] = Field(None, description="종료 시각 (Unix time)")
@@ -0,0 +1,271 @@
+"""
+Nexon Open API 호출 속도 제한 모듈
+"""
+import asyncio
+import heapq
+import itertools
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Optional
+from .config import env_str
+
+# 우선순위 (작을수록 먼저 처리)
+PRIORITY_INTERACTIVE = 0
+PRIORITY_BACKGROUND = 10
+
+# API 키 종류별 초당 호출 한도 (개발 단계 키는 'test_', 서비스 단계 키는 'live_'로 시작)
+KEY_RATE_LIMITS = {
+    "test_": 5.0,
+    "live_": 500.0
+}
+DEFAULT_RATE_LIMIT = 5.0
+
+
+class _Waiter:
+    __slots__ = ("event", "future", "loop", "cancelled", "granted")
+
+    def __init__(self, event: Optional[threading.Event] = None, future: Optional[asyncio.Future] = None,
+                 loop: Optional[asyncio.AbstractEventLoop] = None):
+        self.event = event
+        self.future = future
+        self.loop = loop
+        self.cancelled = False
+        self.granted = False
+
+    def grant(self) -> None:
+        if self.event is not None:
+            self.event.set()
+        else:
+            self.loop.call_soon_threadsafe(self._resolve)
+
+    def _resolve(self) -> None:
+        if not self.future.done():
+            self.future.set_result(None)
+
+
+class RateLimiter:
+    """
+    우선순위 대기열을 가진 토큰 버킷 속도 제한기
+
+    토큰이 남아 있고 대기열이 비어 있으면 즉시 통과하며, 그렇지 않으면 대기열에 들어가
+    배분 스레드가 토큰이 찰 때마다 우선순위 순(같으면 도착 순)으로 통과시킵니다.
+    스레드(acquire)와 코루틴(acquire_async) 호출자가 같은 버킷을 공유합니다.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """
+        Args:
+            rate: 초당 허용 호출 수
+            burst: 한 번에 허용하는 최대 호출 수 (기본값: 초당 호출 수)
+        """
+        self.rate = rate
+        self.burst = burst or max(1, int(rate))
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+        self._queue = []
+        self._seq = itertools.count()
+        self._cond = threading.Condition()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+        # 통계
+        self._granted = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_take(self) -> bool:
+        """대기열이 비어 있을 때 즉시 토큰을 얻을 수 있으면 사용"""
+        now = time.monotonic()
+        if self._queue or now < self._paused_until:
+            return False
+        self._refill(now)
+        if self._tokens >= 1:
+            self._tokens -= 1
+            return True
+        return False
+
+    def try_acquire(self) -> bool:
+        """대기 없이 토큰을 얻을 수 있을 때만 사용 (헤지 요청 등 부가 호출용)"""
+        with self._cond:
+            taken = self._try_take()
+        if taken:
+            self._record(0.0)
+        return taken
+
+    def _enqueue(self, priority: int, waiter: _Waiter) -> None:
+        if self._closed:
+            raise RuntimeError("rate limiter is closed")
+        heapq.heappush(self._queue, (priority, next(self._seq), waiter))
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._dispatch, name="maple-ratelimit", daemon=True)
+            self._thread.start()
+        self._cond.notify()
+
+    def _record(self, waited: float) -> float:
+        with self._cond:
+            self._granted += 1
+            self._total_wait += waited
+            self._max_wait = max(self._max_wait, waited)
+        return waited
+
+    def acquire(self, priority: int = PRIORITY_INTERACTIVE) -> float:
+        """
+        토큰 하나를 얻을 때까지 대기 (스레드용)
+
+        Args:
+            priority: 우선순위 (작을수록 먼저 처리)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        start = time.monotonic()
+        with self._cond:
+            if self._try_take():
+                waiter = None
+            else:
+                waiter = _Waiter(event=threading.Event())
+                self._enqueue(priority, waiter)
+
+        if waiter is not None:
+            waiter.event.wait()
+        return self._record(time.monotonic() - start)
+
+    async def acquire_async(self, priority: int = PRIORITY_INTERACTIVE) -> float:
+        """
+        토큰 하나를 얻을 때까지 대기 (코루틴용)
+
+        Args:
+            priority: 우선순위 (작을수록 먼저 처리)
+
+        Returns:
+            float: 대기한 시간(초)
+        """
+        start = time.monotonic()
+        with self._cond:
+            if self._try_take():
+                waiter = None
+            else:
+                loop = asyncio.get_running_loop()
+                waiter = _Waiter(future=loop.create_future(), loop=loop)
+                self._enqueue(priority, waiter)
+
+        if waiter is not None:
+            try:
+                await waiter.future
+            except asyncio.CancelledError:
+                with self._cond:
+                    waiter.cancelled = True
+                    if waiter.granted:
+                        # 배분 스레드가 토큰을 넘긴 뒤 취소되었으면 사용하지 않은 토큰을 버킷에 돌려줌
+                        self._refill(time.monotonic())
+                        self._tokens = min(self.burst, self._tokens + 1)
+                        self._cond.notify()
+                raise
+        return self._record(time.monotonic() - start)
+
+    def _dispatch(self) -> None:
+        """대기열 배분 루프 (전용 데몬 스레드)"""
+        with self._cond:
+            while True:
+                while not self._queue and not self._closed:
+                    self._cond.wait()
+                if self._closed:
+                    return
+
+                now = time.monotonic()
+                if now < self._paused_until:
+                    self._cond.wait(self._paused_until - now)
+                    continue
+
+                self._refill(now)
+                if self._tokens < 1:
+                    self._cond.wait((1 - self._tokens) / self.rate)
+                    continue
+
+                _, _, waiter = heapq.heappop(self._queue)
+                if waiter.cancelled:
+                    continue
+                self._tokens -= 1
+                waiter.granted = True
+                try:
+                    waiter.grant()
+                except RuntimeError:
+                    # 대기자의 이벤트 루프가 이미 닫혔으면 토큰을 버킷에 돌려주고 배분을 계속함
+                    waiter.cancelled = True
+                    self._tokens = min(self.burst, self._tokens + 1)
+
+    def pause(self, seconds: float) -> None:
+        """업스트림 Retry-After 등으로 지정된 시간 동안 모든 호출 중지"""
+        with self._cond:
+            self._paused_until = max(self._paused_until, time.monotonic() + seconds)
+            self._tokens = 0.0
+            self._updated = time.monotonic()
+            self._cond.notify()
+
+    def close(self) -> None:
+        """배분 스레드 종료 (이후 대기가 필요한 호출은 RuntimeError)"""
+        with self._cond:
+            self._closed = True
+            self._cond.notify_all()
+            thread = self._thread
+        if thread is not None:
+            thread.join()
+
+    def stats(self) -> Dict[str, Any]:
+        """현재 대기열 깊이 및 대기 시간 통계"""
+        with self._cond:
+            self._refill(time.monotonic())
+            return {
+                "rate": self.rate,
+                "burst": self.burst,
+                "tokens": round(self._tokens, 3),
+                "queue_depth": sum(1 for _, _, waiter in self._queue if not waiter.cancelled),
+                "paused_for": round(max(0.0, self._paused_until - time.monotonic()), 3),
+                "granted": self._granted,
+                "avg_wait": round(self._total_wait / self._granted, 6) if self._granted else 0.0,
+                "max_wait": round(self._max_wait, 6)
+            }
+
+
+def parse_retry_after(value: Optional[str], default: float = 1.0) -> float:
+    """Retry-After 헤더(초 또는 HTTP 날짜)를 대기 시간(초)으로 변환"""
+    if not value:
+        return default
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return default
+
+
+_limiters: Dict[str, RateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(api_key: str) -> RateLimiter:
+    """
+    API 키별 공유 속도 제한기 조회
+
+    MAPLE_API_RATE_LIMIT 환경변수가 있으면 그 값을, 없으면 키 종류별 기본 한도를 사용합니다.
+    """
+    with _limiters_lock:
+        limiter = _limiters.get(api_key)
+        if limiter is None:
+            rate = env_str("MAPLE_API_RATE_LIMIT")
+            if rate:
+                rate = float(rate)
+            else:
+                rate = next((limit for prefix, limit in KEY_RATE_LIMITS.items() if api_key.startswith(prefix)),
+                            DEFAULT_RATE_LIMIT)
+            limiter = RateLimiter(rate)
+            _limiters[api_key] = limiter
+        return limiter
@@ -0,0 +1,77 @@
+"""
+업스트림 호출 재시도 / 헤징 정책 모듈
+"""
+import random
+import threading
+from collections import deque
+from typing import Deque, Dict, Optional
+from .config import env_float, env_int
+
+# 재시도 대상 HTTP 상태 코드 (429는 Retry-After로 별도 처리)
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+
+
+class RetryPolicy:
+    """지터를 적용한 지수 백오프 재시도 정책 (멱등 GET 요청 전용)"""
+
+    def __init__(self, max_retries: int = 2, backoff_base: float = 0.2, backoff_max: float = 5.0):
+        """
+        Args:
+            max_retries: 최초 시도 이후 최대 재시도 횟수
+            backoff_base: 첫 재시도 대기 상한(초), 시도마다 2배씩 증가
+            backoff_max: 재시도 대기 상한(초)
+        """
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+
+    @property
+    def attempts(self) -> int:
+        return self.max_retries + 1
+
+    def is_retryable_status(self, status_code: int) -> bool:
+        return status_code in RETRYABLE_STATUS_CODES
+
+    def backoff(self, attempt: int) -> float:
+        """attempt번째(0부터) 실패 후 대기 시간 - 0과 지수 상한 사이 균등 분포 (full jitter)"""
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+
+class LatencyTracker:
+    """
+    엔드포인트별 최근 응답 시간 분포
+
+    헤징 기준(지연 백분위)을 계산하기 위해 엔드포인트마다 최근 window개의 응답 시간을 보관합니다.
+    """
+
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        self.window = window
+        self.min_samples = min_samples
+        self._samples: Dict[str, Deque[float]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, endpoint: str, seconds: float) -> None:
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None:
+                samples = self._samples[endpoint] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+    def percentile(self, endpoint: str, percentile: float) -> Optional[float]:
+        """지연 백분위(0~1) 값, 표본이 부족하면 None"""
+        with self._lock:
+            samples = self._samples.get(endpoint)
+            if samples is None or len(samples) < self.min_samples:
+                return None
+            ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(percentile * len(ordered)))
+        return ordered[index]
+
+
+def retry_policy_from_env() -> RetryPolicy:
+    """환경변수 기반 재시도 정책 생성"""
+    return RetryPolicy(
+        max_retries=env_int("MAPLE_API_MAX_RETRIES", 2),
+        backoff_base=env_float("MAPLE_API_BACKOFF_BASE", 0.2),
+        backoff_max=env_float("MAPLE_API_BACKOFF_MAX", 5.0)
+    )
@@ -1,48 +1,272 @@
-from typing import Dict, Optional, List, Tuple
-from datetime import date, timedelta
-from pathlib import Path
-from .maple import MapleStoryAPI, get_character_ocid, get_character_symbol_equipment, get_character_stat
+import asyncio
+import heapq
+import sqlite3
+import threading
+import time
+from bisect import bisect_left, bisect_right
+from typing import Any, AsyncIterator, Callable, Dict, Optional, List, Tuple
+from datetime import date, datetime, timedelta
+from .maple import (
+    MapleStoryAPI, AsyncMapleStoryAPI, CharacterBasicData, SymbolEquipmentData, CharacterStatData,
+    get_character_ocid, get_character_symbol_equipment, get_character_stat
+)
+from .cache import LRUCache
+from .logger import logger
+from .metrics import CACHE_REQUESTS, STAGE_DURATION
+from .ratelimit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from .store import CharacterStore, create_store_from_env
+from .backfill import BackfillJob, run_backfill
+from .singleflight import AsyncSingleFlight
+from .config import env_float, env_int
+from .cost_table import ForceCostTable, load_boss_forces, load_cost_tables, loaded_digest, reload_generated_module
+from .simulator import DEFAULT_DAILY_SYMBOLS, MAX_HORIZON_DAYS, SymbolSimulator, symbol_force
+
+FRONTIER_CACHE_SIZE = env_int("FRONTIER_CACHE_SIZE", 1024)
+OPTIMIZE_CACHE_SIZE = env_int("OPTIMIZE_CACHE_SIZE", 4096)
+
+# 캐릭터 스냅샷: FRESH 이내는 그대로, MAX_AGE 이내는 즉시 반환 후 백그라운드 갱신, 그 이상은 다시 조회
+CHARACTER_SNAPSHOT_SIZE = env_int("CHARACTER_SNAPSHOT_SIZE", 10000)
+CHARACTER_SNAPSHOT_FRESH = env_float("CHARACTER_SNAPSHOT_FRESH", 600)
+CHARACTER_SNAPSHOT_MAX_AGE = env_float("CHARACTER_SNAPSHOT_MAX_AGE", 24 * 3600)
+CHARACTER_REFRESH_WORKERS = env_int("CHARACTER_REFRESH_WORKERS", 4)
+CHARACTER_REFRESH_QUEUE_SIZE = env_int("CHARACTER_REFRESH_QUEUE_SIZE", 1000)
+
+# 여러 캐릭터 일괄 조회 시 동시에 처리할 캐릭터 수
+ROSTER_CONCURRENCY = env_int("ROSTER_CONCURRENCY", 8)
+
+
+class ForceFrontier:
+    """
+    시작 상태 하나에 대한 비용-포스 파레토 프론티어
+
+    forces(심볼 포스 총합)는 엄격한 오름차순, costs는 오름차순(첫 지점인 시작 상태만 다음 지점과
+    같을 수 있음)이며, 각 지점은 해당 포스 이상을 얻는 최소 비용과 그때의 심볼 레벨입니다.
+    """
+
+    def __init__(self, initial_levels: List[int], forces: List[int], costs: List[int], levels: List[List[int]]):
+        self.initial_levels = initial_levels
+        self.forces = forces
+        self.costs = costs
+        self.levels = levels
+
+    def __len__(self) -> int:
+        return len(self.forces)
+
+    def find_goal(self, symbol_force: int) -> int:
+        """목표 심볼 포스를 만족하는 최소 비용 지점의 인덱스 (도달 불가 시 마지막 지점)"""
+        return min(bisect_left(self.forces, symbol_force), len(self.forces) - 1)
+
+    def find_budget(self, budget: int) -> int:
+        """예산 안에서 얻을 수 있는 최대 포스 지점의 인덱스"""
+        return bisect_right(self.costs, budget) - 1
 
 
 class MapleService:
     """메이플스토리 API 서비스"""
 
     def __init__(self, api_key: Optional[str] = None):
-        self.api = MapleStoryAPI(api_key)
+        # API 클라이언트는 처음 조회할 때 생성 (최적화 기능은 API 키 없이도 사용 가능)
+        self._api_key = api_key
+        self._api: Optional[MapleStoryAPI] = None
+        self._async_api: Optional[AsyncMapleStoryAPI] = None
+        self._client_lock = threading.Lock()
         self._load_force_cost_tables()
+        self._frontier_cache = LRUCache(maxsize=FRONTIER_CACHE_SIZE)
+        self._optimize_cache = LRUCache(maxsize=OPTIMIZE_CACHE_SIZE)
+        self._async_inflight = AsyncSingleFlight()
+
+        # 캐릭터 스냅샷 (조회 시각, 캐릭터 정보)과 백그라운드 갱신 상태
+        self._snapshots = LRUCache(maxsize=CHARACTER_SNAPSHOT_SIZE, ttl=CHARACTER_SNAPSHOT_MAX_AGE)
+        self._refresh_semaphore: Optional[asyncio.Semaphore] = None
+        self._refresh_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._refreshing = set()
+        self._refresh_lock = threading.Lock()
+        self._refresh_tasks = set()
+
+        # 조회한 응답을 (ocid, 기준일) 단위로 보관하는 영구 저장소 (워커 간 공유, 재시작 후 유지)
+        self.store: Optional[CharacterStore] = create_store_from_env()
+        self._backfill_jobs = LRUCache(maxsize=100)
+        self._backfill_tasks = set()
 
     def _load_force_cost_tables(self):
-        """아케인/어센틱 포스 비용 테이블 로드"""
-        self.arcane_regions = ['Yuro', 'ChewChew', 'Lecheln', 'Arcana', 'Morass', 'Esfera']
-        self.authentic_regions = ['Cernium', 'Arcs', 'Odium', 'Dowonkyung', 'Arteria', 'Carcion', 'Tallahart']
-
-        # 비용 테이블 초기화
-        self.arcane_cost_dict = {region: [] for region in self.arcane_regions}
-        self.authentic_cost_dict = {region: [] for region in self.authentic_regions}
-
-        # 아케인포스 비용 테이블 로드
-        arcane_cost_path = Path(__file__).parent / 'AracneCostTable.txt'
-        with open(arcane_cost_path, 'r') as f:
-            for line in f:
-                if line.startswith('Lev'):
-                    continue
-                costs = line.strip().split('\t')
-                for i, region in enumerate(self.arcane_regions, 1):
-                    self.arcane_cost_dict[region].append(int(costs[i]))
-
-        # 어센틱포스 비용 테이블 로드
-        authentic_cost_path = Path(__file__).parent / 'AuthenticCostTable.txt'
-        with open(authentic_cost_path, 'r') as f:
-            for line in f:
-                if line.startswith('Lev'):
-                    continue
-                costs = line.strip().split('\t')
-                for i, region in enumerate(self.authentic_regions, 1):
-                    self.authentic_cost_dict[region].append(int(costs[i]))
-
-    def get_character_symbol_info(self, character_name: str) -> Dict:
+        """아케인/어센틱 포스 비용 테이블 로드 (미리 생성된 모듈에서 읽으므로 파일 파싱 없음)"""
+        self.cost_tables: Dict[str, ForceCostTable] = load_cost_tables()
+        self.arcane_regions = list(self.cost_tables["Arcane"].regions)
+        self.authentic_regions = list(self.cost_tables["Authentic"].regions)
+        self.boss_forces: Dict[str, Dict[str, int]] = load_boss_forces()
+        self.simulators = {force_type: SymbolSimulator(force_type, table) for force_type, table in self.cost_tables.items()}
+        self.cost_table_digest = loaded_digest()
+
+    def reload_cost_tables(self) -> Dict:
+        """
+        생성된 비용 테이블 모듈을 다시 읽고, 내용이 바뀌었으면 최적화 캐시 무효화
+
+        Returns:
+            Dict: {"digest": str, "changed": bool}
+        """
+        previous = self.cost_table_digest
+        reload_generated_module()
+        self._load_force_cost_tables()
+        changed = self.cost_table_digest != previous
+        if changed:
+            self._frontier_cache.clear()
+            self._optimize_cache.clear()
+            logger.info(f"🔄 비용 테이블 변경으로 최적화 캐시 초기화 ({self.cost_table_digest[:12]})")
+        return {"digest": self.cost_table_digest, "changed": changed}
+
+    def optimize_cache_stats(self) -> Dict:
+        """최적화 결과 / 프론티어 캐시 통계와 현재 비용 테이블 다이제스트"""
+        return {
+            "cost_table_digest": self.cost_table_digest,
+            "optimize": self._optimize_cache.stats(),
+            "frontier": self._frontier_cache.stats()
+        }
+
+    @property
+    def api(self) -> MapleStoryAPI:
+        """동기 API 클라이언트 (첫 사용 시 생성)"""
+        if self._api is None:
+            with self._client_lock:
+                if self._api is None:
+                    self._api = MapleStoryAPI(self._api_key)
+        return self._api
+
+    @property
+    def async_api(self) -> AsyncMapleStoryAPI:
+        """비동기 API 클라이언트 (첫 사용 시 생성)"""
+        if self._async_api is None:
+            with self._client_lock:
+                if self._async_api is None:
+                    self._async_api = AsyncMapleStoryAPI(self._api_key)
+        return self._async_api
+
+    def _read_stored_snapshot(self, character_name: str) -> Optional[Tuple[float, Dict]]:
+        store = self.store
+        if store is None:
+            return None
+        try:
+            stored = store.find_latest(character_name)
+        except (sqlite3.Error, OSError) as e:
+            self._disable_store(f"조회 실패 ({character_name}): {e}")
+            return None
+        if stored is None or time.time() - stored.observed_at > CHARACTER_SNAPSHOT_MAX_AGE:
+            return None
+        return stored.observed_at, self._build_character_info(stored.basic, stored.symbol, stored.stat)
+
+    def _save_snapshot(self, ocid: str, basic: CharacterBasicData, symbol: SymbolEquipmentData,
+                       stat: CharacterStatData) -> None:
+        """업스트림 응답을 영구 저장소에 기록 (저장 실패는 조회 결과에 영향 없음)"""
+        store = self.store
+        if store is None:
+            return
+        try:
+            store.upsert(ocid, basic, symbol, stat)
+        except (sqlite3.Error, OSError) as e:
+            self._disable_store(f"저장 실패 ({ocid}): {e}")
+
+    def _disable_store(self, reason: str) -> None:
+        """저장소 오류 시 이후 요청에서 다시 시도하지 않도록 저장소 사용 중지 (읽기 전용 파일 시스템 등)"""
+        if self.store is not None:
+            logger.warning(f"⚠️ 스냅샷 저장소 {reason} - 저장소를 사용하지 않습니다")
+            self.store = None
+
+    def get_character_history(self, character_name: str, start: Optional[date] = None,
+                              end: Optional[date] = None) -> List[Dict]:
+        """
+        영구 저장소에 쌓인 캐릭터의 기준일별 레벨 / 포스 / 심볼 레벨 이력을 조회합니다.
+
+        Args:
+            character_name: 캐릭터 이름
+            start: 시작일 (포함)
+            end: 종료일 (포함)
+
+        Returns:
+            List[Dict]: 기준일 오름차순 이력 (저장된 날짜만 포함)
         """
-        캐릭터의 초기 정보를 조회합니다.
+        action = f"이력 조회 실패 ({character_name})"
+        stored = self._query_store(action, lambda store: store.find_latest(character_name))
+        ocid = stored.ocid if stored is not None else self.api.get_character_ocid(character_name).ocid
+        return self._query_store(action, lambda store: store.history(ocid, start, end))
+
+    def _query_store(self, action: str, query: Callable[[CharacterStore], Any]) -> Any:
+        """저장소 조회 결과를 반환 (저장소가 없거나 오류가 나면 저장소 사용을 중지하고 ValueError)"""
+        store = self.store
+        if store is None:
+            raise ValueError("스냅샷 저장소가 비활성화되어 있습니다.")
+        try:
+            return query(store)
+        except (sqlite3.Error, OSError) as e:
+            self._disable_store(f"{action}: {e}")
+            raise ValueError("스냅샷 저장소를 사용할 수 없습니다.")
+
+    def start_backfill(self, names: List[str], start: date, end: Optional[date] = None) -> Dict:
+        """
+        지난 날짜의 캐릭터 스냅샷 백필 작업을 백그라운드로 시작합니다.
+
+        이미 저장된 기준일은 건너뛰므로 같은 요청을 다시 보내면 남은 부분만 조회합니다.
+        이벤트 루프 안에서 호출해야 합니다.
+
+        Args:
+            names: 캐릭터 이름 목록
+            start: 시작일 (포함)
+            end: 종료일 (포함, 기본값: 어제)
+
+        Returns:
+            Dict: 작업 진행 상황 (job_id로 get_backfill_job 조회)
+        """
+        if self.store is None:
+            raise ValueError("스냅샷 저장소가 비활성화되어 있습니다.")
+
+        job = BackfillJob(names, start, end)
+        self._backfill_jobs.set(job.job_id, job)
+        task = asyncio.ensure_future(run_backfill(self.async_api, self.store, job))
+        self._backfill_tasks.add(task)
+        task.add_done_callback(self._backfill_tasks.discard)
+        return job.to_dict()
+
+    def get_backfill_job(self, job_id: str) -> Dict:
+        """백필 작업 진행 상황 조회"""
+        job = self._backfill_jobs.get(job_id)
+        if job is None:
+            raise ValueError(f"백필 작업을 찾을 수 없습니다: {job_id}")
+        return job.to_dict()
+
+    def _is_stale(self, snapshot: Tuple[float, Dict]) -> bool:
+        return time.time() - snapshot[0] > CHARACTER_SNAPSHOT_FRESH
+
+    def _snapshot_response(self, snapshot: Tuple[float, Dict]) -> Dict:
+        """스냅샷을 응답 형태로 변환 (보관 중인 딕셔너리는 변경하지 않음)"""
+        fetched_at, info = snapshot
+        age = max(0.0, time.time() - fetched_at)
+        return {
+            **info,
+            "snapshot": {
+                "fetched_at": datetime.fromtimestamp(fetched_at).isoformat(timespec="seconds"),
+                "age_seconds": round(age, 1),
+                "stale": age > CHARACTER_SNAPSHOT_FRESH
+            }
+        }
+
+    def _claim_refresh(self, character_name: str) -> bool:
+        """갱신 대기열에 자리가 있고 같은 캐릭터가 갱신 중이 아니면 등록"""
+        with self._refresh_lock:
+            if character_name in self._refreshing or len(self._refreshing) >= CHARACTER_REFRESH_QUEUE_SIZE:
+                return False
+            self._refreshing.add(character_name)
+            return True
+
+    def _release_refresh(self, character_name: str) -> None:
+        with self._refresh_lock:
+            self._refreshing.discard(character_name)
+
+    async def aget_character_symbol_info(self, character_name: str) -> Dict:
+        """
+        캐릭터의 초기 정보를 비동기로 조회합니다.
+
+        조회 결과는 스냅샷으로 보관되어, 신선한 스냅샷은 바로 반환하고 오래된 스냅샷은
+        바로 반환한 뒤 백그라운드에서 갱신합니다. 스냅샷이 없을 때만 업스트림 조회를 기다립니다.
+        같은 캐릭터에 대한 동시 요청은 하나의 업스트림 조회 결과를 공유하며, 하위 호출은 공유 연결 풀을
+        사용하는 비동기 클라이언트로 이벤트 루프를 막지 않고 동시에 수행합니다.
 
         Args:
             character_name: 캐릭터 이름
@@ -61,7 +285,9 @@ class MapleService:
                             "name": str,          # 심볼 이름
                             "level": int,         # 레벨
                             "icon": str,          # 아이콘 URL
-                            "description": str    # 설명
+                            "description": str,   # 설명
+                            "growth_count": int,  # 현재 성장치
+                            "require_growth_count": int  # 다음 레벨까지 요구 성장치
                         }
                     ],
                     "authentic_symbols": [        # 어센틱심볼 목록
@@ -69,185 +295,320 @@ class MapleService:
                             "name": str,
                             "level": int,
                             "icon": str,
-                            "description": str
+                            "description": str,
+                            "growth_count": int,
+                            "require_growth_count": int
                         }
                     ]
                 },
                 "force_info": {                   # 포스 정보
                     "arcane_force": int,          # 아케인포스 총합
                     "authentic_force": int        # 어센틱포스 총합
+                },
+                "snapshot": {                     # 스냅샷 정보
+                    "fetched_at": str,            # 업스트림 조회 시각 (ISO 8601)
+                    "age_seconds": float,         # 스냅샷 나이(초)
+                    "stale": bool                 # 신선도 기준 초과 여부 (백그라운드 갱신 중)
                 }
             }
         """
-        # 초기 심볼 레벨 딕셔너리 설정
-        symbol_levels = {
-            "아케인심볼 : 소멸의 여로": 0,
-            "아케인심볼 : 츄츄 아일랜드": 0,
-            "아케인심볼 : 레헬른": 0,
-            "아케인심볼 : 아르카나": 0,
-            "아케인심볼 : 모라스": 0,
-            "아케인심볼 : 에스페라": 0,
-            "어센틱심볼 : 세르니움": 0,
-            "어센틱심볼 : 아르크스": 0,
-            "어센틱심볼 : 오디움": 0,
-            "어센틱심볼 : 도원경": 0,
-            "어센틱심볼 : 아르테리아": 0,
-            "어센틱심볼 : 카르시온": 0,
-            "그랜드 어센틱심볼 : 탈라하트": 0
-        }
+        snapshot = self._snapshots.get(character_name)
+        if snapshot is None:
+            CACHE_REQUESTS.inc("snapshot", "miss")
+            snapshot = await self._async_inflight.do(character_name, self._aload_snapshot, character_name)
+            if self._is_stale(snapshot):
+                self._aschedule_refresh(character_name)
+        elif self._is_stale(snapshot):
+            CACHE_REQUESTS.inc("snapshot", "stale")
+            self._aschedule_refresh(character_name)
+        else:
+            CACHE_REQUESTS.inc("snapshot", "hit")
+        return self._snapshot_response(snapshot)
+
+    async def aiter_character_symbol_info(self, character_names: List[str],
+                                          concurrency: int = ROSTER_CONCURRENCY) -> AsyncIterator[Dict]:
+        """
+        여러 캐릭터의 초기 정보를 동시에 조회해 완료되는 순서대로 반환합니다.
+
+        동시에 조회하는 캐릭터 수는 concurrency로 제한되며, 한 캐릭터의 실패는
+        해당 항목의 error로만 보고되고 나머지 조회에는 영향을 주지 않습니다.
+
+        Args:
+            character_names: 캐릭터 이름 목록
+            concurrency: 동시에 조회할 캐릭터 수
+
+        Yields:
+            Dict: {"index": 입력 순서, "character_name": 이름, "result": 초기 정보 (실패 시 None),
+                   "error": 오류 메시지 (성공 시 None)}
+        """
+        semaphore = asyncio.Semaphore(concurrency)
 
+        async def lookup(index: int, character_name: str) -> Dict:
+            item = {"index": index, "character_name": character_name, "result": None, "error": None}
+            async with semaphore:
+                try:
+                    item["result"] = await self.aget_character_symbol_info(character_name)
+                except ValueError as e:
+                    item["error"] = str(e)
+                except Exception as e:
+                    item["error"] = f"서버 오류: {str(e)}"
+            return item
+
+        tasks = [asyncio.ensure_future(lookup(index, name)) for index, name in enumerate(character_names)]
+        try:
+            for next_done in asyncio.as_completed(tasks):
+                yield await next_done
+        finally:
+            # 클라이언트 연결이 끊기면 남은 조회 취소
+            for task in tasks:
+                task.cancel()
+
+    async def _aload_snapshot(self, character_name: str) -> Tuple[float, Dict]:
+        snapshot = await asyncio.to_thread(self._read_stored_snapshot, character_name)
+        if snapshot is None:
+            return await self._arefresh_snapshot(character_name, PRIORITY_INTERACTIVE)
+        self._snapshots.set(character_name, snapshot)
+        return snapshot
+
+    async def _arefresh_snapshot(self, character_name: str, priority: int) -> Tuple[float, Dict]:
+        info = await self._afetch_character_symbol_info(character_name, priority)
+        snapshot = (time.time(), info)
+        self._snapshots.set(character_name, snapshot)
+        return snapshot
+
+    def _aschedule_refresh(self, character_name: str) -> None:
+        """오래된 스냅샷을 이벤트 루프 작업으로 갱신 (동시 갱신 수는 작업자 수로 제한)"""
+        if self._claim_refresh(character_name):
+            task = asyncio.ensure_future(self._abackground_refresh(character_name))
+            self._refresh_tasks.add(task)
+            task.add_done_callback(self._refresh_tasks.discard)
+
+    def _get_refresh_semaphore(self) -> asyncio.Semaphore:
+        """현재 이벤트 루프에서 쓸 갱신 동시 실행 제한 (루프가 바뀌면 새로 생성)"""
+        loop = asyncio.get_running_loop()
+        if self._refresh_loop is not loop:
+            self._refresh_semaphore = asyncio.Semaphore(CHARACTER_REFRESH_WORKERS)
+            self._refresh_loop = loop
+        return self._refresh_semaphore
+
+    async def _abackground_refresh(self, character_name: str) -> None:
+        try:
+            async with self._get_refresh_semaphore():
+                # 조회 대기 중인 요청이 낮은 우선순위 갱신을 기다리지 않도록 대화형 조회와 키를 분리
+                await self._async_inflight.do((character_name, "refresh"), self._arefresh_snapshot,
+                                              character_name, PRIORITY_BACKGROUND)
+        except Exception as e:
+            logger.warning(f"⚠️ 스냅샷 갱신 실패 ({character_name}): {e}")
+        finally:
+            self._release_refresh(character_name)
+
+    async def _afetch_character_symbol_info(self, character_name: str,
+                                            priority: int = PRIORITY_INTERACTIVE) -> Dict:
         try:
             # 1. OCID 조회
-            ocid_response = self.api.get_character_ocid(character_name)
+            ocid_response = await STAGE_DURATION.time_await(
+                self.async_api.get_character_ocid(character_name, priority=priority), "ocid")
             ocid = ocid_response.ocid
 
-            # 2. 기본 정보 조회
-            basic_response = self.api.get_character_basic(ocid)
-            basic_info = {
-                "level": basic_response.character_level,
-                "class": basic_response.character_class,
-                "world": basic_response.world_name,
-                "image": basic_response.character_image
+            # 2~4. 기본 정보 / 심볼 장비 / 스탯 동시 조회
+            names = ["basic", "symbol", "stat"]
+            results = await asyncio.gather(
+                STAGE_DURATION.time_await(self.async_api.get_character_basic(ocid, priority=priority), "basic"),
+                STAGE_DURATION.time_await(
+                    self.async_api.get_character_symbol_equipment(ocid, priority=priority), "symbol"),
+                STAGE_DURATION.time_await(self.async_api.get_character_stat(ocid, priority=priority), "stat"),
+                return_exceptions=True
+            )
+
+            errors = {name: str(result) for name, result in zip(names, results) if isinstance(result, Exception)}
+            if errors:
+                raise ValueError(", ".join(f"{name}: {message}" for name, message in errors.items()))
+
+            await asyncio.to_thread(self._save_snapshot, ocid, *results)
+            with STAGE_DURATION.time("transform"):
+                return self._build_character_info(*results)
+
+        except Exception as e:
+            raise ValueError(f"캐릭터 정보 조회 실패: {str(e)}")
+
+    async def aclose(self) -> None:
+        """API 클라이언트 연결 및 백그라운드 작업 정리"""
+        for task in list(self._refresh_tasks) + list(self._backfill_tasks):
+            task.cancel()
+        if self._async_api is not None:
+            await self._async_api.aclose()
+        if self._api is not None:
+            self._api.close()
+
+    def _build_character_info(self, basic_response: CharacterBasicData, symbol_response: SymbolEquipmentData,
+                              stat_response: CharacterStatData) -> Dict:
+        """기본 정보 / 심볼 장비 / 스탯 응답을 캐릭터 초기 정보로 변환"""
+        basic_info = {
+            "level": basic_response.character_level,
+            "class": basic_response.character_class,
+            "world": basic_response.world_name,
+            "image": basic_response.character_image
+        }
+
+        # 기본 심볼 정보 설정
+        default_arcane_symbols = [
+            {
+                "name": "아케인심볼 : 소멸의 여로",
+                "level": 0,
+                "icon": "",
+                "description": "소멸의 여로에서 획득 가능한 아케인심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "아케인심볼 : 츄츄 아일랜드",
+                "level": 0,
+                "icon": "",
+                "description": "츄츄 아일랜드에서 획득 가능한 아케인심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "아케인심볼 : 레헬른",
+                "level": 0,
+                "icon": "",
+                "description": "레헬른에서 획득 가능한 아케인심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "아케인심볼 : 아르카나",
+                "level": 0,
+                "icon": "",
+                "description": "아르카나에서 획득 가능한 아케인심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "아케인심볼 : 모라스",
+                "level": 0,
+                "icon": "",
+                "description": "모라스에서 획득 가능한 아케인심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "아케인심볼 : 에스페라",
+                "level": 0,
+                "icon": "",
+                "description": "에스페라에서 획득 가능한 아케인심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
             }
+        ]
 
-            # 3. 심볼 장비 정보 조회
-            symbol_response = self.api.get_character_symbol_equipment(ocid)
+        default_authentic_symbols = [
+            {
+                "name": "어센틱심볼 : 세르니움",
+                "level": 0,
+                "icon": "",
+                "description": "세르니움에서 획득 가능한 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "어센틱심볼 : 아르크스",
+                "level": 0,
+                "icon": "",
+                "description": "아르크스에서 획득 가능한 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "어센틱심볼 : 오디움",
+                "level": 0,
+                "icon": "",
+                "description": "오디움에서 획득 가능한 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "어센틱심볼 : 도원경",
+                "level": 0,
+                "icon": "",
+                "description": "도원경에서 획득 가능한 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "어센틱심볼 : 아르테리아",
+                "level": 0,
+                "icon": "",
+                "description": "아르테리아에서 획득 가능한 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "어센틱심볼 : 카르시온",
+                "level": 0,
+                "icon": "",
+                "description": "카르시온에서 획득 가능한 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            },
+            {
+                "name": "그랜드 어센틱심볼 : 탈라하트",
+                "level": 0,
+                "icon": "",
+                "description": "탈라하트에서 획득 가능한 그랜드 어센틱심볼",
+                "growth_count": 0,
+                "require_growth_count": 0
+            }
+        ]
 
-            # 기본 심볼 정보 설정
-            default_arcane_symbols = [
-                {
-                    "name": "아케인심볼 : 소멸의 여로",
-                    "level": 0,
-                    "icon": "",
-                    "description": "소멸의 여로에서 획득 가능한 아케인심볼"
-                },
-                {
-                    "name": "아케인심볼 : 츄츄 아일랜드",
-                    "level": 0,
-                    "icon": "",
-                    "description": "츄츄 아일랜드에서 획득 가능한 아케인심볼"
-                },
-                {
-                    "name": "아케인심볼 : 레헬른",
-                    "level": 0,
-                    "icon": "",
-                    "description": "레헬른에서 획득 가능한 아케인심볼"
-                },
-                {
-                    "name": "아케인심볼 : 아르카나",
-                    "level": 0,
-                    "icon": "",
-                    "description": "아르카나에서 획득 가능한 아케인심볼"
-                },
-                {
-                    "name": "아케인심볼 : 모라스",
-                    "level": 0,
-                    "icon": "",
-                    "description": "모라스에서 획득 가능한 아케인심볼"
-                },
-                {
-                    "name": "아케인심볼 : 에스페라",
-                    "level": 0,
-                    "icon": "",
-                    "description": "에스페라에서 획득 가능한 아케인심볼"
-                }
-            ]
+        # 실제 심볼 정보로 기본값 업데이트
+        arcane_symbols = list(default_arcane_symbols)
+        authentic_symbols = list(default_authentic_symbols)
 
-            default_authentic_symbols = [
-                {
-                    "name": "어센틱심볼 : 세르니움",
-                    "level": 0,
-                    "icon": "",
-                    "description": "세르니움에서 획득 가능한 어센틱심볼"
-                },
-                {
-                    "name": "어센틱심볼 : 아르크스",
-                    "level": 0,
-                    "icon": "",
-                    "description": "아르크스에서 획득 가능한 어센틱심볼"
-                },
-                {
-                    "name": "어센틱심볼 : 오디움",
-                    "level": 0,
-                    "icon": "",
-                    "description": "오디움에서 획득 가능한 어센틱심볼"
-                },
-                {
-                    "name": "어센틱심볼 : 도원경",
-                    "level": 0,
-                    "icon": "",
-                    "description": "도원경에서 획득 가능한 어센틱심볼"
-                },
-                {
-                    "name": "어센틱심볼 : 아르테리아",
-                    "level": 0,
-                    "icon": "",
-                    "description": "아르테리아에서 획득 가능한 어센틱심볼"
-                },
-                {
-                    "name": "어센틱심볼 : 카르시온",
-                    "level": 0,
-                    "icon": "",
-                    "description": "카르시온에서 획득 가능한 어센틱심볼"
-                },
-                {
-                    "name": "그랜드 어센틱심볼 : 탈라하트",
-                    "level": 0,
-                    "icon": "",
-                    "description": "탈라하트에서 획득 가능한 그랜드 어센틱심볼"
-                }
-            ]
+        for sym in symbol_response.symbol:
+            symbol_info = {
+                "name": sym.symbol_name,
+                "level": sym.symbol_level,
+                "icon": sym.symbol_icon or "",
+                "description": sym.symbol_description or f"{sym.symbol_name}에서 획득 가능한 심볼",
+                "growth_count": sym.symbol_growth_count,
+                "require_growth_count": sym.symbol_require_growth_count
+            }
 
-            # 실제 심볼 정보로 기본값 업데이트
-            arcane_symbols = list(default_arcane_symbols)
-            authentic_symbols = list(default_authentic_symbols)
+            # 기존 심볼 찾아서 업데이트
+            if "아케인심볼" in sym.symbol_name:
+                for i, default_sym in enumerate(arcane_symbols):
+                    if default_sym["name"] == sym.symbol_name:
+                        arcane_symbols[i] = symbol_info
+                        break
+            elif "어센틱심볼" in sym.symbol_name or "그랜드 어센틱심볼" in sym.symbol_name:
+                for i, default_sym in enumerate(authentic_symbols):
+                    if default_sym["name"] == sym.symbol_name:
+                        authentic_symbols[i] = symbol_info
+                        break
 
-            for sym in symbol_response.symbol:
-                symbol_info = {
-                    "name": sym.symbol_name,
-                    "level": sym.symbol_level,
-                    "icon": sym.symbol_icon or "",
-                    "description": sym.symbol_description or f"{sym.symbol_name}에서 획득 가능한 심볼"
-                }
-                
-                # 기존 심볼 찾아서 업데이트
-                if "아케인심볼" in sym.symbol_name:
-                    for i, default_sym in enumerate(arcane_symbols):
-                        if default_sym["name"] == sym.symbol_name:
-                            arcane_symbols[i] = symbol_info
-                            break
-                elif "어센틱심볼" in sym.symbol_name or "그랜드 어센틱심볼" in sym.symbol_name:
-                    for i, default_sym in enumerate(authentic_symbols):
-                        if default_sym["name"] == sym.symbol_name:
-                            authentic_symbols[i] = symbol_info
-                            break
-
-            # 4. 스탯 정보에서 아케인/어센틱포스 조회
-            stat_response = self.api.get_character_stat(ocid)
-            
-            arcane_force = 0
-            authentic_force = 0
-
-            for stat in stat_response.final_stat:
-                if stat.stat_name == "아케인포스":
-                    arcane_force = int(stat.stat_value)
-                elif stat.stat_name == "어센틱포스":
-                    authentic_force = int(stat.stat_value)
-
-            return {
-                "basic_info": basic_info,
-                "symbol_info": {
-                    "arcane_symbols": arcane_symbols,
-                    "authentic_symbols": authentic_symbols
-                },
-                "force_info": {
-                    "arcane_force": arcane_force,
-                    "authentic_force": authentic_force
-                }
+        # 스탯 정보에서 아케인/어센틱포스 조회
+        arcane_force = 0
+        authentic_force = 0
+
+        for stat in stat_response.final_stat:
+            if stat.stat_name == "아케인포스":
+                arcane_force = int(stat.stat_value)
+            elif stat.stat_name == "어센틱포스":
+                authentic_force = int(stat.stat_value)
+
+        return {
+            "basic_info": basic_info,
+            "symbol_info": {
+                "arcane_symbols": arcane_symbols,
+                "authentic_symbols": authentic_symbols
+            },
+            "force_info": {
+                "arcane_force": arcane_force,
+                "authentic_force": authentic_force
             }
+        }
 
-        except Exception as e:
-            raise ValueError(f"캐릭터 정보 조회 실패: {str(e)}")
 
     def _get_available_regions(self, force_type: str, char_level: int) -> List[int]:
         """레벨에 따른 지역 해금 여부 반환"""
@@ -262,33 +623,21 @@ class MapleService:
 
     def _calculate_non_symbol_force(self, force_type: str, current_force: int, symbol_levels: List[int]) -> int:
         """심볼을 제외한 포스 수치 계산"""
-        symbol_force = 0
-        if force_type == "Arcane":
-            for level in symbol_levels:
-                if level > 0:
-                    symbol_force += 20 + (level * 10)
-        else:  # Authentic
-            for level in symbol_levels:
-                if level > 0:
-                    symbol_force += level * 10
-
-        return current_force - symbol_force
+        return current_force - sum(symbol_force(force_type, level) for level in symbol_levels)
 
     def _find_best_symbol_upgrade(self, force_type: str, symbol_levels: List[int], 
                                 avail_regions: List[int]) -> Tuple[str, int]:
         """다음 업그레이드할 최적의 심볼 찾기"""
-        regions = self.arcane_regions if force_type == "Arcane" else self.authentic_regions
-        cost_dict = self.arcane_cost_dict if force_type == "Arcane" else self.authentic_cost_dict
-        max_level = 20 if force_type == "Arcane" else 11
+        table = self.cost_tables[force_type]
 
         best_symbol = 'null'
         min_cost = float('inf')
 
-        for i, (region, level) in enumerate(zip(regions, symbol_levels)):
-            if avail_regions[i] == 0 or level >= max_level:
+        for i, (region, level) in enumerate(zip(table.regions, symbol_levels)):
+            if avail_regions[i] == 0 or level >= table.max_level:
                 continue
 
-            cost = cost_dict[region][level]
+            cost = table.step_cost(i, level)
             if cost == 0:
                 return region, 0
             if cost < min_cost:
@@ -297,8 +646,148 @@ class MapleService:
 
         return best_symbol, min_cost
 
+    def _build_force_frontier(self, force_type: str, avail_regions: Tuple[int, ...],
+                              symbol_levels: Tuple[int, ...]) -> ForceFrontier:
+        """
+        지역별 누적 비용 곡선에 대한 최소 비용 배낭(DP)으로 비용-포스 프론티어 계산
+
+        상태는 '추가로 얻은 심볼 포스' 값이며, 심볼 포스 최대치가 유한하므로
+        목표치와 무관하게 (지역 수 × 레벨 수 × 상태 수) 안에 끝납니다.
+        """
+        table = self.cost_tables[force_type]
+
+        current_symbol_force = sum(symbol_force(force_type, level) for level in symbol_levels)
+
+        # 추가 포스 -> (최소 비용, 지역별 레벨)
+        dp: Dict[int, Tuple[int, Tuple[int, ...]]] = {0: (0, ())}
+        for i, level in enumerate(symbol_levels):
+            # 지역별 선택지: (추가 포스, 누적 비용, 도달 레벨)
+            options = [(0, 0, level)]
+            if avail_regions[i]:
+                base_force = symbol_force(force_type, level)
+                for new_level in range(level + 1, table.max_level + 1):
+                    options.append((symbol_force(force_type, new_level) - base_force,
+                                    table.range_cost(i, level, new_level), new_level))
+
+            next_dp: Dict[int, Tuple[int, Tuple[int, ...]]] = {}
+            for gained, (total, levels) in dp.items():
+                for add_force, add_cost, new_level in options:
+                    key = gained + add_force
+                    candidate = total + add_cost
+                    if key not in next_dp or candidate < next_dp[key][0]:
+                        next_dp[key] = (candidate, levels + (new_level,))
+            dp = next_dp
+
+        # 포스 내림차순으로 훑으며 더 큰 포스보다 싸게 얻을 수 있는 지점만 남김
+        # (무료 해금 단계가 있어도 목표를 이미 만족하면 업그레이드하지 않도록 시작 상태는 항상 남김)
+        forces, costs, levels = [], [], []
+        min_cost = float('inf')
+        for gained in sorted(dp, reverse=True):
+            total, point_levels = dp[gained]
+            if total < min_cost or gained == 0:
+                min_cost = total
+                forces.append(current_symbol_force + gained)
+                costs.append(total)
+                levels.append(list(point_levels))
+
+        return ForceFrontier(list(symbol_levels), forces[::-1], costs[::-1], levels[::-1])
+
+    def get_force_frontier(self, force_type: str, char_level: int, symbol_levels: List[int]) -> ForceFrontier:
+        """
+        시작 상태(포스 타입, 해금 지역, 심볼 레벨)별 비용-포스 프론티어 조회
+
+        결과는 크기 제한 LRU 캐시에 보관되어 같은 시작 상태의 반복 요청은 재계산하지 않습니다.
+        """
+        avail_regions = tuple(self._get_available_regions(force_type, char_level))
+        key = (force_type, avail_regions, tuple(symbol_levels))
+
+        frontier = self._frontier_cache.get(key)
+        if frontier is None:
+            frontier = self._build_force_frontier(force_type, avail_regions, tuple(symbol_levels))
+            self._frontier_cache.set(key, frontier)
+        return frontier
+
+    def get_force_frontier_points(self, force_type: str, char_level: int,
+                                  current_force: int, symbol_levels: List[int]) -> Dict:
+        """
+        비용-포스 프론티어를 총 포스 기준으로 조회
+
+        Args:
+            force_type: "Arcane" 또는 "Authentic"
+            char_level: 캐릭터 레벨
+            current_force: 현재 총합 포스 수치
+            symbol_levels: 현재 심볼 레벨 리스트
+
+        Returns:
+            Dict: {
+                "initial_levels": List[int],      # 초기 심볼 레벨
+                "points": List[Dict]              # 포스/비용 오름차순 지점 (force, total_cost, levels)
+            }
+        """
+        if force_type not in ["Arcane", "Authentic"]:
+            raise ValueError("force_type must be either 'Arcane' or 'Authentic'")
+
+        frontier = self.get_force_frontier(force_type, char_level, symbol_levels)
+        non_symbol_force = self._calculate_non_symbol_force(force_type, current_force, symbol_levels)
+
+        return {
+            "initial_levels": frontier.initial_levels,
+            "points": [
+                {"force": non_symbol_force + force, "total_cost": cost, "levels": levels}
+                for force, cost, levels in zip(frontier.forces, frontier.costs, frontier.levels)
+            ]
+        }
+
+    def _build_upgrade_path(self, force_type: str, initial_levels: List[int], final_levels: List[int]) -> List[Dict]:
+        """지역별 레벨업 단계를 비용 순으로 병합해 업그레이드 경로 구성"""
+        table = self.cost_tables[force_type]
+
+        steps = heapq.merge(*[
+            [(table.step_cost(i, lv - 1), i, lv) for lv in range(start + 1, end + 1)]
+            for i, (start, end) in enumerate(zip(initial_levels, final_levels))
+        ])
+        force = sum(symbol_force(force_type, level) for level in initial_levels)
+        upgrade_path = []
+        for cost, i, new_level in steps:
+            force += symbol_force(force_type, new_level) - symbol_force(force_type, new_level - 1)
+            upgrade_path.append({
+                "symbol": table.regions[i],
+                "new_level": new_level,
+                "cost": cost,
+                "force": force
+            })
+
+        return upgrade_path
+
+    def _optimize_key(self, force_type: str, force_goal: int, char_level: int, current_force: int,
+                      symbol_levels: List[int], solver: str) -> Tuple:
+        """
+        optimize_force 결과 캐시 키
+
+        레벨은 해금 지역으로, 목표 포스는 심볼 목표 포스로 바꾼 뒤
+        현재 심볼 포스 ~ 도달 가능한 최대 심볼 포스 범위로 자르고 10 단위로 올림합니다.
+        심볼 포스는 항상 10의 배수이므로 결과가 같은 입력은 같은 키가 됩니다.
+        """
+        # 입력값 검증
+        if force_type not in ["Arcane", "Authentic"]:
+            raise ValueError("force_type must be either 'Arcane' or 'Authentic'")
+        if solver not in ["greedy", "exact"]:
+            raise ValueError("solver must be either 'greedy' or 'exact'")
+
+        avail_regions = tuple(self._get_available_regions(force_type, char_level))
+        max_level = self.cost_tables[force_type].max_level
+        current_symbol_force = sum(symbol_force(force_type, level) for level in symbol_levels)
+        reachable_force = sum(
+            symbol_force(force_type, max(level, max_level) if avail else level)
+            for level, avail in zip(symbol_levels, avail_regions)
+        )
+        target = force_goal - self._calculate_non_symbol_force(force_type, current_force, symbol_levels)
+        target = min(max(target, current_symbol_force), reachable_force)
+        return (self.cost_table_digest, force_type, avail_regions, tuple(symbol_levels), -(-target // 10) * 10,
+                solver)
+
     def optimize_force(self, force_type: str, force_goal: int, char_level: int, 
-                      current_force: int, symbol_levels: List[int]) -> Dict:
+                      current_force: int, symbol_levels: List[int], solver: str = "greedy") -> Dict:
         """
         아케인/어센틱 포스 최적화 계산
 
@@ -308,6 +797,7 @@ class MapleService:
             char_level: 캐릭터 레벨
             current_force: 현재 총합 포스 수치
             symbol_levels: 현재 심볼 레벨 리스트
+            solver: "greedy" (단계별 최저 비용 선택) 또는 "exact" (최소 비용 보장)
 
         Returns:
             Dict: {
@@ -316,25 +806,78 @@ class MapleService:
                 "total_cost": int,                # 총 비용
                 "upgrade_path": List[Dict]        # 업그레이드 경로
             }
+            결과는 정규화된 입력별 LRU 캐시에서 공유되므로 수정하지 마세요.
         """
-        # 입력값 검증
-        if force_type not in ["Arcane", "Authentic"]:
-            raise ValueError("force_type must be either 'Arcane' or 'Authentic'")
-
-        # 가능한 지역 계산
-        avail_regions = self._get_available_regions(force_type, char_level)
+        key = self._optimize_key(force_type, force_goal, char_level, current_force, symbol_levels, solver)
+        result = self._optimize_cache.get(key)
+        CACHE_REQUESTS.inc("optimize", "miss" if result is None else "hit")
+        if result is None:
+            with STAGE_DURATION.time("optimize"):
+                result = self._optimize_force(force_type, force_goal, char_level, current_force,
+                                              list(symbol_levels), solver)
+            self._optimize_cache.set(key, result)
+        return result
 
+    def _optimize_force(self, force_type: str, force_goal: int, char_level: int,
+                        current_force: int, symbol_levels: List[int], solver: str) -> Dict:
+        """optimize_force 실제 계산 (캐시 미적중 시)"""
         # 심볼 제외 포스 계산
         non_symbol_force = self._calculate_non_symbol_force(force_type, current_force, symbol_levels)
-        target_symbol_force = force_goal - non_symbol_force
+        return self._optimize_targets(force_type, char_level, symbol_levels, solver,
+                                      [force_goal - non_symbol_force])[0]
+
+    def _optimize_targets(self, force_type: str, char_level: int, symbol_levels: List[int], solver: str,
+                          targets: List[int]) -> List[Dict]:
+        """
+        시작 상태 하나에서 여러 심볼 목표 포스의 최적화 결과를 한 번에 계산
 
+        exact는 공유 프론티어에서 목표마다 이분 탐색하고, greedy는 가장 높은 목표까지 한 번 진행한
+        경로의 앞부분을 잘라 씁니다 (greedy의 선택은 목표와 무관하므로 낮은 목표의 경로는 높은 목표 경로의 앞부분).
+        """
+        if solver == "exact":
+            # 목표 이상 포스 중 최소 비용 지점 (도달 불가 시 해금 심볼 전부 최대 레벨)
+            frontier = self.get_force_frontier(force_type, char_level, symbol_levels)
+            results = []
+            for target in targets:
+                index = frontier.find_goal(target)
+                results.append({
+                    "initial_levels": symbol_levels,
+                    "optimized_levels": frontier.levels[index],
+                    "total_cost": frontier.costs[index],
+                    "upgrade_path": self._build_upgrade_path(force_type, symbol_levels, frontier.levels[index])
+                })
+            return results
+
+        avail_regions = self._get_available_regions(force_type, char_level)
+        upgrade_path = self._greedy_upgrade_path(force_type, symbol_levels, avail_regions, max(targets))
+        path_forces = [step["force"] for step in upgrade_path]
+        start_force = sum(symbol_force(force_type, level) for level in symbol_levels)
+        regions = self.cost_tables[force_type].regions
+
+        results = []
+        for target in targets:
+            # 목표에 처음 도달한 단계까지 (도달 불가 시 경로 전체)
+            steps = 0 if start_force >= target else min(bisect_left(path_forces, target) + 1, len(upgrade_path))
+            optimized_levels = list(symbol_levels)
+            for step in upgrade_path[:steps]:
+                optimized_levels[regions.index(step["symbol"])] = step["new_level"]
+            results.append({
+                "initial_levels": symbol_levels,
+                "optimized_levels": optimized_levels,
+                "total_cost": sum(step["cost"] for step in upgrade_path[:steps]),
+                "upgrade_path": upgrade_path[:steps]
+            })
+        return results
+
+    def _greedy_upgrade_path(self, force_type: str, symbol_levels: List[int], avail_regions: List[int],
+                             target_symbol_force: int) -> List[Dict]:
+        """목표 심볼 포스에 도달할 때까지 매 단계 가장 싼 심볼을 올리는 경로"""
         # 초기값 설정
         current_levels = list(symbol_levels)
         current_force = sum(level * 10 for level in current_levels)
         if force_type == "Arcane":
             current_force += sum(20 for level in current_levels if level > 0)
 
-        total_cost = 0
         upgrade_path = []
 
         # 목표 포스까지 반복
@@ -344,9 +887,8 @@ class MapleService:
                 break
 
             # 심볼 업그레이드
-            symbol_idx = (self.arcane_regions if force_type == "Arcane" else self.authentic_regions).index(symbol)
+            symbol_idx = self.cost_tables[force_type].regions.index(symbol)
             current_levels[symbol_idx] += 1
-            total_cost += cost
 
             # 포스 증가
             force_increase = 10
@@ -362,13 +904,283 @@ class MapleService:
                 "force": current_force
             })
 
+        return upgrade_path
+
+
+    def optimize_force_budget(self, force_type: str, budget: int, char_level: int,
+                              current_force: int, symbol_levels: List[int]) -> Dict:
+        """
+        메소 예산 안에서 얻을 수 있는 최대 포스 계산
+
+        Args:
+            force_type: "Arcane" 또는 "Authentic"
+            budget: 사용 가능한 메소
+            char_level: 캐릭터 레벨
+            current_force: 현재 총합 포스 수치
+            symbol_levels: 현재 심볼 레벨 리스트
+
+        Returns:
+            Dict: {
+                "initial_levels": List[int],      # 초기 심볼 레벨
+                "optimized_levels": List[int],    # 최적화된 심볼 레벨
+                "total_cost": int,                # 총 비용
+                "upgrade_path": List[Dict],       # 업그레이드 경로
+                "achieved_force": int,            # 달성 총 포스
+                "remaining_budget": int           # 남은 메소
+            }
+        """
+        if force_type not in ["Arcane", "Authentic"]:
+            raise ValueError("force_type must be either 'Arcane' or 'Authentic'")
+        if budget < 0:
+            raise ValueError("budget must be non-negative")
+
+        frontier = self.get_force_frontier(force_type, char_level, symbol_levels)
+        non_symbol_force = self._calculate_non_symbol_force(force_type, current_force, symbol_levels)
+        index = frontier.find_budget(budget)
+
         return {
             "initial_levels": symbol_levels,
-            "optimized_levels": current_levels,
+            "optimized_levels": frontier.levels[index],
+            "total_cost": frontier.costs[index],
+            "upgrade_path": self._build_upgrade_path(force_type, symbol_levels, frontier.levels[index]),
+            "achieved_force": non_symbol_force + frontier.forces[index],
+            "remaining_budget": budget - frontier.costs[index]
+        }
+
+
+    def optimize_force_batch(self, requests: List[Dict]) -> List[Dict]:
+        """
+        여러 포스 최적화 요청을 한 번에 계산
+
+        캐시에 없는 요청은 시작 상태(포스 타입, 해금 지역, 심볼 레벨)와 solver별로 묶어,
+        묶음마다 프론티어 조회(exact)나 가장 높은 목표까지의 greedy 진행을 한 번만 수행합니다.
+
+        Args:
+            requests: optimize_force 인자 딕셔너리 목록
+
+        Returns:
+            List[Dict]: 입력 순서대로 {"index": int, "result": Dict | None, "error": str | None}
+        """
+        results: List[Optional[Dict]] = [None] * len(requests)
+        # 묶음 키 -> (대표 요청, 결과 캐시 키 -> 요청 위치 목록)
+        groups: Dict[Tuple, Tuple[Dict, Dict[Tuple, List[int]]]] = {}
+
+        for index, request in enumerate(requests):
+            try:
+                key = self._optimize_key(
+                    request["force_type"], request["force_goal"], request["char_level"],
+                    request["current_force"], request["symbol_levels"], request.get("solver", "greedy")
+                )
+            except ValueError as e:
+                results[index] = {"index": index, "result": None, "error": str(e)}
+                continue
+
+            result = self._optimize_cache.get(key)
+            CACHE_REQUESTS.inc("optimize", "miss" if result is None else "hit")
+            if result is not None:
+                results[index] = {"index": index, "result": result, "error": None}
+                continue
+            # 키 구성: (다이제스트, 포스 타입, 해금 지역, 심볼 레벨, 심볼 목표 포스, solver)
+            group = groups.setdefault(key[:4] + key[5:], (request, {}))
+            group[1].setdefault(key, []).append(index)
+
+        for request, keys in groups.values():
+            keys = list(keys.items())
+            with STAGE_DURATION.time("optimize"):
+                group_results = self._optimize_targets(
+                    request["force_type"], request["char_level"], list(request["symbol_levels"]),
+                    request.get("solver", "greedy"), [key[4] for key, _ in keys]
+                )
+            for (key, indices), result in zip(keys, group_results):
+                self._optimize_cache.set(key, result)
+                for index in indices:
+                    results[index] = {"index": index, "result": result, "error": None}
+
+        return results
+
+
+    def _resolve_force_goal(self, force_type: str, force_goal: Optional[int], bosses: Optional[List[str]]) -> int:
+        """목표 포스와 보스 목록의 요구 포스 중 가장 큰 값"""
+        goal = force_goal or 0
+        for boss in bosses or []:
+            if boss not in self.boss_forces[force_type]:
+                raise ValueError(f"알 수 없는 {force_type} 보스입니다: {boss}")
+            goal = max(goal, self.boss_forces[force_type][boss])
+        return goal
+
+    def _joint_plan(self, force_type: str, state: Dict, frontier: ForceFrontier, index: int,
+                    non_symbol_force: int, goal: int) -> Dict:
+        levels = frontier.levels[index]
+        return {
+            "initial_levels": state["symbol_levels"],
+            "optimized_levels": levels,
+            "total_cost": frontier.costs[index],
+            "upgrade_path": self._build_upgrade_path(force_type, state["symbol_levels"], levels),
+            "achieved_force": non_symbol_force + frontier.forces[index],
+            "target_force": goal,
+            "goal_reached": non_symbol_force + frontier.forces[index] >= goal
+        }
+
+    def optimize_force_joint(self, char_level: int, arcane: Dict, authentic: Dict,
+                             budget: Optional[int] = None, mode: str = "min_cost") -> Dict:
+        """
+        아케인/어센틱 포스를 하나의 메소 예산으로 함께 최적화
+
+        두 포스 타입의 비용-포스 프론티어를 각각 구한 뒤 합쳐서 계산합니다.
+        - min_cost: 타입별 목표를 모두 만족하는 최소 비용 (두 타입은 독립이므로 각 최소 비용의 합)
+        - max_force: 타입별 목표를 만족하면서 예산 안에서 두 포스 합이 최대인 조합
+          (아케인 프론티어 지점마다 남은 예산으로 살 수 있는 어센틱 지점을 이분 탐색)
+          예산으로 목표를 모두 만족할 수 없으면 목표를 무시하고 예산 안에서 최대인 조합을 반환하며,
+          예산을 넘는 계획은 반환하지 않습니다 (타입별 goal_reached로 목표 달성 여부 확인)
+
+        Args:
+            char_level: 캐릭터 레벨
+            arcane: 아케인 상태 {"current_force", "symbol_levels", "force_goal"(선택), "bosses"(선택)}
+            authentic: 어센틱 상태 (arcane과 같은 형식)
+            budget: 사용 가능한 메소 (max_force에서는 필수)
+            mode: "min_cost" 또는 "max_force"
+
+        Returns:
+            Dict: {
+                "mode": str,
+                "total_cost": int,                # 두 타입 합계 비용
+                "remaining_budget": int | None,   # 남은 메소 (예산 미지정 시 None)
+                "within_budget": bool,            # 예산 안에서 목표를 모두 만족했는지 여부
+                "arcane": Dict,                   # 타입별 계획 (initial_levels, optimized_levels, total_cost,
+                "authentic": Dict                 #   upgrade_path, achieved_force, target_force)
+            }
+        """
+        if mode not in ["min_cost", "max_force"]:
+            raise ValueError("mode must be either 'min_cost' or 'max_force'")
+        if budget is not None and budget < 0:
+            raise ValueError("budget must be non-negative")
+        if mode == "max_force" and budget is None:
+            raise ValueError("max_force 모드에는 budget이 필요합니다")
+
+        states = {"Arcane": arcane, "Authentic": authentic}
+        frontiers, offsets, goals, goal_indices = {}, {}, {}, {}
+        for force_type, state in states.items():
+            frontiers[force_type] = self.get_force_frontier(force_type, char_level, state["symbol_levels"])
+            offsets[force_type] = self._calculate_non_symbol_force(
+                force_type, state["current_force"], state["symbol_levels"])
+            goals[force_type] = self._resolve_force_goal(force_type, state.get("force_goal"), state.get("bosses"))
+            goal_indices[force_type] = frontiers[force_type].find_goal(goals[force_type] - offsets[force_type])
+
+        # 목표를 만족하는 최소 비용 조합
+        arcane_index, authentic_index = goal_indices["Arcane"], goal_indices["Authentic"]
+        arcane_frontier, authentic_frontier = frontiers["Arcane"], frontiers["Authentic"]
+        min_cost = arcane_frontier.costs[arcane_index] + authentic_frontier.costs[authentic_index]
+        within_budget = budget is None or min_cost <= budget
+
+        if mode == "max_force":
+            # 목표 지점 이상의 아케인 지점마다 남은 예산으로 가능한 최대 어센틱 지점 선택
+            # (예산으로 목표를 만족할 수 없으면 현재 상태부터 탐색)
+            if not within_budget:
+                arcane_index, authentic_index = 0, 0
+            best = (-1, 0)
+            arcane_start, authentic_min_cost = arcane_index, authentic_frontier.costs[authentic_index]
+            for i in range(arcane_start, len(arcane_frontier)):
+                remaining = budget - arcane_frontier.costs[i]
+                if remaining < authentic_min_cost:
+                    break
+                j = authentic_frontier.find_budget(remaining)
+                force = arcane_frontier.forces[i] + authentic_frontier.forces[j]
+                cost = arcane_frontier.costs[i] + authentic_frontier.costs[j]
+                if (force, -cost) > best:
+                    best = (force, -cost)
+                    arcane_index, authentic_index = i, j
+
+        total_cost = arcane_frontier.costs[arcane_index] + authentic_frontier.costs[authentic_index]
+        return {
+            "mode": mode,
             "total_cost": total_cost,
-            "upgrade_path": upgrade_path
+            "remaining_budget": None if budget is None else budget - total_cost,
+            "within_budget": within_budget,
+            "arcane": self._joint_plan("Arcane", arcane, arcane_frontier, arcane_index,
+                                       offsets["Arcane"], goals["Arcane"]),
+            "authentic": self._joint_plan("Authentic", authentic, authentic_frontier, authentic_index,
+                                          offsets["Authentic"], goals["Authentic"])
         }
 
+    def simulate_force(self, force_type: str, force_goal: int, char_level: int, current_force: int,
+                       symbol_levels: List[int], growth_counts: Optional[List[int]] = None,
+                       daily_symbols: Optional[List[int]] = None, meso: Optional[int] = None,
+                       daily_meso: int = 0, horizon_days: int = 365) -> Dict:
+        """
+        일일 심볼 획득과 메소 비용을 반영해 목표 포스까지 걸리는 일수 계산
+
+        Args:
+            force_type: "Arcane" 또는 "Authentic"
+            force_goal: 목표 포스 수치
+            char_level: 캐릭터 레벨
+            current_force: 현재 총합 포스 수치
+            symbol_levels: 현재 심볼 레벨 리스트
+            growth_counts: 지역별 현재 성장치 (기본값: 모두 0)
+            daily_symbols: 지역별 일일 심볼 획득량 (기본값: 포스 타입별 일일 퀘스트 기준)
+            meso: 보유 메소 (None이면 메소 제한 없이 성장치만 고려)
+            daily_meso: 하루 메소 수입
+            horizon_days: 최대 시뮬레이션 일수
+
+        Returns:
+            Dict: {
+                "initial_levels": List[int],
+                "policy": str,                    # 가장 빨리 도달한 레벨업 우선순위 정책
+                "days_to_goal": int | None,       # 목표 도달 일수 (기간 안에 불가능하면 None)
+                "reached_force": int,             # 도달 총 포스
+                "total_cost": int,                # 사용 메소
+                "upgrade_order": List[Dict],      # 레벨업 순서 (day, symbol, new_level, cost, force)
+                "timeline": List[Dict],           # 포스가 바뀐 날의 (day, force, meso_spent)
+                "policies": Dict[str, int | None] # 정책별 도달 일수
+            }
+        """
+        if force_type not in ["Arcane", "Authentic"]:
+            raise ValueError("force_type must be either 'Arcane' or 'Authentic'")
+        if not 1 <= horizon_days <= MAX_HORIZON_DAYS:
+            raise ValueError(f"horizon_days must be between 1 and {MAX_HORIZON_DAYS}")
+
+        region_count = len(self.cost_tables[force_type].regions)
+        growth_counts = growth_counts or [0] * region_count
+        daily_symbols = daily_symbols or [DEFAULT_DAILY_SYMBOLS[force_type]] * region_count
+        if len(growth_counts) != region_count or len(daily_symbols) != region_count:
+            raise ValueError(f"growth_counts와 daily_symbols는 {region_count}개여야 합니다")
+
+        non_symbol_force = self._calculate_non_symbol_force(force_type, current_force, symbol_levels)
+        result = self.simulators[force_type].simulate(
+            symbol_levels, growth_counts, daily_symbols,
+            self._get_available_regions(force_type, char_level),
+            force_goal - non_symbol_force, horizon_days, meso, daily_meso
+        )
+
+        # 심볼 포스를 총 포스로 변환
+        result["reached_force"] += non_symbol_force
+        for entry in result["upgrade_order"] + result["timeline"]:
+            entry["force"] += non_symbol_force
+        return {"initial_levels": symbol_levels, **result}
+
+
+_maple_service: Optional[MapleService] = None
+_maple_service_lock = threading.Lock()
+
+
+def get_maple_service() -> MapleService:
+    """
+    서비스 싱글톤 조회 (첫 호출 시 생성)
+
+    import 시점에는 아무것도 만들지 않으므로 워커 기동과 --reload가 빨라지고,
+    FastAPI 엔드포인트에서는 Depends(get_maple_service)로 주입받습니다.
+    """
+    global _maple_service
+    if _maple_service is None:
+        with _maple_service_lock:
+            if _maple_service is None:
+                _maple_service = MapleService()
+    return _maple_service
+
 
-# 서비스 싱글톤 인스턴스
-maple_service = MapleService()
\ No newline at end of file
+async def close_maple_service() -> None:
+    """생성된 서비스가 있으면 정리"""
+    global _maple_service
+    with _maple_service_lock:
+        service, _maple_service = _maple_service, None
+    if service is not None:
+        await service.aclose()
@@ -0,0 +1,195 @@
+"""
+심볼 성장 시뮬레이션 모듈
+
+지역별 일일 심볼 획득량, 레벨별 요구 성장치, 레벨업 메소 비용으로
+목표 포스까지 걸리는 일수와 업그레이드 순서를 계산합니다.
+"""
+import heapq
+import math
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from .cost_table import ForceCostTable
+
+# 레벨 → 다음 레벨까지 요구 성장치 (레벨 0은 심볼 1개로 1레벨 해금)
+GROWTH_REQUIREMENTS = {
+    "Arcane": lambda level: 1 if level == 0 else level * level + 11,
+    "Authentic": lambda level: 1 if level == 0 else 9 * level * level + 20 * level
+}
+
+# 지역별 기본 일일 심볼 획득량 (일일 퀘스트 기준, 요청에서 덮어쓸 수 있음)
+DEFAULT_DAILY_SYMBOLS = {
+    "Arcane": 20,
+    "Authentic": 10
+}
+
+# 메소가 부족할 때 준비된 레벨업 중 무엇을 먼저 할지 정하는 우선순위 정책
+POLICIES = ("cheapest", "force_per_meso", "region_order")
+
+MAX_HORIZON_DAYS = 3650
+
+
+def symbol_force(force_type: str, level: int) -> int:
+    """심볼 하나가 해당 레벨에서 제공하는 포스"""
+    if level <= 0:
+        return 0
+    if force_type == "Arcane":
+        return 20 + level * 10
+    return level * 10
+
+
+class SymbolSimulator:
+    """
+    포스 타입 하나의 심볼 성장 시뮬레이터
+
+    메소 제한이 없으면 지역별 레벨업 시점이 (남은 요구 성장치 / 일일 획득량)으로 정해지므로
+    날짜별 반복 없이 지역별 이벤트 목록을 병합해 바로 계산하고,
+    메소 제한이 있으면 하루 단위로 성장치와 메소를 진행시키며 정책에 따라 레벨업합니다.
+    """
+
+    def __init__(self, force_type: str, table: ForceCostTable):
+        self.force_type = force_type
+        self.table = table
+        self.requirement = GROWTH_REQUIREMENTS[force_type]
+
+    def _gain(self, level: int) -> int:
+        return symbol_force(self.force_type, level + 1) - symbol_force(self.force_type, level)
+
+    def _region_events(self, i: int, level: int, growth: int, daily: int) -> List[Tuple[int, int, int, int]]:
+        """메소 제한 없이 지역 하나가 레벨업하는 (일차, 지역, 새 레벨, 비용) 목록"""
+        events = []
+        needed = 0
+        for current in range(level, self.table.max_level):
+            needed += self.requirement(current)
+            remaining = needed - growth
+            if remaining > 0 and daily <= 0:
+                break
+            day = 0 if remaining <= 0 else math.ceil(remaining / daily)
+            events.append((day, i, current + 1, self.table.step_cost(i, current)))
+        return events
+
+    def _simulate_unlimited(self, levels: List[int], growth: List[int], daily: List[int],
+                            force: int, goal: int, horizon: int) -> Dict:
+        steps = heapq.merge(*[
+            self._region_events(i, levels[i], growth[i], daily[i]) for i in range(len(levels))
+        ])
+        return self._collect(steps, force, goal, horizon, "unlimited")
+
+    def _simulate_budget(self, levels: List[int], growth: List[int], daily: List[int], force: int, goal: int,
+                         horizon: int, meso: int, daily_meso: int, policy: str) -> Dict:
+        table = self.table
+        start_force = force
+        levels = list(levels)
+        growth = list(growth)
+        wallet = meso
+        events = []
+
+        for day in range(horizon + 1):
+            if day > 0:
+                wallet += daily_meso
+                growth = [g + d for g, d in zip(growth, daily)]
+
+            while force < goal:
+                ready = [
+                    i for i, level in enumerate(levels)
+                    if level < table.max_level and growth[i] >= self.requirement(level)
+                    and table.step_cost(i, level) <= wallet
+                ]
+                if not ready:
+                    break
+                if policy == "cheapest":
+                    i = min(ready, key=lambda k: table.step_cost(k, levels[k]))
+                elif policy == "force_per_meso":
+                    i = max(ready, key=lambda k: self._gain(levels[k]) / max(1, table.step_cost(k, levels[k])))
+                else:
+                    i = ready[0]
+
+                cost = table.step_cost(i, levels[i])
+                wallet -= cost
+                growth[i] -= self.requirement(levels[i])
+                levels[i] += 1
+                force += self._gain(levels[i] - 1)
+                events.append((day, i, levels[i], cost))
+
+            if force >= goal:
+                break
+
+        return self._collect(events, start_force, goal, horizon, policy)
+
+    def _collect(self, steps: Iterable[Tuple[int, int, int, int]], force: int, goal: int, horizon: int,
+                 policy: str) -> Dict:
+        """일차 순 레벨업 이벤트를 업그레이드 순서 / 날짜별 포스 변화로 정리"""
+        upgrade_order = []
+        timeline = []
+        total_cost = 0
+        days_to_goal = 0 if force >= goal else None
+        for day, i, new_level, cost in steps:
+            if day > horizon or days_to_goal is not None:
+                break
+            force += self._gain(new_level - 1)
+            total_cost += cost
+            upgrade_order.append({
+                "day": day,
+                "symbol": self.table.regions[i],
+                "new_level": new_level,
+                "cost": cost,
+                "force": force
+            })
+            if timeline and timeline[-1]["day"] == day:
+                timeline[-1].update(force=force, meso_spent=total_cost)
+            else:
+                timeline.append({"day": day, "force": force, "meso_spent": total_cost})
+            if force >= goal:
+                days_to_goal = day
+
+        return {
+            "policy": policy,
+            "days_to_goal": days_to_goal,
+            "reached_force": force,
+            "total_cost": total_cost,
+            "upgrade_order": upgrade_order,
+            "timeline": timeline
+        }
+
+    def simulate(self, symbol_levels: Sequence[int], growth_counts: Sequence[int], daily_symbols: Sequence[int],
+                 avail_regions: Sequence[int], symbol_goal: int, horizon: int = 365,
+                 meso: Optional[int] = None, daily_meso: int = 0) -> Dict:
+        """
+        목표 심볼 포스까지의 성장 시뮬레이션
+
+        Args:
+            symbol_levels: 현재 심볼 레벨
+            growth_counts: 현재 레벨에서 쌓인 성장치
+            daily_symbols: 지역별 일일 심볼 획득량
+            avail_regions: 지역별 해금 여부 (해금되지 않은 지역은 획득량 0)
+            symbol_goal: 목표 심볼 포스 (심볼 외 포스 제외)
+            horizon: 최대 시뮬레이션 일수
+            meso: 보유 메소 (None이면 메소 제한 없음)
+            daily_meso: 하루 메소 수입 (메소 제한이 있을 때만 사용)
+
+        Returns:
+            Dict: 가장 빨리 목표에 도달하는 정책의 결과와 정책별 도달 일수
+                {"policy", "days_to_goal", "reached_force", "total_cost", "upgrade_order", "timeline",
+                 "policies": {정책: 도달 일수}}
+        """
+        daily = [rate if avail else 0 for rate, avail in zip(daily_symbols, avail_regions)]
+        levels = list(symbol_levels)
+        force = sum(symbol_force(self.force_type, level) for level in levels)
+
+        if meso is None:
+            result = self._simulate_unlimited(levels, list(growth_counts), daily, force, symbol_goal, horizon)
+            result["policies"] = {"unlimited": result["days_to_goal"]}
+            return result
+
+        results = [
+            self._simulate_budget(levels, list(growth_counts), daily, force, symbol_goal, horizon,
+                                  meso, daily_meso, policy)
+            for policy in POLICIES
+        ]
+        # 도달 일수가 가장 짧은 정책 (미도달은 도달 포스가 높은 순, 같으면 비용이 낮은 순)
+        best = min(results, key=lambda r: (
+            r["days_to_goal"] is None,
+            r["days_to_goal"] or 0,
+            -r["reached_force"],
+            r["total_cost"]
+        ))
+        best["policies"] = {r["policy"]: r["days_to_goal"] for r in results}
+        return best
@@ -0,0 +1,100 @@
+"""
+동시 중복 요청 병합 (single-flight) 모듈
+"""
+import asyncio
+import threading
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """
+    스레드 간 동일 키 호출 병합
+
+    같은 키로 진행 중인 호출이 있으면 새로 실행하지 않고 그 결과(또는 예외)를 함께 받습니다.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, "_Call"] = {}
+
+    def do(self, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        키 단위로 병합해 fn 실행
+
+        Args:
+            key: 병합 기준 키
+            fn: 실행할 함수
+
+        Returns:
+            fn 실행 결과 (동시 호출자 모두 같은 객체를 받음)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = _Call()
+                self._calls[key] = call
+
+        if not leader:
+            call.event.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn(*args, **kwargs)
+            return call.result
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.event.set()
+
+    def in_flight(self) -> int:
+        """진행 중인 호출 수"""
+        return len(self._calls)
+
+
+class _Call:
+    __slots__ = ("event", "result", "error")
+
+    def __init__(self):
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: BaseException = None
+
+
+class AsyncSingleFlight:
+    """
+    코루틴 간 동일 키 호출 병합
+
+    같은 키로 진행 중인 태스크가 있으면 그 태스크를 함께 기다립니다.
+    기다리던 호출자 하나가 취소되어도 공유 태스크는 취소되지 않습니다.
+    """
+
+    def __init__(self):
+        self._tasks: Dict[Hashable, asyncio.Task] = {}
+
+    async def do(self, key: Hashable, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        키 단위로 병합해 코루틴 함수 실행
+
+        Args:
+            key: 병합 기준 키
+            fn: 실행할 코루틴 함수
+
+        Returns:
+            실행 결과 (동시 호출자 모두 같은 객체를 받음)
+        """
+        task = self._tasks.get(key)
+        if task is None:
+            task = asyncio.ensure_future(fn(*args, **kwargs))
+            self._tasks[key] = task
+            task.add_done_callback(lambda _: self._tasks.pop(key, None))
+        return await asyncio.shield(task)
+
+    def in_flight(self) -> int:
+        """진행 중인 호출 수"""
+        return len(self._tasks)
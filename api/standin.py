@@ -0,0 +1,181 @@
+"""
+Nexon Open API 로컬 대역 서버
+
+부하 테스트에서 실제 API 호출 한도를 쓰지 않도록 /id, /character/basic,
+/character/symbol-equipment, /character/stat을 기록된 응답(benchmark_responses.json)으로 대신 응답합니다.
+지연 분포, 5xx 오류율, 429 주입 비율, 초당 허용 호출 수를 조정할 수 있습니다.
+
+    python -m api.standin --port 9000 --latency lognormal:40:0.5 --error-rate 0.01 --throttle-rate 0.02
+    MAPLE_API_BASE_URL=http://127.0.0.1:9000/maplestory/v1 uvicorn api.main:app
+"""
+import argparse
+import asyncio
+import hashlib
+import json
+import math
+import random
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, Mapping, Optional, Sequence, Tuple
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+from .ratelimit import RateLimiter
+
+RECORDED_RESPONSES = Path(__file__).parent / "benchmark_responses.json"
+API_PREFIX = "/maplestory/v1"
+
+# Nexon Open API 에러 코드
+ERROR_SERVER = "OPENAPI00001"
+ERROR_INVALID_PATH = "OPENAPI00003"
+ERROR_INVALID_PARAMETER = "OPENAPI00004"
+ERROR_TOO_MANY_REQUESTS = "OPENAPI00007"
+
+# 지연 분포 이름 → 파라미터 개수
+LATENCY_DISTRIBUTIONS = {"fixed": 1, "uniform": 2, "exponential": 1, "lognormal": 2}
+
+
+def error_body(name: str, message: str) -> Dict[str, Any]:
+    return {"error": {"name": name, "message": message}}
+
+
+def load_recorded_responses(path: Path = RECORDED_RESPONSES) -> Dict[str, Dict[str, Any]]:
+    """엔드포인트별 기록된 응답 본문"""
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def recorded_response(responses: Mapping[str, Dict[str, Any]], endpoint: str,
+                      params: Mapping[str, str]) -> Tuple[int, Dict[str, Any]]:
+    """
+    엔드포인트와 쿼리 파라미터에 대한 (상태 코드, 응답 본문)
+
+    캐릭터 이름마다 다른 OCID를 돌려주므로 이름을 바꿔 가며 요청하면 응답 캐시를 거치지 않고,
+    date 파라미터가 있으면 응답의 기준일을 그 날짜로 바꿉니다.
+    """
+    if endpoint == "/id":
+        name = params.get("character_name")
+        if not name:
+            return 400, error_body(ERROR_INVALID_PARAMETER, "Please input valid parameter")
+        return 200, {"ocid": hashlib.md5(name.encode("utf-8")).hexdigest()}
+
+    if endpoint not in responses:
+        return 404, error_body(ERROR_INVALID_PATH, "Please check the request path")
+    if not params.get("ocid"):
+        return 400, error_body(ERROR_INVALID_PARAMETER, "Please input valid parameter")
+
+    body = responses[endpoint]
+    day = params.get("date")
+    if day:
+        body = {**body, "date": f"{day}T00:00+09:00"}
+    return 200, body
+
+
+def parse_latency(spec: str) -> Callable[[random.Random], float]:
+    """
+    지연 분포 문자열을 (난수 생성기 → 지연 초) 함수로 변환
+
+    - fixed:MS                  항상 MS
+    - uniform:MIN_MS:MAX_MS     균등 분포
+    - exponential:MEAN_MS       지수 분포
+    - lognormal:MEDIAN_MS:SIGMA 로그 정규 분포 (긴 꼬리 지연)
+
+    Raises:
+        ValueError: 형식이 잘못된 경우
+    """
+    name, *args = spec.split(":")
+    if name not in LATENCY_DISTRIBUTIONS or len(args) != LATENCY_DISTRIBUTIONS[name]:
+        raise ValueError(f"지연 분포 형식이 잘못되었습니다: {spec} (예: fixed:30, uniform:10:50, "
+                         f"exponential:30, lognormal:30:0.5)")
+    values = [float(arg) for arg in args]
+    if any(value < 0 for value in values):
+        raise ValueError(f"지연 분포 값은 0 이상이어야 합니다: {spec}")
+
+    if name == "fixed":
+        return lambda rng: values[0] / 1000
+    if name == "uniform":
+        return lambda rng: rng.uniform(values[0], values[1]) / 1000
+    if name == "exponential":
+        return lambda rng: rng.expovariate(1 / values[0]) / 1000 if values[0] > 0 else 0.0
+    return lambda rng: rng.lognormvariate(math.log(max(values[0], 1e-3)), values[1]) / 1000
+
+
+def create_app(latency: str = "fixed:0", error_rate: float = 0.0, throttle_rate: float = 0.0,
+               rate_limit: Optional[float] = None, retry_after: int = 1, seed: Optional[int] = None,
+               responses_path: Path = RECORDED_RESPONSES) -> FastAPI:
+    """
+    대역 서버 앱 생성
+
+    Args:
+        latency: 지연 분포 (parse_latency 형식)
+        error_rate: 500 응답 비율 (0~1)
+        throttle_rate: 한도와 무관하게 429를 주입하는 비율 (0~1)
+        rate_limit: 초당 허용 호출 수 (초과 시 429, None이면 제한 없음)
+        retry_after: 429 응답의 Retry-After(초)
+        seed: 난수 시드 (재현 가능한 실행용)
+        responses_path: 기록된 응답 파일
+
+    Returns:
+        FastAPI: 대역 서버 앱 (GET /stats로 상태 코드별 응답 수 조회)
+    """
+    if not 0 <= error_rate <= 1 or not 0 <= throttle_rate <= 1:
+        raise ValueError("error_rate와 throttle_rate는 0에서 1 사이여야 합니다")
+
+    sample_latency = parse_latency(latency)
+    responses = load_recorded_responses(responses_path)
+    limiter = RateLimiter(rate_limit) if rate_limit else None
+    rng = random.Random(seed)
+    counts: Counter = Counter()
+
+    app = FastAPI(title="Nexon Open API 대역 서버")
+
+    @app.get(API_PREFIX + "/{endpoint:path}")
+    async def handle(endpoint: str, request: Request):
+        await asyncio.sleep(sample_latency(rng))
+
+        roll = rng.random()
+        if (limiter is not None and not limiter.try_acquire()) or roll < throttle_rate:
+            status, body = 429, error_body(ERROR_TOO_MANY_REQUESTS, "Too many requests")
+        elif roll < throttle_rate + error_rate:
+            status, body = 500, error_body(ERROR_SERVER, "Server error")
+        else:
+            status, body = recorded_response(responses, "/" + endpoint, request.query_params)
+
+        counts[status] += 1
+        headers = {"Retry-After": str(retry_after)} if status == 429 else None
+        return JSONResponse(body, status_code=status, headers=headers)
+
+    @app.get("/stats")
+    async def stats():
+        """상태 코드별 응답 수"""
+        return {"total": sum(counts.values()), "status": {str(code): n for code, n in sorted(counts.items())}}
+
+    return app
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    parser = argparse.ArgumentParser(description="Nexon Open API 로컬 대역 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=9000)
+    parser.add_argument("--latency", default="fixed:0", help="지연 분포 (fixed:MS, uniform:MIN:MAX, "
+                                                             "exponential:MEAN, lognormal:MEDIAN:SIGMA)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 응답 비율 (0~1)")
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="429 주입 비율 (0~1)")
+    parser.add_argument("--rate-limit", type=float, default=None, help="초당 허용 호출 수 (초과 시 429)")
+    parser.add_argument("--retry-after", type=int, default=1, help="429 응답의 Retry-After(초)")
+    parser.add_argument("--seed", type=int, default=None, help="난수 시드")
+    parser.add_argument("--responses", type=Path, default=RECORDED_RESPONSES, help="기록된 응답 파일")
+    args = parser.parse_args(argv)
+
+    try:
+        app = create_app(args.latency, args.error_rate, args.throttle_rate, args.rate_limit,
+                         args.retry_after, args.seed, args.responses)
+    except ValueError as e:
+        parser.error(str(e))
+
+    import uvicorn
+
+    print(f"🧪 대역 서버: MAPLE_API_BASE_URL=http://{args.host}:{args.port}{API_PREFIX}")
+    uvicorn.run(app, host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,301 @@
+"""
+캐릭터 스냅샷 영구 저장소 모듈 (SQLite)
+
+기본 정보 / 심볼 장비 / 종합 능력치 응답을 (ocid, 기준일) 단위로 보관합니다.
+WAL 모드를 사용하므로 여러 uvicorn 워커가 같은 파일을 동시에 읽고 쓸 수 있고,
+서버를 재시작해도 이미 조회한 이력은 다시 조회하지 않습니다.
+"""
+import json
+import sqlite3
+import threading
+import time
+from datetime import date, datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional, Set, Tuple, Union
+from .config import env_str
+from .logger import logger
+from .maple import (
+    CharacterBasic, CharacterBasicData, CharacterStatData, CharacterStatResponse, SymbolEquipmentData,
+    SymbolEquipmentResponse, dump_response_json
+)
+
+# Nexon Open API 데이터 기준 시간대 (KST)
+KST = timezone(timedelta(hours=9))
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS characters (
+    ocid TEXT NOT NULL,
+    date TEXT NOT NULL,
+    character_name TEXT,
+    world_name TEXT,
+    character_class TEXT,
+    character_level INTEGER,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (ocid, date)
+);
+CREATE INDEX IF NOT EXISTS idx_characters_name ON characters (character_name, date);
+
+CREATE TABLE IF NOT EXISTS symbols (
+    ocid TEXT NOT NULL,
+    date TEXT NOT NULL,
+    symbol_name TEXT NOT NULL,
+    symbol_level INTEGER NOT NULL,
+    symbol_growth_count INTEGER NOT NULL,
+    symbol_require_growth_count INTEGER NOT NULL,
+    character_class TEXT,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (ocid, date, symbol_name)
+);
+
+CREATE TABLE IF NOT EXISTS force_stats (
+    ocid TEXT NOT NULL,
+    date TEXT NOT NULL,
+    arcane_force INTEGER NOT NULL,
+    authentic_force INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    fetched_at REAL NOT NULL,
+    PRIMARY KEY (ocid, date)
+);
+"""
+
+
+class StoredSnapshot(NamedTuple):
+    """저장소에서 읽은 캐릭터 스냅샷 하나"""
+    ocid: str
+    date: str
+    basic: CharacterBasic
+    symbol: SymbolEquipmentResponse
+    stat: CharacterStatResponse
+    fetched_at: float
+
+    @property
+    def observed_at(self) -> float:
+        """데이터가 반영하는 시각 (지난 날짜 스냅샷은 조회 시각과 무관하게 그날 자정까지의 데이터)"""
+        day_end = datetime.combine(date.fromisoformat(self.date) + timedelta(days=1), datetime.min.time(), KST)
+        return min(self.fetched_at, day_end.timestamp())
+
+
+def snapshot_date(value: Union[date, datetime, str, None] = None) -> str:
+    """
+    저장 키로 쓰는 기준일 문자열 (YYYY-MM-DD)
+
+    응답의 date가 null(실시간 조회)이면 오늘(KST) 날짜를 사용합니다.
+    """
+    if value is None:
+        return datetime.now(KST).date().isoformat()
+    if isinstance(value, datetime):
+        if value.tzinfo is not None:
+            value = value.astimezone(KST)
+        return value.date().isoformat()
+    if isinstance(value, date):
+        return value.isoformat()
+    return value[:10]
+
+
+def _parse_force(stat: CharacterStatData) -> Tuple[int, int]:
+    arcane_force = authentic_force = 0
+    for final_stat in stat.final_stat:
+        if final_stat.stat_name == "아케인포스":
+            arcane_force = int(final_stat.stat_value or 0)
+        elif final_stat.stat_name == "어센틱포스":
+            authentic_force = int(final_stat.stat_value or 0)
+    return arcane_force, authentic_force
+
+
+class CharacterStore:
+    """
+    (ocid, 기준일) 단위 캐릭터 스냅샷 저장소
+
+    연결은 스레드마다 하나씩 열고, 쓰기는 한 트랜잭션에 모아 수행합니다.
+    파일과 스키마는 첫 사용 시 생성됩니다.
+    """
+
+    def __init__(self, path: Union[str, Path]):
+        self.path = Path(path)
+        self._local = threading.local()
+        self._schema_lock = threading.Lock()
+        self._schema_ready = False
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self.path, timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            with self._schema_lock:
+                if not self._schema_ready:
+                    conn.executescript(SCHEMA)
+                    self._schema_ready = True
+            self._local.conn = conn
+        return conn
+
+    def upsert_many(self, snapshots: Iterable[Tuple[str, CharacterBasicData, SymbolEquipmentData,
+                                                    CharacterStatData]],
+                    fetched_at: Optional[float] = None) -> int:
+        """
+        스냅샷 일괄 저장 (같은 (ocid, 기준일)은 덮어씀)
+
+        Args:
+            snapshots: (ocid, 기본 정보, 심볼 장비, 종합 능력치) 목록
+            fetched_at: 조회 시각 (기본값: 현재)
+
+        Returns:
+            int: 저장한 스냅샷 수
+        """
+        fetched_at = time.time() if fetched_at is None else fetched_at
+        character_rows = []
+        symbol_rows = []
+        stale_symbol_keys = []
+        force_rows = []
+
+        for ocid, basic, symbol, stat in snapshots:
+            # 세 응답의 기준일은 같으므로 값이 있는 것을 사용
+            day = snapshot_date(basic.date or symbol.date or stat.date)
+            character_rows.append((
+                ocid, day, basic.character_name, basic.world_name, basic.character_class,
+                basic.character_level, dump_response_json(basic), fetched_at
+            ))
+            stale_symbol_keys.append((ocid, day))
+            for sym in symbol.symbol:
+                symbol_rows.append((
+                    ocid, day, sym.symbol_name, sym.symbol_level, sym.symbol_growth_count,
+                    sym.symbol_require_growth_count, symbol.character_class, dump_response_json(sym), fetched_at
+                ))
+            arcane_force, authentic_force = _parse_force(stat)
+            force_rows.append((ocid, day, arcane_force, authentic_force, dump_response_json(stat), fetched_at))
+
+        if not character_rows:
+            return 0
+
+        conn = self._connect()
+        with conn:
+            conn.executemany("INSERT OR REPLACE INTO characters VALUES (?, ?, ?, ?, ?, ?, ?, ?)", character_rows)
+            # 해제된 심볼이 남지 않도록 같은 기준일의 심볼 행은 교체
+            conn.executemany("DELETE FROM symbols WHERE ocid = ? AND date = ?", stale_symbol_keys)
+            conn.executemany("INSERT INTO symbols VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", symbol_rows)
+            conn.executemany("INSERT OR REPLACE INTO force_stats VALUES (?, ?, ?, ?, ?, ?)", force_rows)
+
+        logger.debug("💽 스냅샷 저장: %d건", len(character_rows))
+        return len(character_rows)
+
+    def upsert(self, ocid: str, basic: CharacterBasicData, symbol: SymbolEquipmentData,
+               stat: CharacterStatData) -> None:
+        """스냅샷 하나 저장"""
+        self.upsert_many([(ocid, basic, symbol, stat)])
+
+    def get(self, ocid: str, day: Union[date, str, None] = None) -> Optional[StoredSnapshot]:
+        """
+        (ocid, 기준일) 스냅샷 조회
+
+        Args:
+            ocid: 캐릭터 식별자
+            day: 기준일 (기본값: 오늘)
+
+        Returns:
+            Optional[StoredSnapshot]: 세 응답이 모두 저장되어 있으면 스냅샷, 아니면 None
+        """
+        conn = self._connect()
+        day = snapshot_date(day)
+        row = conn.execute(
+            "SELECT c.data, c.fetched_at, f.data FROM characters c "
+            "JOIN force_stats f ON f.ocid = c.ocid AND f.date = c.date "
+            "WHERE c.ocid = ? AND c.date = ?",
+            (ocid, day)
+        ).fetchone()
+        if row is None:
+            return None
+        return self._build_snapshot(conn, ocid, day, row)
+
+    def find_latest(self, character_name: str) -> Optional[StoredSnapshot]:
+        """캐릭터 이름으로 가장 최근 기준일의 스냅샷 조회"""
+        conn = self._connect()
+        row = conn.execute(
+            "SELECT c.ocid, c.date, c.data, c.fetched_at, f.data FROM characters c "
+            "JOIN force_stats f ON f.ocid = c.ocid AND f.date = c.date "
+            "WHERE c.character_name = ? ORDER BY c.date DESC LIMIT 1",
+            (character_name,)
+        ).fetchone()
+        if row is None:
+            return None
+        ocid, day = row[0], row[1]
+        return self._build_snapshot(conn, ocid, day, row[2:])
+
+    def _build_snapshot(self, conn: sqlite3.Connection, ocid: str, day: str, row: Tuple) -> StoredSnapshot:
+        basic_data, fetched_at, stat_data = row
+        symbol_rows = conn.execute(
+            "SELECT character_class, data FROM symbols WHERE ocid = ? AND date = ?",
+            (ocid, day)
+        ).fetchall()
+        basic = CharacterBasic.model_validate_json(basic_data)
+        symbol = SymbolEquipmentResponse(
+            date=basic.date,
+            character_class=(symbol_rows[0][0] or "") if symbol_rows else (basic.character_class or ""),
+            symbol=[json.loads(data) for _, data in symbol_rows]
+        )
+        stat = CharacterStatResponse.model_validate_json(stat_data)
+        return StoredSnapshot(ocid, day, basic, symbol, stat, fetched_at)
+
+    def existing_dates(self, ocid: str, start: Union[date, str], end: Union[date, str]) -> Set[str]:
+        """기간(양 끝 포함) 안에서 이미 저장된 기준일 목록"""
+        rows = self._connect().execute(
+            "SELECT c.date FROM characters c JOIN force_stats f ON f.ocid = c.ocid AND f.date = c.date "
+            "WHERE c.ocid = ? AND c.date BETWEEN ? AND ?",
+            (ocid, snapshot_date(start), snapshot_date(end))
+        ).fetchall()
+        return {row[0] for row in rows}
+
+    def history(self, ocid: str, start: Union[date, str, None] = None,
+                end: Union[date, str, None] = None) -> List[Dict[str, Any]]:
+        """
+        기준일별 레벨 / 포스 / 심볼 레벨 이력 조회 (기준일 오름차순)
+
+        Args:
+            ocid: 캐릭터 식별자
+            start: 시작일 (포함, 기본값: 처음부터)
+            end: 종료일 (포함, 기본값: 끝까지)
+
+        Returns:
+            List[Dict]: [{"date", "character_level", "arcane_force", "authentic_force", "symbols": {이름: 레벨}}]
+        """
+        conn = self._connect()
+        start = snapshot_date(start) if start is not None else "0000-00-00"
+        end = snapshot_date(end) if end is not None else "9999-99-99"
+
+        rows = conn.execute(
+            "SELECT c.date, c.character_level, f.arcane_force, f.authentic_force FROM characters c "
+            "JOIN force_stats f ON f.ocid = c.ocid AND f.date = c.date "
+            "WHERE c.ocid = ? AND c.date BETWEEN ? AND ? ORDER BY c.date",
+            (ocid, start, end)
+        ).fetchall()
+        entries = {
+            day: {"date": day, "character_level": level, "arcane_force": arcane, "authentic_force": authentic,
+                  "symbols": {}}
+            for day, level, arcane, authentic in rows
+        }
+
+        for day, name, level in conn.execute(
+            "SELECT date, symbol_name, symbol_level FROM symbols WHERE ocid = ? AND date BETWEEN ? AND ?",
+            (ocid, start, end)
+        ):
+            if day in entries:
+                entries[day]["symbols"][name] = level
+
+        return list(entries.values())
+
+    def close(self) -> None:
+        """현재 스레드의 연결 종료"""
+        conn = getattr(self._local, "conn", None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
+
+def create_store_from_env() -> Optional[CharacterStore]:
+    """CHARACTER_STORE_PATH 환경변수 기반 저장소 생성 (지정하지 않거나 "off"면 사용하지 않음)"""
+    path = env_str("CHARACTER_STORE_PATH", "off")
+    if not path or path.lower() == "off":
+        return None
+    return CharacterStore(path)
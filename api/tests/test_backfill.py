@@ -0,0 +1,65 @@
+import asyncio
+from datetime import timedelta
+from types import SimpleNamespace
+from typing import NamedTuple, Optional
+
+from api.backfill import EARLIEST_DATE, BackfillJob, run_backfill
+
+
+class _Response(NamedTuple):
+    date: Optional[str]
+
+
+class _FakeAPI:
+    def __init__(self):
+        self.active = 0
+        self.max_active = 0
+        self.max_tasks = 0
+
+    async def get_character_ocid(self, character_name, priority):
+        return SimpleNamespace(ocid=f"ocid-{character_name}")
+
+    async def _fetch(self, day):
+        self.active += 1
+        self.max_active = max(self.max_active, self.active)
+        self.max_tasks = max(self.max_tasks, len(asyncio.all_tasks()))
+        await asyncio.sleep(0)
+        self.active -= 1
+        return _Response(day.isoformat())
+
+    async def get_character_basic(self, ocid, priority, day):
+        return await self._fetch(day)
+
+    async def get_character_symbol_equipment(self, ocid, priority, day):
+        return await self._fetch(day)
+
+    async def get_character_stat(self, ocid, priority, day):
+        return await self._fetch(day)
+
+
+class _FakeStore:
+    def __init__(self, existing=()):
+        self.existing = set(existing)
+        self.saved = []
+
+    def existing_dates(self, ocid, start, end):
+        return self.existing
+
+    def upsert_many(self, batch):
+        self.saved.extend(batch)
+
+
+def test_long_backfill_runs_through_bounded_workers():
+    start = EARLIEST_DATE
+    job = BackfillJob(["a", "b"], start, start + timedelta(days=199))
+    api = _FakeAPI()
+    store = _FakeStore(existing={start.isoformat()})
+
+    asyncio.run(run_backfill(api, store, job, concurrency=4, batch_size=50))
+
+    assert job.state == "done"
+    assert job.skipped == 2
+    assert job.fetched == len(store.saved) == 398
+    # 작업자 4개 x 하위 호출 3개 + 실행 중인 메인 태스크
+    assert api.max_active <= 12
+    assert api.max_tasks <= 4 * 4 + 1
@@ -0,0 +1,121 @@
+import os
+import time
+
+from api.cache import CacheManager, LRUCache, OcidCache
+
+
+def disk_usage(cache: CacheManager) -> int:
+    return sum(path.stat().st_size for path in cache.cache_dir.glob("*" + CacheManager.ENTRY_SUFFIX))
+
+
+def test_lru_evicts_least_recently_used():
+    cache = LRUCache(maxsize=2)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1
+    cache.set("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_lru_evicts_by_bytes_and_rejects_oversized_items():
+    cache = LRUCache(maxsize=100, max_bytes=10)
+    cache.set("a", 1, size=4)
+    cache.set("b", 2, size=4)
+    cache.set("c", 3, size=4)
+    assert cache.get("a") is None
+    assert cache.stats()["bytes"] == 8
+
+    cache.set("huge", 4, size=11)
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] == 8
+
+
+def test_lru_entries_expire_after_ttl():
+    cache = LRUCache(maxsize=10, ttl=0.05)
+    cache.set("default", 1)
+    cache.set("longer", 2, ttl=60)
+    time.sleep(0.1)
+
+    assert cache.get("default") is None
+    assert cache.get("longer") == 2
+
+
+def test_disk_tier_serves_and_promotes_after_memory_loss(tmp_path):
+    cache = CacheManager(cache_dir=str(tmp_path), enabled=True)
+    cache.set("/character/basic?ocid=a", {"character_name": "a"})
+    cache._memory.clear()
+
+    assert cache.get("/character/basic?ocid=a") == {"character_name": "a"}
+    assert cache._memory.get("/character/basic?ocid=a") == {"character_name": "a"}
+
+
+def test_disk_entries_expire_after_ttl(tmp_path):
+    cache = CacheManager(cache_dir=str(tmp_path), enabled=True)
+    cache.set("key", {"value": 1}, ttl=0.05)
+    cache._memory.clear()
+    time.sleep(0.1)
+
+    assert cache.get("key") is None
+    assert disk_usage(cache) == 0
+
+
+def test_disk_byte_accounting_matches_files(tmp_path):
+    cache = CacheManager(cache_dir=str(tmp_path), enabled=True)
+    for i in range(5):
+        cache.set(f"key{i}", {"value": "x" * 100})
+    cache.set("key0", {"value": "y" * 50})
+
+    assert cache.stats()["disk_bytes"] == disk_usage(cache)
+
+
+def test_disk_eviction_removes_least_recently_used_files(tmp_path):
+    cache = CacheManager(cache_dir=str(tmp_path), enabled=True)
+    for i in range(4):
+        cache.set(f"key{i}", {"value": "x" * 100})
+        # 파일 수정 시각으로 LRU 순서를 정하므로 항목마다 시각을 다르게 둠
+        os.utime(cache._entry_path(f"key{i}"), (i, i))
+    cache.disk_max_bytes = disk_usage(cache)
+
+    cache.set("key4", {"value": "x" * 100})
+
+    assert disk_usage(cache) <= cache.disk_max_bytes * 0.9
+    assert not cache._entry_path("key0").exists()
+    assert cache._entry_path("key4").exists()
+    assert cache.stats()["disk_bytes"] == disk_usage(cache)
+
+
+def test_ocid_negative_entries_expire_after_negative_ttl():
+    cache = OcidCache(negative_ttl=0.05)
+    missing = {"error": {"name": "OPENAPI00004", "message": "Please input valid parameter"}}
+    cache.set_missing("없는캐릭터", missing)
+    assert cache.get("없는캐릭터") == missing
+
+    time.sleep(0.1)
+    assert cache.get("없는캐릭터") is None
+
+
+def test_ocid_cache_persists_across_restarts(tmp_path):
+    path = tmp_path / "ocid.jsonl"
+    cache = OcidCache(persist_path=str(path))
+    cache.set("캐릭터", {"ocid": "first"})
+    cache.set("캐릭터", {"ocid": "second"})
+    cache.set_missing("없는캐릭터", {"error": {"name": "OPENAPI00004"}})
+
+    restored = OcidCache(persist_path=str(path))
+
+    assert restored.get("캐릭터") == {"ocid": "second"}
+    assert restored.get("없는캐릭터") is None
+    # 다시 읽을 때 중복 항목을 정리해 다시 기록
+    assert len(path.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_ocid_cache_drops_expired_persisted_entries(tmp_path):
+    path = tmp_path / "ocid.jsonl"
+    OcidCache(ttl=0.05, persist_path=str(path)).set("캐릭터", {"ocid": "expired"})
+    time.sleep(0.1)
+
+    assert OcidCache(persist_path=str(path)).get("캐릭터") is None
+    assert path.read_text(encoding="utf-8") == ""
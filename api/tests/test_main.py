@@ -0,0 +1,57 @@
+import inspect
+
+import pytest
+from fastapi.testclient import TestClient
+
+from api import main
+from api.main import app
+
+client = TestClient(app)
+
+SIMULATE_REQUEST = {
+    "force_type": "Arcane",
+    "char_level": 260,
+    "current_force": 0,
+    "symbol_levels": [1, 1, 1, 1, 1, 1],
+    "force_goal": 600
+}
+
+
+@pytest.mark.parametrize("field, values", [
+    ("growth_counts", [0, 0, -5, 0, 0, 0]),
+    ("daily_symbols", [20, 20, -20, 20, 20, 20]),
+    ("daily_symbols", [20, 0, 20, 20, 20, 20])
+])
+def test_simulate_rejects_invalid_per_region_values(field, values):
+    response = client.post("/api/optimize/force/simulate", json={**SIMULATE_REQUEST, field: values})
+    assert response.status_code == 422
+
+
+def test_simulate_accepts_valid_per_region_values():
+    response = client.post("/api/optimize/force/simulate", json={
+        **SIMULATE_REQUEST, "growth_counts": [0] * 6, "daily_symbols": [20] * 6
+    })
+    assert response.status_code == 200
+
+
+@pytest.mark.parametrize("handler", [
+    main.optimize_force, main.optimize_force_batch, main.get_force_frontier,
+    main.optimize_force_budget, main.optimize_force_joint, main.simulate_force
+])
+def test_cpu_bound_optimize_handlers_run_in_threadpool(handler):
+    # 동기 함수로 선언된 엔드포인트는 스레드 풀에서 실행되어 이벤트 루프를 막지 않음
+    assert not inspect.iscoroutinefunction(handler)
+
+
+def test_batch_reports_invalid_items_in_place():
+    valid = {"force_type": "Arcane", "force_goal": 900, "char_level": 260, "current_force": 400,
+             "symbol_levels": [3, 0, 7, 12, 1, 0], "solver": "exact"}
+    response = client.post("/api/optimize/force/batch", json={"requests": [
+        valid, {**valid, "symbol_levels": [1, 2]}, {**valid, "solver": "greedy"}
+    ]})
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [item["index"] for item in results] == [0, 1, 2]
+    assert results[0]["result"]["total_cost"] <= results[2]["result"]["total_cost"]
+    assert results[1]["result"] is None and results[1]["error"]
@@ -0,0 +1,42 @@
+import asyncio
+
+import pytest
+
+from api.cache import CacheManager, OcidCache
+from api.maple import AsyncMapleStoryAPI
+from api.ratelimit import RateLimiter
+
+
+def create_api(**kwargs) -> AsyncMapleStoryAPI:
+    return AsyncMapleStoryAPI(api_key="test", ocid_cache=OcidCache(), cache=CacheManager(cache_dir=None, enabled=False),
+                              rate_limiter=RateLimiter(rate=1000), **kwargs)
+
+
+@pytest.mark.parametrize("cancel_after", [0.001, 0.05])
+def test_cancelled_hedged_send_cancels_upstream_requests(cancel_after):
+    async def scenario():
+        api = create_api(hedge=True)
+        api.latency.percentile = lambda endpoint, percentile: 0.01
+        started, cancelled = [], []
+
+        async def hanging_get(url, endpoint):
+            started.append(url)
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                cancelled.append(url)
+                raise
+
+        api._timed_get = hanging_get
+        # cancel_after 0.001: 헤지 전 대기 중 취소, 0.05: 헤지 요청까지 보낸 뒤 취소
+        task = asyncio.ensure_future(api._send("https://upstream/test", "/test"))
+        await asyncio.sleep(cancel_after)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+        await asyncio.sleep(0)
+        await api.aclose()
+        return started, cancelled
+
+    started, cancelled = asyncio.run(scenario())
+    assert started and len(cancelled) == len(started)
@@ -0,0 +1,72 @@
+import asyncio
+import threading
+
+import pytest
+
+from api.ratelimit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE, RateLimiter, _Waiter
+
+
+@pytest.fixture
+def limiter():
+    limiter = RateLimiter(rate=10.0, burst=1)
+    yield limiter
+    limiter.close()
+
+
+def wait_for_queue_depth(limiter, depth):
+    for _ in range(200):
+        if limiter.stats()["queue_depth"] == depth:
+            return
+        threading.Event().wait(0.005)
+    raise AssertionError(f"queue depth never reached {depth}")
+
+
+def test_closed_loop_waiter_does_not_stall_dispatcher(limiter):
+    assert limiter.try_acquire()
+
+    # 태스크 없이 닫힌 루프의 퓨처만 대기열에 넣어 루프 종료 후 배분 상황을 재현
+    loop = asyncio.new_event_loop()
+    with limiter._cond:
+        limiter._enqueue(PRIORITY_INTERACTIVE, _Waiter(future=loop.create_future(), loop=loop))
+    loop.close()
+
+    done = threading.Event()
+
+    def acquire():
+        limiter.acquire()
+        done.set()
+
+    threading.Thread(target=acquire, daemon=True).start()
+    assert done.wait(2.0)
+    assert limiter._thread.is_alive()
+
+
+def test_interactive_waiters_are_dispatched_before_background(limiter):
+    limiter.pause(0.2)
+    order = []
+
+    def acquire(name, priority):
+        limiter.acquire(priority)
+        order.append(name)
+
+    threads = [threading.Thread(target=acquire, args=("background", PRIORITY_BACKGROUND)),
+               threading.Thread(target=acquire, args=("interactive", PRIORITY_INTERACTIVE))]
+    for depth, thread in enumerate(threads, start=1):
+        thread.start()
+        wait_for_queue_depth(limiter, depth)
+    for thread in threads:
+        thread.join(2.0)
+
+    assert order == ["interactive", "background"]
+
+
+def test_close_stops_dispatcher(limiter):
+    limiter.pause(0.05)
+    threading.Thread(target=limiter.acquire, daemon=True).start()
+    wait_for_queue_depth(limiter, 1)
+
+    limiter.close()
+
+    assert not limiter._thread.is_alive()
+    with pytest.raises(RuntimeError):
+        limiter.acquire()
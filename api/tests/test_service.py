@@ -0,0 +1,378 @@
+import asyncio
+import itertools
+import sqlite3
+import time
+
+import pytest
+
+from api.ratelimit import PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE
+from api.service import CHARACTER_SNAPSHOT_FRESH, ForceFrontier, MapleService
+from api.simulator import symbol_force
+
+# (포스 타입, 캐릭터 레벨, 심볼 레벨) - 전수 탐색이 가능하도록 해금 지역과 남은 레벨이 적은 상태
+SMALL_STATES = [
+    ("Arcane", 220, [15, 16, 17, 0, 0, 0]),
+    ("Arcane", 210, [0, 14, 0, 0, 0, 0]),
+    ("Authentic", 270, [5, 6, 0, 0, 0, 0, 0]),
+]
+
+
+def brute_force_plans(service, force_type, char_level, symbol_levels):
+    """해금 지역의 모든 도달 레벨 조합별 (심볼 포스, 비용)"""
+    table = service.cost_tables[force_type]
+    avail_regions = service._get_available_regions(force_type, char_level)
+    choices = [range(level, table.max_level + 1) if avail else [level]
+               for level, avail in zip(symbol_levels, avail_regions)]
+    for levels in itertools.product(*choices):
+        force = sum(symbol_force(force_type, level) for level in levels)
+        cost = sum(table.range_cost(i, start, end) for i, (start, end) in enumerate(zip(symbol_levels, levels)))
+        yield force, cost
+
+
+def brute_force_min_cost(service, force_type, char_level, symbol_levels, symbol_goal):
+    return min(cost for force, cost in brute_force_plans(service, force_type, char_level, symbol_levels)
+               if force >= symbol_goal)
+
+
+def symbol_force_of(force_type, symbol_levels):
+    return sum(symbol_force(force_type, level) for level in symbol_levels)
+
+
+class _BrokenStore:
+    def find_latest(self, character_name):
+        raise sqlite3.DatabaseError("database disk image is malformed")
+
+
+def test_history_store_error_disables_store():
+    service = MapleService()
+    service.store = _BrokenStore()
+
+    with pytest.raises(ValueError):
+        service.get_character_history("테스트")
+    assert service.store is None
+
+
+def test_stale_stored_snapshot_schedules_refresh(monkeypatch):
+    service = MapleService()
+    stale = (time.time() - CHARACTER_SNAPSHOT_FRESH - 60, {"character_name": "테스트"})
+    scheduled = []
+    monkeypatch.setattr(service, "_read_stored_snapshot", lambda name: stale)
+    monkeypatch.setattr(service, "_aschedule_refresh", scheduled.append)
+
+    assert asyncio.run(service.aget_character_symbol_info("테스트"))["snapshot"]["stale"]
+    assert scheduled == ["테스트"]
+
+
+def test_interactive_miss_does_not_wait_for_background_refresh(monkeypatch):
+    service = MapleService()
+    stale = (time.time() - CHARACTER_SNAPSHOT_FRESH - 60, {"character_name": "테스트"})
+    priorities = []
+
+    async def fetch(character_name, priority):
+        priorities.append(priority)
+        if priority == PRIORITY_BACKGROUND:
+            await asyncio.Event().wait()
+        return {"character_name": character_name}
+
+    monkeypatch.setattr(service, "_read_stored_snapshot", lambda name: None)
+    monkeypatch.setattr(service, "_afetch_character_symbol_info", fetch)
+
+    async def scenario():
+        service._snapshots.set("테스트", stale)
+        assert (await service.aget_character_symbol_info("테스트"))["snapshot"]["stale"]
+        await asyncio.sleep(0)
+        # 갱신이 진행 중인 사이 스냅샷이 밀려나도 대화형 조회는 갱신을 기다리지 않음
+        service._snapshots.clear()
+        result = await asyncio.wait_for(service.aget_character_symbol_info("테스트"), 1.0)
+        await service.aclose()
+        return result
+
+    assert not asyncio.run(scenario())["snapshot"]["stale"]
+    assert priorities == [PRIORITY_BACKGROUND, PRIORITY_INTERACTIVE]
+
+
+def test_background_refresh_runs_on_successive_event_loops(monkeypatch):
+    service = MapleService()
+    refreshed = []
+
+    async def refresh(character_name, priority):
+        refreshed.append(character_name)
+
+    monkeypatch.setattr(service, "_arefresh_snapshot", refresh)
+
+    asyncio.run(service._abackground_refresh("첫번째"))
+    asyncio.run(service._abackground_refresh("두번째"))
+
+    assert refreshed == ["첫번째", "두번째"]
+
+
+@pytest.mark.parametrize("solver", ["greedy", "exact"])
+def test_goal_already_met_needs_no_upgrades(solver):
+    service = MapleService()
+    symbol_levels = [0, 0, 0, 0, 0, 0]
+
+    result = service.optimize_force("Arcane", 100, 260, 150, symbol_levels, solver=solver)
+
+    assert result["upgrade_path"] == []
+    assert result["total_cost"] == 0
+    assert result["optimized_levels"] == symbol_levels
+
+
+@pytest.mark.parametrize("force_type,char_level,symbol_levels", SMALL_STATES)
+def test_exact_solver_matches_brute_force(force_type, char_level, symbol_levels):
+    service = MapleService()
+    # 심볼 외 포스를 더해도 목표 비교는 심볼 포스 기준으로 이루어져야 함
+    non_symbol_force = 30
+    current_force = non_symbol_force + symbol_force_of(force_type, symbol_levels)
+    reachable = max(force for force, _ in brute_force_plans(service, force_type, char_level, symbol_levels))
+
+    for symbol_goal in range(symbol_force_of(force_type, symbol_levels), reachable + 1, 10):
+        result = service.optimize_force(force_type, non_symbol_force + symbol_goal, char_level, current_force,
+                                        symbol_levels, solver="exact")
+
+        assert result["total_cost"] == brute_force_min_cost(service, force_type, char_level, symbol_levels,
+                                                            symbol_goal)
+        assert symbol_force_of(force_type, result["optimized_levels"]) >= symbol_goal
+
+
+@pytest.mark.parametrize("force_type,char_level,symbol_levels", SMALL_STATES + [
+    ("Arcane", 260, [3, 0, 7, 12, 1, 0]),
+    ("Authentic", 290, [2, 0, 4, 1, 0, 0, 0]),
+])
+@pytest.mark.parametrize("solver", ["greedy", "exact"])
+def test_upgrade_path_adds_up_to_total_cost(force_type, char_level, symbol_levels, solver):
+    service = MapleService()
+    current_force = symbol_force_of(force_type, symbol_levels)
+
+    for extra in (10, 120, 400, 10 ** 6):
+        result = service.optimize_force(force_type, current_force + extra, char_level, current_force,
+                                        symbol_levels, solver=solver)
+        path = result["upgrade_path"]
+
+        assert sum(step["cost"] for step in path) == result["total_cost"]
+        final_force = path[-1]["force"] if path else current_force
+        assert final_force == symbol_force_of(force_type, result["optimized_levels"])
+
+
+@pytest.mark.parametrize("force_type,char_level,symbol_levels", SMALL_STATES + [
+    ("Arcane", 260, [3, 0, 7, 12, 1, 0]),
+    ("Authentic", 290, [2, 0, 4, 1, 0, 0, 0]),
+])
+def test_exact_solver_is_never_costlier_than_greedy(force_type, char_level, symbol_levels):
+    service = MapleService()
+    current_force = symbol_force_of(force_type, symbol_levels)
+
+    for extra in range(10, 1000, 30):
+        goal = current_force + extra
+        greedy = service.optimize_force(force_type, goal, char_level, current_force, symbol_levels)
+        exact = service.optimize_force(force_type, goal, char_level, current_force, symbol_levels, solver="exact")
+
+        assert exact["total_cost"] <= greedy["total_cost"]
+        # 그리디가 목표에 도달했다면 exact도 도달해야 함
+        if symbol_force_of(force_type, greedy["optimized_levels"]) >= goal:
+            assert symbol_force_of(force_type, exact["optimized_levels"]) >= goal
+
+
+def test_frontier_lookups_at_boundaries():
+    frontier = ForceFrontier([0], [100, 130, 140, 150], [0, 0, 970000, 2200000], [[0], [1], [2], [3]])
+
+    assert frontier.find_goal(130) == 1
+    assert frontier.find_goal(131) == 2
+    assert frontier.find_goal(150) == 3
+    # 도달할 수 없는 목표는 마지막 지점
+    assert frontier.find_goal(10 ** 6) == 3
+
+    assert frontier.find_budget(970000) == 2
+    assert frontier.find_budget(969999) == 1
+    assert frontier.find_budget(10 ** 12) == 3
+
+
+@pytest.mark.parametrize("force_type,char_level,symbol_levels", SMALL_STATES)
+def test_frontier_is_pareto_optimal(force_type, char_level, symbol_levels):
+    service = MapleService()
+    frontier = service.get_force_frontier(force_type, char_level, symbol_levels)
+
+    assert frontier.forces == sorted(set(frontier.forces))
+    assert frontier.costs == sorted(frontier.costs)
+    assert frontier.forces[0] == symbol_force_of(force_type, symbol_levels)
+    for force, cost, levels in zip(frontier.forces, frontier.costs, frontier.levels):
+        assert symbol_force_of(force_type, levels) == force
+        assert cost == brute_force_min_cost(service, force_type, char_level, symbol_levels, force)
+    # 모든 조합은 같은 포스 이상을 더 싸거나 같게 얻는 프론티어 지점에 지배됨
+    for force, cost in brute_force_plans(service, force_type, char_level, symbol_levels):
+        assert frontier.costs[frontier.find_goal(force)] <= cost
+
+
+def brute_force_max_force(service, force_type, char_level, symbol_levels, budget):
+    return max(force for force, cost in brute_force_plans(service, force_type, char_level, symbol_levels)
+               if cost <= budget)
+
+
+@pytest.mark.parametrize("force_type,char_level,symbol_levels", SMALL_STATES)
+def test_budget_optimizer_matches_brute_force(force_type, char_level, symbol_levels):
+    service = MapleService()
+    non_symbol_force = 30
+    current_force = non_symbol_force + symbol_force_of(force_type, symbol_levels)
+    frontier = service.get_force_frontier(force_type, char_level, symbol_levels)
+
+    for point_cost in frontier.costs:
+        # 프론티어 비용과 정확히 같은 예산과 1메소 모자란 예산
+        for budget in (point_cost, max(0, point_cost - 1)):
+            result = service.optimize_force_budget(force_type, budget, char_level, current_force, symbol_levels)
+
+            assert result["total_cost"] <= budget
+            assert result["remaining_budget"] == budget - result["total_cost"]
+            assert result["achieved_force"] - non_symbol_force == brute_force_max_force(
+                service, force_type, char_level, symbol_levels, budget)
+            assert sum(step["cost"] for step in result["upgrade_path"]) == result["total_cost"]
+
+
+def test_budget_below_cheapest_step_keeps_current_levels():
+    service = MapleService()
+    symbol_levels = [5, 5, 5, 5, 5, 5]
+    table = service.cost_tables["Arcane"]
+    cheapest = min(table.step_cost(i, 5) for i in range(len(symbol_levels)))
+    current_force = symbol_force_of("Arcane", symbol_levels)
+
+    result = service.optimize_force_budget("Arcane", cheapest - 1, 260, current_force, symbol_levels)
+
+    assert result["optimized_levels"] == symbol_levels
+    assert result["upgrade_path"] == []
+    assert result["achieved_force"] == current_force
+    assert result["remaining_budget"] == cheapest - 1
+
+
+def test_budget_beyond_max_levels_stops_at_max():
+    service = MapleService()
+    symbol_levels = [18, 19, 20, 0, 0, 0]
+
+    result = service.optimize_force_budget("Arcane", 10 ** 12, 220, 0, symbol_levels)
+
+    assert result["optimized_levels"] == [20, 20, 20, 0, 0, 0]
+    assert result["remaining_budget"] == 10 ** 12 - result["total_cost"]
+
+
+def test_negative_budget_is_rejected():
+    with pytest.raises(ValueError):
+        MapleService().optimize_force_budget("Arcane", -1, 260, 0, [0] * 6)
+
+
+# 캐릭터 레벨 270에서 남은 레벨이 적은 아케인/어센틱 상태
+JOINT_LEVEL = 270
+JOINT_ARCANE_LEVELS = [18, 19, 20, 17, 20, 20]
+JOINT_AUTHENTIC_LEVELS = [9, 10, 11, 0, 0, 0, 0]
+
+
+def joint_states(arcane_goal=0, authentic_goal=0):
+    return (
+        {"current_force": symbol_force_of("Arcane", JOINT_ARCANE_LEVELS),
+         "symbol_levels": JOINT_ARCANE_LEVELS, "force_goal": arcane_goal},
+        {"current_force": symbol_force_of("Authentic", JOINT_AUTHENTIC_LEVELS),
+         "symbol_levels": JOINT_AUTHENTIC_LEVELS, "force_goal": authentic_goal},
+    )
+
+
+def brute_force_splits(service):
+    """(아케인 포스, 어센틱 포스, 합계 비용) 전체 조합"""
+    arcane = list(brute_force_plans(service, "Arcane", JOINT_LEVEL, JOINT_ARCANE_LEVELS))
+    authentic = list(brute_force_plans(service, "Authentic", JOINT_LEVEL, JOINT_AUTHENTIC_LEVELS))
+    for (arcane_force, arcane_cost), (authentic_force, authentic_cost) in itertools.product(arcane, authentic):
+        yield arcane_force, authentic_force, arcane_cost + authentic_cost
+
+
+def test_joint_min_cost_matches_brute_force_split():
+    service = MapleService()
+    arcane, authentic = joint_states(1290, 320)
+
+    result = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic)
+
+    expected = min(cost for arcane_force, authentic_force, cost in brute_force_splits(service)
+                   if arcane_force >= 1290 and authentic_force >= 320)
+    assert result["total_cost"] == expected
+    assert result["arcane"]["goal_reached"] and result["authentic"]["goal_reached"]
+    assert result["remaining_budget"] is None
+
+
+def test_joint_max_force_matches_brute_force_split():
+    service = MapleService()
+    arcane, authentic = joint_states(1290, 320)
+    splits = list(brute_force_splits(service))
+    min_cost = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic)["total_cost"]
+
+    for budget in sorted({cost for _, _, cost in splits}):
+        result = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic, budget=budget, mode="max_force")
+        achieved = result["arcane"]["achieved_force"] + result["authentic"]["achieved_force"]
+
+        # 예산으로 목표를 만족할 수 있으면 목표를 만족하는 조합 중, 아니면 전체 조합 중 최대 포스
+        feasible = [(a, b) for a, b, cost in splits if cost <= budget and a >= 1290 and b >= 320]
+        if budget < min_cost:
+            feasible = [(a, b) for a, b, cost in splits if cost <= budget]
+        assert result["within_budget"] == (budget >= min_cost)
+        assert achieved == max(a + b for a, b in feasible)
+        assert result["total_cost"] <= budget
+        assert result["remaining_budget"] == budget - result["total_cost"]
+
+
+def test_joint_budget_boundary():
+    service = MapleService()
+    arcane, authentic = joint_states(1290, 320)
+    min_cost = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic)["total_cost"]
+
+    exact = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic, budget=min_cost)
+    short = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic, budget=min_cost - 1)
+
+    assert exact["within_budget"] and exact["remaining_budget"] == 0
+    assert not short["within_budget"]
+
+
+def test_joint_unreachable_goal_maxes_out_symbols():
+    service = MapleService()
+    arcane, authentic = joint_states(10 ** 4, 10 ** 4)
+
+    result = service.optimize_force_joint(JOINT_LEVEL, arcane, authentic)
+
+    assert result["arcane"]["optimized_levels"] == [20] * 6
+    assert result["authentic"]["optimized_levels"] == [11, 11, 11, 0, 0, 0, 0]
+    assert not result["arcane"]["goal_reached"]
+    assert not result["authentic"]["goal_reached"]
+
+
+BATCH_REQUESTS = [
+    {"force_type": "Arcane", "force_goal": goal, "char_level": 260, "current_force": 400,
+     "symbol_levels": [3, 0, 7, 12, 1, 0], "solver": solver}
+    for goal in (300, 620, 900, 1320, 5000) for solver in ("greedy", "exact")
+] + [
+    {"force_type": "Authentic", "force_goal": goal, "char_level": 290, "current_force": 100,
+     "symbol_levels": [2, 0, 4, 1, 0, 0, 0], "solver": "greedy"}
+    for goal in (150, 160, 400)
+]
+
+
+def test_batch_matches_individual_results():
+    requests = BATCH_REQUESTS + [dict(BATCH_REQUESTS[0], force_type="Unknown")]
+
+    results = MapleService().optimize_force_batch(requests)
+
+    single = MapleService()
+    assert [item["index"] for item in results] == list(range(len(requests)))
+    for request, item in zip(BATCH_REQUESTS, results):
+        assert item["error"] is None
+        assert item["result"] == single.optimize_force(**request)
+    assert results[-1]["result"] is None and results[-1]["error"]
+
+
+def test_batch_computes_each_start_state_once(monkeypatch):
+    service = MapleService()
+    greedy_runs, frontier_builds = [], []
+    greedy_path = service._greedy_upgrade_path
+    build_frontier = service._build_force_frontier
+    monkeypatch.setattr(service, "_greedy_upgrade_path",
+                        lambda *args: greedy_runs.append(args) or greedy_path(*args))
+    monkeypatch.setattr(service, "_build_force_frontier",
+                        lambda *args: frontier_builds.append(args) or build_frontier(*args))
+
+    service.optimize_force_batch(BATCH_REQUESTS)
+
+    # 아케인 greedy / 어센틱 greedy 묶음마다 한 번, 아케인 exact 프론티어 한 번
+    assert len(greedy_runs) == 2
+    assert len(frontier_builds) == 1
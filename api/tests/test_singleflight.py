@@ -0,0 +1,128 @@
+import asyncio
+import threading
+
+import pytest
+
+from api.singleflight import AsyncSingleFlight, SingleFlight
+
+
+def test_concurrent_calls_share_one_execution():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    calls, results = [], []
+
+    def load():
+        calls.append(1)
+        started.set()
+        release.wait(2.0)
+        return {"value": 1}
+
+    def worker():
+        results.append(flight.do("key", load))
+
+    threads = [threading.Thread(target=worker) for _ in range(5)]
+    threads[0].start()
+    assert started.wait(2.0)
+    for thread in threads[1:]:
+        thread.start()
+    # 후속 호출이 모두 대기 상태에 들어갈 시간을 줌
+    threading.Event().wait(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2.0)
+
+    assert len(calls) == 1
+    assert len(results) == 5
+    assert all(result is results[0] for result in results)
+    assert flight.in_flight() == 0
+
+
+def test_exception_is_raised_to_every_waiter():
+    flight = SingleFlight()
+    started, release = threading.Event(), threading.Event()
+    errors = []
+
+    def load():
+        started.set()
+        release.wait(2.0)
+        raise RuntimeError("boom")
+
+    def worker():
+        try:
+            flight.do("key", load)
+        except RuntimeError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(3)]
+    threads[0].start()
+    assert started.wait(2.0)
+    for thread in threads[1:]:
+        thread.start()
+    threading.Event().wait(0.05)
+    release.set()
+    for thread in threads:
+        thread.join(2.0)
+
+    assert len(errors) == 3
+    assert flight.in_flight() == 0
+    assert flight.do("key", lambda: "retry") == "retry"
+
+
+def test_async_concurrent_calls_share_one_execution():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def load(value):
+        calls.append(value)
+        await asyncio.sleep(0.01)
+        return {"value": value}
+
+    async def scenario():
+        results = await asyncio.gather(*(flight.do("key", load, i) for i in range(5)))
+        other = await flight.do("other", load, 9)
+        return results, other
+
+    results, other = asyncio.run(scenario())
+
+    assert calls == [0, 9]
+    assert all(result is results[0] for result in results)
+    assert other == {"value": 9}
+    assert flight.in_flight() == 0
+
+
+def test_async_exception_is_raised_to_every_waiter():
+    flight = AsyncSingleFlight()
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        raise RuntimeError("boom")
+
+    async def scenario():
+        return await asyncio.gather(*(flight.do("key", load) for _ in range(3)), return_exceptions=True)
+
+    errors = asyncio.run(scenario())
+
+    assert len(calls) == 1
+    assert all(isinstance(error, RuntimeError) for error in errors)
+    assert flight.in_flight() == 0
+
+
+def test_async_cancelled_waiter_does_not_cancel_shared_task():
+    flight = AsyncSingleFlight()
+
+    async def load():
+        await asyncio.sleep(0.02)
+        return "done"
+
+    async def scenario():
+        first = asyncio.ensure_future(flight.do("key", load))
+        second = asyncio.ensure_future(flight.do("key", load))
+        await asyncio.sleep(0)
+        first.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await first
+        return await second
+
+    assert asyncio.run(scenario()) == "done"